@@ -5,16 +5,22 @@
 """
 
 from fastapi import APIRouter, HTTPException, Path, Query
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from pathlib import Path as PathLib
 import os
+import json
+import asyncio
 import mimetypes
 import zipfile
 import io
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 import urllib.parse
 
 from core.config import settings
+from core.file_manifest import file_manifest
+from core.record_store import record_store
+from core.storage_janitor import storage_janitor
+from api.search import search_system
 
 router = APIRouter()
 
@@ -30,6 +36,16 @@ MIME_TYPES = {
     '.zip': 'application/zip'
 }
 
+# ZIP 내보내기 시 재압축하지 않을 형식 (이미 압축된 파일)
+STORED_EXTENSIONS = {'.hwpx', '.zip', '.pdf', '.docx', '.xlsx', '.pptx', '.jpg', '.jpeg', '.png', '.gif', '.7z', '.gz'}
+
+def materialize_record_json(bid_no: str) -> Optional[bytes]:
+    """세그먼트 저장소의 공고 레코드를 기존 파일과 같은 형식(indent=4)의 JSON으로"""
+    record = record_store.get(bid_no)
+    if record is None:
+        return None
+    return json.dumps(record, ensure_ascii=False, indent=4).encode('utf-8')
+
 def get_safe_path(base_dir: PathLib, filename: str) -> PathLib:
     """안전한 파일 경로 생성 (경로 트래버설 방지)"""
     # 파일명에서 위험한 문자 제거
@@ -49,6 +65,59 @@ def get_safe_path(base_dir: PathLib, filename: str) -> PathLib:
     
     return file_path
 
+class ZipStreamBuffer(io.RawIOBase):
+    """ZIP 스트리밍용 쓰기 전용 버퍼 (seek 불가 → zipfile이 data descriptor 방식으로 기록)"""
+    
+    def __init__(self):
+        self._chunks = []
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+    
+    def pop(self) -> bytes:
+        """지금까지 기록된 데이터 반환 후 비우기"""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+def iter_zip_stream(entries: List[Tuple[PathLib, str]]) -> Iterator[bytes]:
+    """파일을 읽는 대로 ZIP 바이트를 내보내는 제너레이터 (메모리 사용량 = 청크 크기)"""
+    buffer = ZipStreamBuffer()
+    with zipfile.ZipFile(buffer, 'w') as zip_file:
+        for file_path, arcname in entries:
+            try:
+                zip_info = zipfile.ZipInfo.from_file(file_path, arcname)
+            except OSError as e:
+                print(f"ZIP 항목 추가 실패: {file_path} - {e}")
+                continue
+            
+            # 이미 압축된 형식은 무압축 저장
+            if file_path.suffix.lower() in STORED_EXTENSIONS:
+                zip_info.compress_type = zipfile.ZIP_STORED
+            else:
+                zip_info.compress_type = zipfile.ZIP_DEFLATED
+            
+            with open(file_path, 'rb') as src, zip_file.open(zip_info, 'w') as dest:
+                while True:
+                    chunk = src.read(settings.DOWNLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    dest.write(chunk)
+                    data = buffer.pop()
+                    if data:
+                        yield data
+            
+            data = buffer.pop()
+            if data:
+                yield data
+    
+    # 중앙 디렉토리
+    yield buffer.pop()
+
 def get_content_type(file_path: PathLib) -> str:
     """파일 확장자에 따른 Content-Type 반환"""
     extension = file_path.suffix.lower()
@@ -88,6 +157,9 @@ async def download_attachment(
             encoded_filename = urllib.parse.quote(filename.encode('utf-8'))
             headers["Content-Disposition"] = f"attachment; filename*=UTF-8''{encoded_filename}"
         
+        # 접근 시각 기록 (저장 공간 정리 시 LRU 기준)
+        await asyncio.to_thread(file_manifest.touch, [file_path])
+        
         return FileResponse(
             path=str(file_path),
             media_type=content_type,
@@ -111,9 +183,23 @@ async def download_json(
         
         file_path = get_safe_path(settings.downloads_json_dir, filename)
         
+        # 세그먼트 저장소에 있으면 해당 레코드만 읽어 응답
+        content = await asyncio.to_thread(materialize_record_json, file_path.name[:-len('.json')])
+        if content is not None:
+            return Response(
+                content=content,
+                media_type='application/json',
+                headers={
+                    "Content-Disposition": f"attachment; filename={file_path.name}"
+                }
+            )
+        
+        # 이전 방식으로 저장된 공고별 파일
         if not file_path.exists():
             raise HTTPException(status_code=404, detail="JSON 파일을 찾을 수 없습니다")
         
+        await asyncio.to_thread(file_manifest.touch, [file_path])
+        
         return FileResponse(
             path=str(file_path),
             media_type='application/json',
@@ -141,6 +227,8 @@ async def download_report(
         if not file_path.exists():
             raise HTTPException(status_code=404, detail="보고서를 찾을 수 없습니다")
         
+        await asyncio.to_thread(file_manifest.touch, [file_path])
+        
         return FileResponse(
             path=str(file_path),
             media_type='application/json',
@@ -156,56 +244,42 @@ async def download_report(
 
 @router.get("/search-results/{search_id}")
 async def download_search_results_zip(search_id: str):
-    """특정 검색 결과의 모든 파일을 ZIP으로 다운로드"""
+    """특정 검색 결과의 모든 파일을 ZIP으로 다운로드 (스트리밍)"""
     try:
-        # 메모리에 ZIP 파일 생성
-        zip_buffer = io.BytesIO()
+        entries = []
         
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            file_count = 0
-            
-            # JSON 파일들 추가
-            for json_file in settings.downloads_json_dir.glob("*.json"):
-                if search_id in json_file.name:
-                    zip_file.write(json_file, f"json/{json_file.name}")
-                    file_count += 1
-            
-            # 보고서 파일 추가
-            for report_file in settings.downloads_reports_dir.glob("*.json"):
-                if search_id in report_file.name:
-                    zip_file.write(report_file, f"reports/{report_file.name}")
-                    file_count += 1
-            
-            # 첨부파일들 추가 (크기 제한 적용)
+        # JSON/보고서 파일 추가 (파일 목록 색인에서 검색 ID로 조회)
+        for file_type, folder in (("json", "json"), ("report", "reports")):
+            for file_info in await asyncio.to_thread(file_manifest.list_files, file_type, search_id):
+                entries.append((file_manifest.absolute_path(file_info["path"]), f"{folder}/{file_info['filename']}"))
+        
+        # 해당 검색의 디렉토리에 있는 첨부파일만 추가 (크기 제한 적용)
+        result = await search_system.get_search_result(search_id)
+        search_dir = PathLib(result["search_dir"]) if result and result.get("search_dir") else None
+        if search_dir and search_dir.is_dir():
             total_size = 0
             max_total_size = 500 * 1024 * 1024  # 500MB 제한
             
-            for attachment_file in settings.downloads_attachments_dir.iterdir():
-                if attachment_file.is_file():
-                    file_size = attachment_file.stat().st_size
-                    
-                    if total_size + file_size > max_total_size:
-                        continue  # 크기 제한 초과 시 스킵
-                    
-                    zip_file.write(attachment_file, f"attachments/{attachment_file.name}")
-                    total_size += file_size
-                    file_count += 1
-        
-        if file_count == 0:
-            raise HTTPException(status_code=404, detail="다운로드할 파일이 없습니다")
+            for entry in sorted(os.scandir(search_dir), key=lambda e: e.name):
+                # 다운로드/링크 중인 임시 파일 제외
+                if not entry.is_file() or entry.name.startswith('.') or entry.name.endswith('.part'):
+                    continue
+                
+                file_size = entry.stat().st_size
+                if total_size + file_size > max_total_size:
+                    continue  # 크기 제한 초과 시 스킵
+                
+                entries.append((PathLib(entry.path), f"attachments/{entry.name}"))
+                total_size += file_size
         
-        zip_buffer.seek(0)
+        if not entries:
+            raise HTTPException(status_code=404, detail="다운로드할 파일이 없습니다")
         
-        # 스트리밍 응답으로 ZIP 파일 전송
-        def generate():
-            while True:
-                chunk = zip_buffer.read(8192)
-                if not chunk:
-                    break
-                yield chunk
+        await asyncio.to_thread(file_manifest.touch, [path for path, _ in entries])
         
+        # 파일을 읽는 대로 ZIP 항목을 내보내는 스트리밍 응답 (스레드풀에서 실행)
         return StreamingResponse(
-            generate(),
+            iter_zip_stream(entries),
             media_type='application/zip',
             headers={
                 "Content-Disposition": f"attachment; filename=search_results_{search_id}.zip"
@@ -222,36 +296,23 @@ async def list_files(
     file_type: str = Path(..., description="파일 타입 (attachment/json/report)"),
     search_id: Optional[str] = Query(None, description="특정 검색 ID 필터")
 ):
-    """파일 목록 조회"""
+    """파일 목록 조회 (파일 목록 색인, 수정일 기준 내림차순)"""
     try:
-        if file_type == "attachment":
-            base_dir = settings.downloads_attachments_dir
-        elif file_type == "json":
-            base_dir = settings.downloads_json_dir
-        elif file_type == "report":
-            base_dir = settings.downloads_reports_dir
-        else:
+        if file_type not in ("attachment", "json", "report"):
             raise HTTPException(status_code=400, detail="유효하지 않은 파일 타입입니다")
         
-        files = []
-        
-        for file_path in base_dir.iterdir():
-            if file_path.is_file():
-                # 검색 ID 필터 적용
-                if search_id and search_id not in file_path.name:
-                    continue
-                
-                file_info = {
-                    "filename": file_path.name,
-                    "size": file_path.stat().st_size,
-                    "modified": file_path.stat().st_mtime,
-                    "type": file_path.suffix.lower(),
-                    "download_url": f"/api/download/{file_type}/{file_path.name}"
-                }
-                files.append(file_info)
-        
-        # 수정일 기준 내림차순 정렬
-        files.sort(key=lambda x: x["modified"], reverse=True)
+        files = [
+            {
+                "filename": file_info["filename"],
+                "size": file_info["size"],
+                "modified": file_info["modified"],
+                "type": PathLib(file_info["filename"]).suffix.lower(),
+                "search_id": file_info["search_id"],
+                "bid_ntce_no": file_info["bid_ntce_no"],
+                "download_url": f"/api/download/{file_type}/{file_info['filename']}"
+            }
+            for file_info in await asyncio.to_thread(file_manifest.list_files, file_type, search_id)
+        ]
         
         return {
             "file_type": file_type,
@@ -286,6 +347,7 @@ async def delete_file(
             raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
         
         file_path.unlink()
+        await asyncio.to_thread(file_manifest.remove, file_path)
         
         return {"message": f"파일이 삭제되었습니다: {filename}"}
         
@@ -296,28 +358,20 @@ async def delete_file(
 
 @router.get("/disk-usage")
 async def get_disk_usage():
-    """디스크 사용량 조회"""
+    """디스크 사용량 조회 (파일 목록 색인 집계)"""
     try:
-        def get_dir_size(path: PathLib) -> int:
-            total = 0
-            for file_path in path.rglob('*'):
-                if file_path.is_file():
-                    total += file_path.stat().st_size
-            return total
+        by_type = await asyncio.to_thread(file_manifest.usage)
         
         usage = {
-            "attachments": {
-                "size_bytes": get_dir_size(settings.downloads_attachments_dir),
-                "file_count": len(list(settings.downloads_attachments_dir.glob('*')))
-            },
+            "attachments": by_type["attachment"],
+            # 공고 JSON 세그먼트 포함
             "json": {
-                "size_bytes": get_dir_size(settings.downloads_json_dir),
-                "file_count": len(list(settings.downloads_json_dir.glob('*')))
+                "size_bytes": by_type["json"]["size_bytes"] + by_type["segment"]["size_bytes"],
+                "file_count": by_type["json"]["file_count"] + by_type["segment"]["file_count"]
             },
-            "reports": {
-                "size_bytes": get_dir_size(settings.downloads_reports_dir),
-                "file_count": len(list(settings.downloads_reports_dir.glob('*')))
-            }
+            "reports": by_type["report"],
+            # 검색별 디렉토리 (첨부파일은 blob 하드링크라 실제 사용량과 겹칠 수 있음)
+            "searches": by_type["search"]
         }
         
         # 총합 계산
@@ -345,30 +399,26 @@ async def cleanup_files(
         import time
         
         cutoff_time = time.time() - (older_than_days * 24 * 3600)
-        deleted_files = []
         
-        # 정리할 디렉토리 결정
-        if file_type == "attachment":
-            dirs_to_clean = [settings.downloads_attachments_dir]
-        elif file_type == "json":
-            dirs_to_clean = [settings.downloads_json_dir]
-        elif file_type == "report":
-            dirs_to_clean = [settings.downloads_reports_dir]
+        # 정리할 파일 종류 결정
+        if file_type in ("attachment", "json", "report"):
+            types_to_clean = [file_type]
         else:
-            dirs_to_clean = [
-                settings.downloads_attachments_dir,
-                settings.downloads_json_dir,
-                settings.downloads_reports_dir
-            ]
-        
-        for directory in dirs_to_clean:
-            for file_path in directory.iterdir():
-                if file_path.is_file() and file_path.stat().st_mtime < cutoff_time:
-                    try:
-                        file_path.unlink()
-                        deleted_files.append(str(file_path.name))
-                    except Exception as e:
-                        print(f"파일 삭제 실패: {file_path} - {e}")
+            types_to_clean = ["attachment", "json", "report"]
+        
+        def delete_old_files() -> List[str]:
+            deleted = []
+            for relative in file_manifest.older_than(types_to_clean, cutoff_time):
+                file_path = file_manifest.absolute_path(relative)
+                try:
+                    file_path.unlink(missing_ok=True)
+                    file_manifest.remove(file_path)
+                    deleted.append(file_path.name)
+                except Exception as e:
+                    print(f"파일 삭제 실패: {file_path} - {e}")
+            return deleted
+        
+        deleted_files = await asyncio.to_thread(delete_old_files)
         
         return {
             "message": f"{len(deleted_files)}개 파일이 삭제되었습니다",
@@ -377,4 +427,28 @@ async def cleanup_files(
         }
         
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"파일 정리 오류: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"파일 정리 오류: {str(e)}")
+
+
+@router.post("/manifest/reconcile")
+async def reconcile_manifest():
+    """파일 목록 색인을 실제 디렉토리와 맞춤 (누락 추가/변경 갱신/삭제 반영)"""
+    try:
+        result = await asyncio.to_thread(file_manifest.reconcile)
+        return {"success": True, **result}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"파일 목록 보정 오류: {str(e)}")
+
+@router.get("/janitor")
+async def get_janitor_stats():
+    """저장 공간 정리 통계 (삭제 파일 수/용량, 현재 사용량과 한도)"""
+    return await asyncio.to_thread(storage_janitor.get_stats)
+
+@router.post("/janitor/run")
+async def run_janitor():
+    """저장 공간 정리 즉시 실행 (진행 중인 검색 제외)"""
+    try:
+        result = await storage_janitor.run_once(search_system.running_searches)
+        return {"success": True, **result}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"저장 공간 정리 오류: {str(e)}")
@@ -4,7 +4,8 @@
 나라장터 입찰공고 검색 API
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
 import uuid
@@ -12,11 +13,17 @@ import asyncio
 from datetime import datetime
 
 from core.unified_g2b_v2 import UnifiedG2BSearch
+from core.http_pool import http_pool
+from core.job_manager import job_manager
+from core.progress_events import progress_broadcaster
+from core.json_codec import FastJSONResponse
+from core.result_view import paginate_results
+from core.storage_janitor import storage_janitor
 
 router = APIRouter()
 
-# 검색 시스템 인스턴스
-search_system = UnifiedG2BSearch()
+# 검색 시스템 인스턴스 (공유 커넥션 풀 주입)
+search_system = UnifiedG2BSearch(http_pool=http_pool)
 
 # 요청 모델
 class SearchRequest(BaseModel):
@@ -24,6 +31,9 @@ class SearchRequest(BaseModel):
     start_date: str = Field(..., pattern=r"^\d{8}$", description="시작날짜 (YYYYMMDD)")
     end_date: str = Field(..., pattern=r"^\d{8}$", description="종료날짜 (YYYYMMDD)")
     num_rows: Optional[int] = Field(100, ge=1, le=500, description="검색 결과 수")
+    all_pages: Optional[bool] = Field(False, description="totalCount 기준 전체 페이지 조회")
+    async_mode: Optional[bool] = Field(False, description="search_id를 즉시 반환하고 백그라운드에서 검색 실행")
+    incremental: Optional[bool] = Field(False, description="같은 조건의 이전 검색 이후 신규/정정 공고만 처리 (전체 페이지 조회)")
 
 @router.post("/search")
 async def search_endpoint(request: SearchRequest):
@@ -40,9 +50,29 @@ async def search_endpoint(request: SearchRequest):
             "inqryBgnDt": request.start_date,
             "inqryEndDt": request.end_date,
             "numOfRows": request.num_rows,
-            "pageNo": 1
+            "pageNo": 1,
+            "allPages": request.all_pages,
+            "incremental": request.incremental
         }
         
+        # 작업 모드: search_id를 즉시 반환하고 검색/다운로드는 백그라운드 작업으로 실행
+        if request.async_mode:
+            job_manager.submit(
+                search_id,
+                search_params,
+                lambda job: search_system.search_and_download(
+                    job.search_params, job.search_id, progress=job.progress
+                )
+            )
+            print(f"📨 검색 작업 등록: {search_id}")
+            return {
+                'success': True,
+                'search_id': search_id,
+                'status': 'pending',
+                'status_url': f"/api/search/status/{search_id}",
+                'results_url': f"/api/search/search/{search_id}/results"
+            }
+        
         # 검색 및 다운로드 실행
         result = await search_system.search_and_download(search_params, search_id)
         
@@ -55,35 +85,21 @@ async def search_endpoint(request: SearchRequest):
         
         print(f"✅ 검색 완료: {len(result.get('items', []))}개 공고")
         
-        processed_items = []
-        for item in result.get("items", []):
-            processed_item = {
-                "bidNtceNo": item.get("bidNtceNo", ""),
-                "bidNtceNm": item.get("bidNtceNm", ""),
-                "ntceInsttNm": item.get("ntceInsttNm", ""),
-                "bidNtceDt": search_system.format_date(item.get("bidNtceDt", "")),
-                "opengDt": search_system.format_date(item.get("opengDt", "")),
-                "asignBdgtAmt": search_system.format_currency(item.get("asignBdgtAmt", "")),
-                "presmptPrce": search_system.format_currency(item.get("presmptPrce", "")),
-                "cntrctCnclsMthdNm": item.get("cntrctCnclsMthdNm", ""),
-                "ntceKindNm": item.get("ntceKindNm", ""),
-                "bidNtceDtlUrl": item.get("bidNtceDtlUrl", ""),
-                "ntceInsttOfclNm": item.get("ntceInsttOfclNm", ""),
-                "ntceInsttOfclTelNo": item.get("ntceInsttOfclTelNo", ""),
-                "ntceInsttOfclEmailAdrs": item.get("ntceInsttOfclEmailAdrs", ""),
-                "attachments": [],
-                "original_data": item
-            }
-            processed_items.append(processed_item)
-        
-        return {
+        # 수집 시 만든 레코드를 그대로 직렬화 (original_data 포함 전체는 결과 조회 API의 fields= 로)
+        response = {
             'success': True,
             'search_id': search_id,
             'total_count': result.get("total_count", 0),
-            'results': processed_items,
+            'source': result.get("source", "upstream"),
+            'results': [record.to_dict() for record in result.get("items", [])],
             'search_dir': result.get("search_dir", ""),
             'json_file': result.get("json_file", "")
         }
+        if "sync" in result:
+            # 증분 모드: results는 신규/정정분, merged_results는 누적 전체
+            response['sync'] = result["sync"]
+            response['merged_results'] = result["merged_items"]
+        return FastJSONResponse(response)
         
     except Exception as e:
         print(f"💥 검색 오류: {e}")
@@ -92,46 +108,152 @@ async def search_endpoint(request: SearchRequest):
             'error': str(e)
         }
 
-@router.get("/search/{search_id}/results")
-async def get_search_results(search_id: str):
-    """📊 검색 결과 조회"""
-    try:
-        result = search_system.get_search_result(search_id)
-        
-        if not result:
-            raise HTTPException(status_code=404, detail="검색 결과를 찾을 수 없습니다")
-        
-        processed_items = []
-        for item in result.get("items", []):
-            processed_item = {
-                "bidNtceNo": item.get("bidNtceNo", ""),
-                "bidNtceNm": item.get("bidNtceNm", ""),
-                "ntceInsttNm": item.get("ntceInsttNm", ""),
-                "bidNtceDt": search_system.format_date(item.get("bidNtceDt", "")),
-                "opengDt": search_system.format_date(item.get("opengDt", "")),
-                "asignBdgtAmt": search_system.format_currency(item.get("asignBdgtAmt", "")),
-                "presmptPrce": search_system.format_currency(item.get("presmptPrce", "")),
-                "cntrctCnclsMthdNm": item.get("cntrctCnclsMthdNm", ""),
-                "ntceKindNm": item.get("ntceKindNm", ""),
-                "bidNtceDtlUrl": item.get("bidNtceDtlUrl", ""),
-                "ntceInsttOfclNm": item.get("ntceInsttOfclNm", ""),
-                "ntceInsttOfclTelNo": item.get("ntceInsttOfclTelNo", ""),
-                "ntceInsttOfclEmailAdrs": item.get("ntceInsttOfclEmailAdrs", ""),
-                "attachments": [],
-                "original_data": item
-            }
-            processed_items.append(processed_item)
-        
+@router.get("/status/{search_id}")
+async def get_search_status(
+    search_id: str,
+    include_partial: bool = Query(False, description="처리 완료된 공고 목록 포함")
+):
+    """⏳ 검색 작업 상태 조회"""
+    job = job_manager.get(search_id)
+    if job:
+        status = job.to_dict()
+        if include_partial:
+            status['partial_results'] = [record.to_dict() for record in list(job.progress.partial_results)]
+        return {'success': True, **status}
+    
+    # 작업 기록이 없어도 결과가 캐시에 있으면 완료로 응답
+    result = await search_system.get_search_result(search_id)
+    if result:
+        total = len(result.get("items", []))
         return {
             'success': True,
             'search_id': search_id,
-            'total_count': result.get("total_count", 0),
-            'results': processed_items
+            'status': 'completed',
+            'is_complete': True,
+            'results_available': True,
+            'error': None,
+            'progress': {
+                "total_bids": total,
+                "processed_bids": total,
+                "current_bid": "",
+                "current_step": "완료",
+                "progress_percent": 100,
+                "errors": [],
+                "elapsed_time": 0
+            },
+            'partial_count': total
         }
+    
+    raise HTTPException(status_code=404, detail="검색 작업을 찾을 수 없습니다")
+
+@router.get("/events/{search_id}")
+async def search_events(
+    search_id: str,
+    request: Request,
+    last_event_id: Optional[str] = Header(None, description="SSE 재연결 시 마지막으로 받은 이벤트 ID")
+):
+    """📡 검색 진행 이벤트 스트림 (Server-Sent Events)"""
+    if not job_manager.get(search_id) and not progress_broadcaster.has_channel(search_id):
+        result = await search_system.get_search_result(search_id)
+        if not result:
+            raise HTTPException(status_code=404, detail="검색 작업을 찾을 수 없습니다")
         
-    except Exception as e:
-        print(f"결과 조회 오류: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        # 이미 완료된 검색은 완료 이벤트만 전송
+        done = {'search_id': search_id, 'status': 'completed', 'is_complete': True, 'results_available': True}
+        return StreamingResponse(
+            iter([progress_broadcaster.format_sse((1, "done", done))]),
+            media_type="text/event-stream"
+        )
+    
+    try:
+        start_id = int(last_event_id or 0)
+    except ValueError:
+        start_id = 0
+    
+    async def event_stream():
+        yield "retry: 3000\n\n"
+        async for item in progress_broadcaster.subscribe(search_id, start_id):
+            if await request.is_disconnected():
+                break
+            if item is None:
+                yield ": keepalive\n\n"
+            else:
+                yield progress_broadcaster.format_sse(item)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+@router.get("/search/{search_id}/results")
+async def get_search_results(search_id: str,
+                             page: Optional[int] = Query(None, ge=1, description="페이지 번호 (1부터)"),
+                             limit: int = Query(50, ge=1, le=500, description="페이지 크기"),
+                             cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+                             sort: Optional[str] = Query(None, description="정렬 키 (date, name, agency, budget, ... / -키는 내림차순)"),
+                             order: Optional[str] = Query(None, description="정렬 방향 (asc/desc)"),
+                             fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, original_data 는 명시한 경우만)"),
+                             bidNtceNo: Optional[str] = Query(None, description="특정 공고만 조회")):
+    """📊 검색 결과 조회 (정렬/페이지/필드 선택)"""
+    result = await search_system.get_search_result(search_id)
+    if not result:
+        raise HTTPException(status_code=404, detail="검색 결과를 찾을 수 없습니다")
+    
+    try:
+        view = paginate_results(result.get("items", []), page=page, limit=limit, cursor=cursor,
+                                sort=sort, order=order, fields=fields, bid_ntce_no=bidNtceNo)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return FastJSONResponse({
+        'success': True,
+        'search_id': search_id,
+        'total_count': result.get("total_count", 0),
+        'search_dir': result.get("search_dir"),
+        **view
+    })
+
+@router.get("/search/{search_id}/statistics")
+async def get_search_statistics(search_id: str):
+    """📈 검색 결과 통계 (공고종류/계약방법/기관별 건수, 예산 합계)"""
+    stats = await search_system.get_search_statistics(search_id)
+    if "error" in stats:
+        raise HTTPException(status_code=404, detail=stats["error"])
+    return {'success': True, 'search_id': search_id, **stats}
+
+@router.get("/analytics")
+async def get_analytics(group_by: str = Query("institution", description="집계 기준 (institution, contract_method, notice_kind, month)"),
+                        start_month: Optional[str] = Query(None, pattern=r"^\d{6}$", description="시작 월 (YYYYMM)"),
+                        end_month: Optional[str] = Query(None, pattern=r"^\d{6}$", description="종료 월 (YYYYMM)"),
+                        limit: int = Query(50, ge=1, le=1000),
+                        offset: int = Query(0, ge=0)):
+    """📈 수집한 전체 공고 집계 (기준별 건수/예산 합계)"""
+    try:
+        result = await asyncio.to_thread(
+            search_system.analytics.group_by, group_by, start_month, end_month, limit, offset
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {'success': True, **result}
+
+@router.get("/analytics/budget-histogram")
+async def get_budget_histogram(start_month: Optional[str] = Query(None, pattern=r"^\d{6}$", description="시작 월 (YYYYMM)"),
+                               end_month: Optional[str] = Query(None, pattern=r"^\d{6}$", description="종료 월 (YYYYMM)")):
+    """📈 월별 예산 구간 분포"""
+    result = await asyncio.to_thread(search_system.analytics.budget_histogram, start_month, end_month)
+    return {'success': True, **result}
+
+@router.get("/attachments/search")
+async def search_attachment_text(q: str = Query(..., min_length=1, description="첨부파일 본문 검색어"),
+                                 limit: int = Query(20, ge=1, le=100),
+                                 offset: int = Query(0, ge=0)):
+    """🔎 다운로드한 첨부파일(HWP/HWPX) 본문 검색 (스니펫 + 강조 위치)"""
+    result = await search_system.search_attachment_text(q, limit, offset)
+    return {'success': True, **result}
 
 @router.post("/open-file")
 async def open_file_endpoint(request: Dict[str, str]):
@@ -145,6 +267,8 @@ async def open_file_endpoint(request: Dict[str, str]):
             }
         
         success = search_system.open_local_file(file_path)
+        if success:
+            await asyncio.to_thread(search_system.file_manifest.touch, [file_path])
         
         return {
             'success': success,
@@ -173,4 +297,25 @@ async def get_system_info():
             "통계 정보 제공"
         ],
         "description": "나라장터 입찰공고 통합 검색 시스템"
+    }
+
+@router.get("/system/stats")
+async def get_system_stats():
+    """📈 시스템 내부 통계 조회"""
+    return {
+        "http_pool": http_pool.get_stats(),
+        "jobs": job_manager.get_stats(),
+        "blob_store": search_system.blob_store.get_stats(),
+        "search_cache": search_system.search_cache.get_stats(),
+        "query_cache": search_system.query_cache.get_stats(),
+        "delta_sync": search_system.sync_store.get_stats(),
+        "notice_index": search_system.notice_index.get_stats(),
+        "text_extractor": search_system.text_extractor.get_stats(),
+        "attachment_index": search_system.attachment_index.get_stats(),
+        "record_store": search_system.record_store.get_stats(),
+        "analytics": search_system.analytics.get_stats(),
+        "file_manifest": search_system.file_manifest.get_stats(),
+        "storage_janitor": storage_janitor.get_stats(),
+        "rate_limiter": search_system.rate_limiter.get_stats(),
+        "progress_events": progress_broadcaster.get_stats()
     }
\ No newline at end of file
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+키워드 워치리스트 API 엔드포인트
+"""
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+from core.watchlist import MATCH_FIELDS, evaluate_watchlists, watchlist_store
+from api.search import search_system
+
+router = APIRouter()
+
+# 요청 모델
+class WatchlistRequest(BaseModel):
+    keywords: List[str] = Field(..., min_length=1, max_length=1000, description="감시 키워드 목록")
+    fields: Optional[List[str]] = Field(None, description=f"매칭 필드 (기본: {', '.join(MATCH_FIELDS)})")
+
+class WatchlistEvaluateRequest(BaseModel):
+    start_date: str = Field(..., pattern=r"^\d{8}$", description="시작날짜 (YYYYMMDD)")
+    end_date: str = Field(..., pattern=r"^\d{8}$", description="종료날짜 (YYYYMMDD)")
+    names: Optional[List[str]] = Field(None, description="평가할 워치리스트 (기본: 전체)")
+
+@router.get("/")
+async def list_watchlists():
+    """📋 워치리스트 목록"""
+    watchlists = watchlist_store.list()
+    return {'success': True, 'count': len(watchlists), 'watchlists': watchlists}
+
+@router.put("/{name}")
+async def save_watchlist(name: str, request: WatchlistRequest):
+    """💾 워치리스트 생성/교체"""
+    try:
+        watchlist = watchlist_store.save(name, request.keywords, request.fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {'success': True, 'watchlist': watchlist}
+
+@router.delete("/{name}")
+async def delete_watchlist(name: str):
+    """🗑️ 워치리스트 삭제"""
+    if not watchlist_store.delete(name):
+        raise HTTPException(status_code=404, detail="워치리스트를 찾을 수 없습니다.")
+    return {'success': True, 'message': f'{name} 워치리스트를 삭제했습니다.'}
+
+@router.post("/evaluate")
+async def evaluate(request: WatchlistEvaluateRequest):
+    """🔔 기간 내 공고를 한 번 조회해 모든 워치리스트 키워드와 대조"""
+    watchlists = watchlist_store.list()
+    if request.names:
+        missing = set(request.names) - {watchlist["name"] for watchlist in watchlists}
+        if missing:
+            raise HTTPException(status_code=404, detail=f"워치리스트를 찾을 수 없습니다: {', '.join(sorted(missing))}")
+        watchlists = [watchlist for watchlist in watchlists if watchlist["name"] in request.names]
+    if not watchlists:
+        raise HTTPException(status_code=400, detail="등록된 워치리스트가 없습니다.")
+
+    try:
+        result = await evaluate_watchlists(search_system, watchlists, request.start_date, request.end_date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {'success': True, **result}
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+첨부파일 본문 역색인 (SQLite)
+추출된 본문 텍스트를 blob(SHA-256) 단위로 한 번만 색인. 공백을 제거하고 소문자화한 글자열의
+1-gram/2-gram 마다 문서별 위치 목록(postings)을 저장하고, 검색은 질의 2-gram의 postings 교집합과
+위치 연속성 검사로 처리해 문서 수와 무관하게 후보 문서만 읽음. 스니펫은 상위 문서의 원문에서만 생성
+"""
+
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from core.config import settings
+
+
+def normalize_with_offsets(text: str) -> Tuple[str, List[int]]:
+    """공백 제거 + 소문자화한 글자열과 각 글자의 원문 위치"""
+    chars: List[str] = []
+    offsets: List[int] = []
+    for offset, char in enumerate(text):
+        if char.isspace():
+            continue
+        chars.append(char.lower()[0])
+        offsets.append(offset)
+    return "".join(chars), offsets
+
+
+def query_terms(normalized: str) -> List[str]:
+    """질의 색인어 (2글자 이상은 2-gram, 1글자는 1-gram)"""
+    if len(normalized) == 1:
+        return [normalized]
+    return [normalized[i:i + 2] for i in range(len(normalized) - 1)]
+
+
+def find_matches(text: str, keyword: str) -> List[Tuple[int, int]]:
+    """원문에서 키워드 일치 구간 [(start, end)] (공백/대소문자 무시)"""
+    normalized, offsets = normalize_with_offsets(text)
+    needle, _ = normalize_with_offsets(keyword)
+    if not needle:
+        return []
+    matches = []
+    pos = normalized.find(needle)
+    while pos != -1:
+        matches.append((offsets[pos], offsets[pos + len(needle) - 1] + 1))
+        pos = normalized.find(needle, pos + len(needle))
+    return matches
+
+
+def build_snippets(text: str, matches: List[Tuple[int, int]],
+                   context_chars: int = settings.SNIPPET_CONTEXT_CHARS,
+                   max_snippets: Optional[int] = None) -> List[Dict]:
+    """일치 구간 앞뒤 context_chars 글자로 스니펫 생성 (겹치는 구간은 하나로 병합)
+
+    highlights 는 스니펫 내부 기준 [start, end) 오프셋, offset 은 스니펫의 원문 시작 위치
+    """
+    snippets: List[Dict] = []
+    for start, end in matches:
+        window_start = max(start - context_chars, 0)
+        window_end = min(end + context_chars, len(text))
+        if snippets and window_start <= snippets[-1]["end"]:
+            snippets[-1]["end"] = max(snippets[-1]["end"], window_end)
+            snippets[-1]["matches"].append((start, end))
+            continue
+        if max_snippets is not None and len(snippets) >= max_snippets:
+            break
+        snippets.append({"start": window_start, "end": window_end, "matches": [(start, end)]})
+
+    return [
+        {
+            "offset": snippet["start"],
+            "text": text[snippet["start"]:snippet["end"]],
+            "highlights": [[start - snippet["start"], end - snippet["start"]] for start, end in snippet["matches"]]
+        }
+        for snippet in snippets
+    ]
+
+
+class AttachmentIndex:
+    """첨부파일 본문 역색인 (blob 단위 증분 색인 + 공고 참조)"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        db_path = Path(db_path or settings.downloads_cache_dir / "attachment_index.db")
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS documents ("
+            " doc_id INTEGER PRIMARY KEY,"
+            " sha256 TEXT NOT NULL UNIQUE,"
+            " chars INTEGER NOT NULL,"
+            " indexed_at REAL NOT NULL)"
+        )
+        # 글자 n-gram → 문서별 정규화 위치 목록 (uint32 배열)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS postings ("
+            " term TEXT NOT NULL,"
+            " doc_id INTEGER NOT NULL,"
+            " positions BLOB NOT NULL,"
+            " PRIMARY KEY (term, doc_id)) WITHOUT ROWID"
+        )
+        # blob을 첨부한 공고 (같은 파일이 여러 공고에 첨부될 수 있음)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS document_refs ("
+            " sha256 TEXT NOT NULL,"
+            " bid_ntce_no TEXT NOT NULL,"
+            " bid_ntce_ord TEXT NOT NULL,"
+            " filename TEXT NOT NULL,"
+            " PRIMARY KEY (sha256, bid_ntce_no, bid_ntce_ord, filename))"
+        )
+        self.stats = {
+            "documents_indexed": 0,
+            "queries": 0,
+            "candidate_documents": 0
+        }
+
+    def is_indexed(self, sha256: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM documents WHERE sha256 = ?", (sha256,)).fetchone()
+        return row is not None
+
+    def add_reference(self, sha256: str, bid_ntce_no: str, bid_ntce_ord: str, filename: str):
+        """blob을 첨부한 공고 기록"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO document_refs (sha256, bid_ntce_no, bid_ntce_ord, filename)"
+                " VALUES (?, ?, ?, ?)",
+                (sha256, bid_ntce_no or "", bid_ntce_ord or "", filename or "")
+            )
+
+    def add_document(self, sha256: str, text: str, bid_ntce_no: str = "", bid_ntce_ord: str = "",
+                     filename: str = "") -> bool:
+        """blob 본문 색인 (이미 색인된 blob은 공고 참조만 추가). 새로 색인했으면 True"""
+        if bid_ntce_no or filename:
+            self.add_reference(sha256, bid_ntce_no, bid_ntce_ord, filename)
+        if self.is_indexed(sha256):
+            return False
+
+        normalized, _ = normalize_with_offsets(text)
+        postings: Dict[str, array] = {}
+        for pos, char in enumerate(normalized):
+            postings.setdefault(char, array("I")).append(pos)
+            if pos + 1 < len(normalized):
+                postings.setdefault(normalized[pos:pos + 2], array("I")).append(pos)
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO documents (sha256, chars, indexed_at) VALUES (?, ?, ?)",
+                    (sha256, len(normalized), time.time())
+                )
+                if cursor.rowcount == 0:
+                    # 다른 작업이 먼저 색인
+                    self._conn.execute("ROLLBACK")
+                    return False
+                doc_id = cursor.lastrowid
+                self._conn.executemany(
+                    "INSERT INTO postings (term, doc_id, positions) VALUES (?, ?, ?)",
+                    ((term, doc_id, positions.tobytes()) for term, positions in postings.items())
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        self.stats["documents_indexed"] += 1
+        return True
+
+    def _posting_docs(self, terms: List[str]) -> Optional[Set[int]]:
+        """모든 색인어를 포함한 문서 (문서 빈도가 낮은 색인어부터 교집합)"""
+        unique_terms = list(dict.fromkeys(terms))
+        placeholders = ",".join("?" * len(unique_terms))
+        with self._lock:
+            frequencies = dict(self._conn.execute(
+                f"SELECT term, COUNT(*) FROM postings WHERE term IN ({placeholders}) GROUP BY term",
+                unique_terms
+            ).fetchall())
+            if len(frequencies) < len(unique_terms):
+                return None
+
+            candidates: Optional[Set[int]] = None
+            for term in sorted(unique_terms, key=frequencies.get):
+                rows = self._conn.execute("SELECT doc_id FROM postings WHERE term = ?", (term,)).fetchall()
+                docs = {row[0] for row in rows}
+                candidates = docs if candidates is None else candidates & docs
+                if not candidates:
+                    return None
+        return candidates
+
+    def _match_counts(self, terms: List[str], doc_ids: Iterable[int], length: int) -> Dict[int, int]:
+        """후보 문서별 연속 일치 횟수 (색인어 i 가 위치 p+i 에 모두 있으면 p 에서 일치)"""
+        unique_terms = list(dict.fromkeys(terms))
+        doc_ids = list(doc_ids)
+        positions: Dict[Tuple[str, int], array] = {}
+        term_placeholders = ",".join("?" * len(unique_terms))
+        # SQLite 바인딩 변수 한도를 넘지 않도록 나눠 조회
+        for chunk_start in range(0, len(doc_ids), 500):
+            chunk = doc_ids[chunk_start:chunk_start + 500]
+            doc_placeholders = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT term, doc_id, positions FROM postings"
+                    f" WHERE term IN ({term_placeholders}) AND doc_id IN ({doc_placeholders})",
+                    unique_terms + chunk
+                ).fetchall()
+            for term, doc_id, blob in rows:
+                values = array("I")
+                values.frombytes(blob)
+                positions[(term, doc_id)] = values
+
+        counts: Dict[int, int] = {}
+        for doc_id in doc_ids:
+            starts = set(positions[(terms[0], doc_id)])
+            for shift, term in enumerate(terms[1:], start=1):
+                starts &= {pos - shift for pos in positions[(term, doc_id)]}
+                if not starts:
+                    break
+            if starts:
+                # 겹치는 일치는 한 번으로 계산 (find_matches 와 같은 규칙)
+                count = 0
+                last_end = -1
+                for start in sorted(starts):
+                    if start >= last_end:
+                        count += 1
+                        last_end = start + length
+                counts[doc_id] = count
+        return counts
+
+    def search(self, keyword: str, limit: int = 20, offset: int = 0,
+               context_chars: int = settings.SNIPPET_CONTEXT_CHARS, snippets_per_document: int = 3,
+               text_loader=None) -> Dict:
+        """첨부파일 본문 검색 (일치 횟수 순). text_loader(sha256)가 주어지면 상위 문서의 스니펫 포함"""
+        started = time.perf_counter()
+        self.stats["queries"] += 1
+        normalized, _ = normalize_with_offsets(keyword)
+        result = {"keyword": keyword, "total_documents": 0, "hits": []}
+        if not normalized:
+            result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+            return result
+
+        terms = query_terms(normalized)
+        candidates = self._posting_docs(terms) or set()
+        self.stats["candidate_documents"] += len(candidates)
+        counts = self._match_counts(terms, candidates, len(normalized)) if candidates else {}
+        ranked = sorted(counts.items(), key=lambda entry: (-entry[1], entry[0]))
+        result["total_documents"] = len(ranked)
+
+        page = ranked[offset:offset + limit]
+        if page:
+            doc_placeholders = ",".join("?" * len(page))
+            with self._lock:
+                sha_by_doc = dict(self._conn.execute(
+                    f"SELECT doc_id, sha256 FROM documents WHERE doc_id IN ({doc_placeholders})",
+                    [doc_id for doc_id, _ in page]
+                ).fetchall())
+                ref_rows = self._conn.execute(
+                    f"SELECT sha256, bid_ntce_no, bid_ntce_ord, filename FROM document_refs"
+                    f" WHERE sha256 IN ({doc_placeholders}) ORDER BY bid_ntce_no, bid_ntce_ord",
+                    list(sha_by_doc.values())
+                ).fetchall()
+            refs: Dict[str, List[Dict]] = {}
+            for sha256, bid_ntce_no, bid_ntce_ord, filename in ref_rows:
+                refs.setdefault(sha256, []).append(
+                    {"bidNtceNo": bid_ntce_no, "bidNtceOrd": bid_ntce_ord, "filename": filename}
+                )
+
+            for doc_id, count in page:
+                sha256 = sha_by_doc[doc_id]
+                hit = {"sha256": sha256, "matches": count, "notices": refs.get(sha256, [])}
+                if text_loader is not None:
+                    text = text_loader(sha256)
+                    if text:
+                        hit["snippets"] = build_snippets(text, find_matches(text, keyword),
+                                                         context_chars, snippets_per_document)
+                result["hits"].append(hit)
+
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return result
+
+    def get_stats(self) -> Dict:
+        """색인 규모/질의 통계"""
+        with self._lock:
+            documents = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(chars), 0) FROM documents").fetchone()
+            references = self._conn.execute("SELECT COUNT(*) FROM document_refs").fetchone()[0]
+        return dict(self.stats, documents=documents[0], indexed_chars=documents[1], references=references)
+
+
+# 전역 첨부파일 본문 색인
+attachment_index = AttachmentIndex()
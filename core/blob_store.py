@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+내용 주소 기반(content-addressed) 첨부파일 저장소
+첨부파일 원본은 SHA-256 해시 경로에 한 번만 저장하고, 검색 디렉토리에는 하드링크로 연결
+"""
+
+import asyncio
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import aiofiles
+
+from core.config import settings
+
+
+class FileSizeLimitExceeded(Exception):
+    """첨부파일 크기 제한(Settings.MAX_FILE_SIZE) 초과"""
+    pass
+
+
+class BlobStore:
+    """URL 및 내용 해시 기준 중복 제거 저장소"""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root or settings.downloads_blobs_dir)
+        self.objects_dir = self.root / "objects"
+        self.tmp_dir = self.root / "tmp"
+        for directory in [self.objects_dir, self.tmp_dir]:
+            directory.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.root / "index.db"), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS url_index ("
+            " url_key TEXT PRIMARY KEY,"
+            " sha256 TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_url_index_sha256 ON url_index(sha256)")
+
+        self.stats = {
+            "url_hits": 0,
+            "url_misses": 0,
+            "content_dedup_hits": 0,
+            "blobs_stored": 0,
+            "bytes_downloaded": 0,
+            "bytes_saved": 0,
+            "blobs_collected": 0,
+            "blob_bytes_freed": 0
+        }
+
+    @staticmethod
+    def url_key(url: str) -> str:
+        """URL 식별 키 (나라장터 첨부파일은 공고번호/차수/파일순번 기준)"""
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query)
+        if "bidPbancNo" in query and "fileSeq" in query:
+            bid_no = query["bidPbancNo"][0]
+            bid_ord = query.get("bidPbancOrd", [""])[0]
+            file_seq = query["fileSeq"][0]
+            return f"g2b:{bid_no}:{bid_ord}:{file_seq}"
+        return url
+
+    def blob_path(self, sha256: str) -> Path:
+        """해시에 해당하는 원본 경로"""
+        return self.objects_dir / sha256[:2] / sha256
+
+    @staticmethod
+    def _refresh(path: Path) -> bool:
+        # 수정 시각 갱신 (저장 공간 정리가 곧 연결될 원본을 회수하지 않도록). 원본이 없으면 False
+        try:
+            os.utime(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def lookup_url(self, url: str) -> Optional[Dict]:
+        """이미 저장된 URL이면 blob 정보 반환"""
+        key = self.url_key(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256, size FROM url_index WHERE url_key = ?", (key,)
+            ).fetchone()
+            if row and not self._refresh(self.blob_path(row[0])):
+                # 원본이 사라진 경우 인덱스 정리
+                self._conn.execute("DELETE FROM url_index WHERE url_key = ?", (key,))
+                row = None
+
+            if row:
+                self.stats["url_hits"] += 1
+                self.stats["bytes_saved"] += row[1]
+                return {"sha256": row[0], "size": row[1], "cached": True}
+            self.stats["url_misses"] += 1
+            return None
+
+    def new_temp_path(self) -> Path:
+        """다운로드용 고유 임시 파일 경로"""
+        return self.tmp_dir / f"{uuid.uuid4().hex}.part"
+
+    def commit(self, temp_path: Path, sha256: str, size: int, url: str) -> Path:
+        """임시 파일을 해시 경로로 원자적으로 이동하고 URL 인덱스 갱신"""
+        blob_path = self.blob_path(sha256)
+        with self._lock:
+            if self._refresh(blob_path):
+                # 같은 내용이 이미 있으면 임시 파일만 삭제
+                temp_path.unlink(missing_ok=True)
+                self.stats["content_dedup_hits"] += 1
+            else:
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(temp_path, blob_path)
+                self.stats["blobs_stored"] += 1
+            self._conn.execute(
+                "INSERT OR REPLACE INTO url_index (url_key, sha256, size, created_at) VALUES (?, ?, ?, ?)",
+                (self.url_key(url), sha256, size, time.time())
+            )
+        return blob_path
+
+    def link_to(self, sha256: str, dest: Path) -> Optional[Path]:
+        """원본을 대상 경로에 하드링크 (불가능하면 복사) - 임시 이름으로 만든 뒤 교체.
+        그 사이 원본이 회수되었으면 None (호출자가 다시 다운로드)"""
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        temp_dest = dest.with_name(f".{dest.name}.{uuid.uuid4().hex[:8]}.tmp")
+        blob_path = self.blob_path(sha256)
+        # 원본 회수(release)와 겹치지 않도록 잠금 안에서 연결
+        with self._lock:
+            try:
+                os.link(blob_path, temp_dest)
+                linked = True
+            except FileNotFoundError:
+                return None
+            except OSError:
+                # 하드링크 불가 - 복사하는 동안 회수되지 않도록 수정 시각 갱신
+                if not self._refresh(blob_path):
+                    return None
+                linked = False
+        if not linked:
+            try:
+                shutil.copyfile(blob_path, temp_dest)
+            except FileNotFoundError:
+                temp_dest.unlink(missing_ok=True)
+                return None
+        os.replace(temp_dest, dest)
+        return dest
+
+    async def store_response(self, response, url: str) -> Dict:
+        """aiohttp 응답을 청크 단위로 해싱하며 저장 (크기 제한 적용)"""
+        max_bytes = settings.MAX_FILE_SIZE * 1024 * 1024
+
+        # Content-Length 기준 사전 차단
+        if response.content_length and response.content_length > max_bytes:
+            raise FileSizeLimitExceeded(f"Content-Length {response.content_length} bytes")
+
+        temp_path = self.new_temp_path()
+        digest = hashlib.sha256()
+        received = 0
+        try:
+            async with aiofiles.open(temp_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(settings.DOWNLOAD_CHUNK_SIZE):
+                    received += len(chunk)
+                    if received > max_bytes:
+                        raise FileSizeLimitExceeded(f"{received} bytes 이상 수신")
+                    digest.update(chunk)
+                    await f.write(chunk)
+
+            sha256 = digest.hexdigest()
+            await asyncio.to_thread(self.commit, temp_path, sha256, received, url)
+            self.stats["bytes_downloaded"] += received
+            return {"sha256": sha256, "size": received, "cached": False}
+        finally:
+            # 실패/중단 시 임시 파일 정리
+            if temp_path.exists():
+                temp_path.unlink()
+
+    def _scan(self) -> Iterator[Tuple[str, os.stat_result]]:
+        for prefix in os.scandir(self.objects_dir):
+            if not prefix.is_dir():
+                continue
+            for entry in os.scandir(prefix.path):
+                try:
+                    yield entry.path, entry.stat()
+                except FileNotFoundError:
+                    continue
+
+    def inodes(self) -> Dict[int, Tuple[str, int]]:
+        """원본 inode → (경로, 크기). 검색 디렉토리의 하드링크와 같은 inode를 공유"""
+        return {stat.st_ino: (path, stat.st_size) for path, stat in self._scan()}
+
+    def release(self, path: str, modified_before: float) -> Optional[int]:
+        """연결된 파일이 모두 삭제된(하드링크 수 1) 원본 하나와 URL 인덱스 정리. 방금 받은 원본은 제외
+        회수한 바이트 수 반환 (회수하지 않았으면 None)"""
+        with self._lock:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                return None
+            if stat.st_nlink != 1 or stat.st_mtime >= modified_before:
+                return None
+            self._conn.execute("DELETE FROM url_index WHERE sha256 = ?", (os.path.basename(path),))
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                return None
+        self.stats["blobs_collected"] += 1
+        self.stats["blob_bytes_freed"] += stat.st_size
+        return stat.st_size
+
+    def collect_unreferenced(self, modified_before: float) -> Dict[str, int]:
+        """연결이 모두 끊긴 원본 전체 회수"""
+        collected = 0
+        freed = 0
+        for path, stat in self._scan():
+            if stat.st_nlink != 1 or stat.st_mtime >= modified_before:
+                continue
+            size = self.release(path, modified_before)
+            if size is not None:
+                collected += 1
+                freed += size
+        return {"blobs_collected": collected, "blob_bytes_freed": freed}
+
+    def get_stats(self) -> Dict:
+        """저장소 통계"""
+        stats = dict(self.stats)
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*), COUNT(DISTINCT sha256) FROM url_index").fetchone()
+        stats["indexed_urls"] = row[0]
+        stats["unique_blobs"] = row[1]
+        return stats
+
+
+# 전역 저장소 인스턴스
+blob_store = BlobStore()
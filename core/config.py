@@ -7,6 +7,7 @@
 import os
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlparse, urlunparse
 
 class Settings:
     """애플리케이션 설정"""
@@ -25,19 +26,75 @@ class Settings:
         "http://apis.data.go.kr/1230000/BidPublicInfoService"
     )
     
+    # 엔드포인트 대체 설정 (tools/g2b_standin.py 등 로컬 대체 서버 연결용)
+    G2B_AD_BASE_URL: str = os.getenv(
+        "G2B_AD_BASE_URL",
+        "http://apis.data.go.kr/1230000/ad/BidPublicInfoService"
+    )
+    ATTACHMENT_BASE_URL: str = os.getenv("ATTACHMENT_BASE_URL", "")  # 비어 있으면 원본 첨부파일 호스트 사용
+    
     # 파일 처리 설정
     MAX_FILE_SIZE: int = int(os.getenv("MAX_FILE_SIZE", "100"))  # MB
     MAX_DOWNLOAD_TIME: int = int(os.getenv("MAX_DOWNLOAD_TIME", "300"))  # seconds
     SUPPORTED_FILE_TYPES: list = [".hwp", ".hwpx", ".pdf", ".doc", ".docx"]
+    DOWNLOAD_CHUNK_SIZE: int = int(os.getenv("DOWNLOAD_CHUNK_SIZE", "65536"))  # bytes
+    DOWNLOAD_WORKERS: int = int(os.getenv("DOWNLOAD_WORKERS", "8"))  # 검색 단위 다운로드 워커 수
+    DOWNLOAD_PER_HOST_LIMIT: int = int(os.getenv("DOWNLOAD_PER_HOST_LIMIT", "6"))  # 호스트별 동시 다운로드 수
+    TEXT_EXTRACTION_ENABLED: bool = os.getenv("TEXT_EXTRACTION_ENABLED", "true").lower() == "true"  # HWP/HWPX 본문 텍스트 추출
+    EXTRACT_WORKERS: int = int(os.getenv("EXTRACT_WORKERS", str(min(os.cpu_count() or 1, 4))))  # 텍스트 추출 프로세스 수
+    SNIPPET_CONTEXT_CHARS: int = int(os.getenv("SNIPPET_CONTEXT_CHARS", "100"))  # 첨부파일 본문 검색 스니펫 앞뒤 글자 수
     
     # 검색 설정
     MAX_SEARCH_RESULTS: int = int(os.getenv("MAX_SEARCH_RESULTS", "100"))
     SEARCH_TIMEOUT: int = int(os.getenv("SEARCH_TIMEOUT", "1800"))  # seconds
-    API_CALL_DELAY: float = float(os.getenv("API_CALL_DELAY", "0.5"))  # seconds
-    
+    MAX_CONCURRENT_SEARCHES: int = int(os.getenv("MAX_CONCURRENT_SEARCHES", "3"))  # 동시 실행 백그라운드 검색 수
+    SSE_HISTORY_SIZE: int = int(os.getenv("SSE_HISTORY_SIZE", "2000"))  # 재연결용 검색별 이벤트 보관 수
+    SSE_HEARTBEAT_SECONDS: float = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+    API_CALL_DELAY: float = float(os.getenv("API_CALL_DELAY", "0.5"))  # 재시도 백오프 시작 대기 (seconds)
+    API_BACKOFF_MAX: float = float(os.getenv("API_BACKOFF_MAX", "30"))  # 재시도 백오프 최대 대기 (seconds)
+    API_RATE_LIMIT: float = float(os.getenv("API_RATE_LIMIT", "10"))  # 프로세스 전체 초당 API 호출 수
+    API_RATE_BURST: int = int(os.getenv("API_RATE_BURST", "5"))  # 순간 허용 호출 수
+    API_DAILY_QUOTA: int = int(os.getenv("API_DAILY_QUOTA", "0"))  # 일일 API 호출 한도 (0 = 무제한)
+    API_PAGE_CONCURRENCY: int = int(os.getenv("API_PAGE_CONCURRENCY", "8"))  # 전체 페이지 조회 동시 요청 수
+    MAX_SEARCH_PAGES: int = int(os.getenv("MAX_SEARCH_PAGES", "100"))
+    WATCHLIST_PAGE_SIZE: int = int(os.getenv("WATCHLIST_PAGE_SIZE", "500"))  # 워치리스트 전체 조회 페이지 크기
+    WATCHLIST_MAX_DAYS: int = int(os.getenv("WATCHLIST_MAX_DAYS", "31"))  # 워치리스트 평가 최대 기간 (일)
+    WATCHLIST_WINDOW_CONCURRENCY: int = int(os.getenv("WATCHLIST_WINDOW_CONCURRENCY", "2"))  # 동시 조회 일 구간 수
+    LOCAL_INDEX_ENABLED: bool = os.getenv("LOCAL_INDEX_ENABLED", "true").lower() == "true"  # 수집 구간 내 검색은 로컬 색인으로 응답
+    INDEX_FRESHNESS_SECONDS: int = int(os.getenv("INDEX_FRESHNESS_SECONDS", "3600"))  # 최근 수집 구간을 최신으로 간주하는 시간
+    SYNC_OVERLAP_MINUTES: int = int(os.getenv("SYNC_OVERLAP_MINUTES", "60"))  # 증분 조회 시 워터마크 이전 재조회 구간
+    PIPELINE_DETAIL_CONCURRENCY: int = int(os.getenv("PIPELINE_DETAIL_CONCURRENCY", "4"))  # 상세 조회 단계 워커 수
+    PIPELINE_PERSIST_CONCURRENCY: int = int(os.getenv("PIPELINE_PERSIST_CONCURRENCY", "2"))  # JSON 저장 단계 워커 수
+    PIPELINE_ATTACHMENT_CONCURRENCY: int = int(os.getenv("PIPELINE_ATTACHMENT_CONCURRENCY", "4"))  # 첨부파일 단계 워커 수
+    PIPELINE_QUEUE_SIZE: int = int(os.getenv("PIPELINE_QUEUE_SIZE", "16"))  # 단계 간 큐 크기
+
+    # 공고 JSON 저장소 설정 (NDJSON 세그먼트)
+    RECORD_SEGMENT_MAX_MB: int = int(os.getenv("RECORD_SEGMENT_MAX_MB", "64"))  # 세그먼트 최대 크기 (넘으면 새 세그먼트)
+    RECORD_GROUP_COMMIT_MS: float = float(os.getenv("RECORD_GROUP_COMMIT_MS", "20"))  # 저장 요청을 모으는 시간 (ms)
+    RECORD_GROUP_COMMIT_MAX: int = int(os.getenv("RECORD_GROUP_COMMIT_MAX", "256"))  # 한 번에 기록하는 최대 레코드 수
+    RECORD_FSYNC: bool = os.getenv("RECORD_FSYNC", "true").lower() == "true"  # 기록마다 fsync
+    RECORD_COMPACT_DEAD_RATIO: float = float(os.getenv("RECORD_COMPACT_DEAD_RATIO", "0.5"))  # 덮어쓴 비율이 이 이상인 세그먼트 압축
+
+    # 다운로드 파일 관리 설정
+    FILE_MANIFEST_RECONCILE_MINUTES: float = float(os.getenv("FILE_MANIFEST_RECONCILE_MINUTES", "60"))  # 다운로드 파일 목록 보정 주기
+    STORAGE_BUDGET_MB: int = int(os.getenv("STORAGE_BUDGET_MB", "10240"))  # 다운로드 전체 용량 한도 (0 = 무제한)
+    STORAGE_SEARCH_QUOTA_MB: int = int(os.getenv("STORAGE_SEARCH_QUOTA_MB", "1024"))  # 검색별 용량 한도 (0 = 무제한)
+    STORAGE_JANITOR_INTERVAL_MINUTES: float = float(os.getenv("STORAGE_JANITOR_INTERVAL_MINUTES", "10"))  # 정리 주기
+    STORAGE_EVICT_MIN_AGE_MINUTES: float = float(os.getenv("STORAGE_EVICT_MIN_AGE_MINUTES", "30"))  # 최근 쓰거나 연 파일은 정리 제외
+
+    # HTTP 커넥션 풀 설정
+    HTTP_POOL_LIMIT: int = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+    HTTP_POOL_LIMIT_PER_HOST: int = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "10"))
+    HTTP_KEEPALIVE_TIMEOUT: float = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))  # seconds
+    HTTP_DNS_CACHE_TTL: int = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))  # seconds
+
     # 캐시 설정
     CACHE_EXPIRE_HOURS: int = int(os.getenv("CACHE_EXPIRE_HOURS", "24"))
-    MAX_CACHED_SEARCHES: int = int(os.getenv("MAX_CACHED_SEARCHES", "100"))
+    MAX_CACHED_SEARCHES: int = int(os.getenv("MAX_CACHED_SEARCHES", "100"))  # 메모리 LRU 항목 수
+    CACHE_DB_MAX_SEARCHES: int = int(os.getenv("CACHE_DB_MAX_SEARCHES", "1000"))  # SQLite 보관 항목 수
+    QUERY_CACHE_TTL: int = int(os.getenv("QUERY_CACHE_TTL", "300"))  # API 응답 캐시 (seconds)
+    QUERY_CACHE_PAST_TTL: int = int(os.getenv("QUERY_CACHE_PAST_TTL", "86400"))  # 과거 기간 조회 응답 캐시 (seconds)
+    QUERY_CACHE_MAX_ENTRIES: int = int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "500"))
     
     # 보안 설정
     ALLOWED_ORIGINS: list = os.getenv("ALLOWED_ORIGINS", "*").split(",")
@@ -65,6 +122,21 @@ class Settings:
     def downloads_reports_dir(self) -> Path:
         return self.DOWNLOADS_DIR / "reports"
     
+    @property
+    def downloads_blobs_dir(self) -> Path:
+        return self.DOWNLOADS_DIR / "blobs"
+    
+    @property
+    def downloads_cache_dir(self) -> Path:
+        return self.DOWNLOADS_DIR / "cache"
+    
+    def rewrite_attachment_url(self, url: str) -> str:
+        """ATTACHMENT_BASE_URL이 설정되면 첨부파일 URL의 호스트를 교체"""
+        if not self.ATTACHMENT_BASE_URL or not url:
+            return url
+        base = urlparse(self.ATTACHMENT_BASE_URL)
+        return urlunparse(urlparse(url)._replace(scheme=base.scheme, netloc=base.netloc))
+    
     def ensure_directories(self):
         """필요한 디렉토리들을 생성"""
         directories = [
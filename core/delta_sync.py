@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+조회 조건별 증분 동기화 상태
+정규화된 조회 조건마다 워터마크(마지막 공고일시)와 처리한 공고(공고번호+차수)를 SQLite에 보관해
+다음 실행은 워터마크 이후 구간만 조회하고 신규/정정 공고만 처리
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.config import settings
+from core.json_codec import dumps, loads
+from core.query_cache import UpstreamQueryCache
+
+# 워터마크를 공유하는 조회 조건 (기간/페이지 관련 파라미터는 제외)
+QUERY_FIELDS = ("bidNtceNm", "ntceInsttNm", "inqryDivCd")
+
+
+def _parse_notice_dt(value: str) -> Optional[datetime]:
+    """'YYYY-MM-DD HH:MM:SS' / 'YYYYMMDD[HHMM]' 형식 공고일시 파싱"""
+    digits = "".join(c for c in str(value or "") if c.isdigit())
+    for fmt, length in (("%Y%m%d%H%M%S", 14), ("%Y%m%d%H%M", 12), ("%Y%m%d", 8)):
+        if len(digits) >= length:
+            try:
+                return datetime.strptime(digits[:length], fmt)
+            except ValueError:
+                return None
+    return None
+
+
+class SyncPlan:
+    """한 번의 증분 실행 계획 (조회 구간 + 이전 워터마크)"""
+
+    def __init__(self, query_key: str, fetch_params: Dict, mode: str,
+                 watermark: Optional[str], window_begin: str, window_end: str):
+        self.query_key = query_key
+        self.fetch_params = fetch_params
+        self.mode = mode  # "full" (첫 실행/구간 확장) 또는 "incremental"
+        self.watermark = watermark
+        self.window_begin = window_begin
+        self.window_end = window_end
+
+    def to_dict(self) -> Dict:
+        return {
+            "mode": self.mode,
+            "previous_watermark": self.watermark,
+            "window": {"begin": self.window_begin, "end": self.window_end}
+        }
+
+
+class DeltaSyncStore:
+    """조회 조건별 워터마크/처리 공고 저장소"""
+
+    def __init__(self, db_path: Optional[Path] = None,
+                 overlap_minutes: int = settings.SYNC_OVERLAP_MINUTES):
+        db_path = Path(db_path or settings.downloads_cache_dir / "delta_sync.db")
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # 늦게 등록되는 공고를 놓치지 않도록 워터마크 이전 구간을 겹쳐서 조회
+        self.overlap = timedelta(minutes=max(overlap_minutes, 0))
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sync_watermarks ("
+            " query_key TEXT PRIMARY KEY,"
+            " covered_begin TEXT NOT NULL,"
+            " last_bid_dt TEXT,"
+            " runs INTEGER NOT NULL DEFAULT 0,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sync_notices ("
+            " query_key TEXT NOT NULL,"
+            " bid_ntce_no TEXT NOT NULL,"
+            " bid_ntce_ord TEXT NOT NULL,"
+            " bid_ntce_dt TEXT,"
+            " chg_dt TEXT,"
+            " item TEXT NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " PRIMARY KEY (query_key, bid_ntce_no, bid_ntce_ord))"
+        )
+
+    @staticmethod
+    def make_query_key(search_params: Dict) -> str:
+        """기간을 제외한 조회 조건 정규화 키"""
+        return UpstreamQueryCache.make_key("delta_sync", {
+            field: search_params.get(field) for field in QUERY_FIELDS
+        })
+
+    def plan(self, search_params: Dict) -> SyncPlan:
+        """워터마크 기준 조회 구간 결정 (요청 시작일이 이전 범위보다 앞서면 전체 조회)"""
+        query_key = self.make_query_key(search_params)
+        requested_begin = _parse_notice_dt(search_params.get("inqryBgnDt")) or datetime.now().replace(
+            hour=0, minute=0, second=0, microsecond=0)
+        requested_end = _parse_notice_dt(search_params.get("inqryEndDt"))
+        if requested_end is None or len(str(search_params.get("inqryEndDt") or "")) <= 8:
+            # 날짜만 주어지면 해당 일자 끝까지
+            requested_end = (requested_end or datetime.now()).replace(hour=23, minute=59)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT covered_begin, last_bid_dt FROM sync_watermarks WHERE query_key = ?", (query_key,)
+            ).fetchone()
+
+        mode, watermark, begin = "full", None, requested_begin
+        if row and row[1] and _parse_notice_dt(row[0]) <= requested_begin:
+            watermark = row[1]
+            mode = "incremental"
+            begin = max(requested_begin, _parse_notice_dt(watermark) - self.overlap)
+
+        fetch_params = dict(search_params)
+        fetch_params["inqryBgnDt"] = begin.strftime("%Y%m%d%H%M")
+        fetch_params["inqryEndDt"] = requested_end.strftime("%Y%m%d%H%M")
+        # 구간 내 누락이 없도록 전체 페이지 조회
+        fetch_params["allPages"] = True
+        fetch_params["pageNo"] = 1
+        return SyncPlan(query_key, fetch_params, mode, watermark,
+                        fetch_params["inqryBgnDt"], fetch_params["inqryEndDt"])
+
+    def classify(self, plan: SyncPlan, items: List[Dict]) -> List[Tuple[Dict, str]]:
+        """조회 결과를 new/revised/renotice/unchanged 로 분류"""
+        keys = {item.get("bidNtceNo", "") for item in items}
+        known: Dict[str, Dict[str, Optional[str]]] = {}
+        with self._lock:
+            for bid_ntce_no in keys:
+                for bid_ntce_ord, chg_dt in self._conn.execute(
+                    "SELECT bid_ntce_ord, chg_dt FROM sync_notices WHERE query_key = ? AND bid_ntce_no = ?",
+                    (plan.query_key, bid_ntce_no)
+                ):
+                    known.setdefault(bid_ntce_no, {})[bid_ntce_ord] = chg_dt
+
+        classified = []
+        for item in items:
+            orders = known.get(item.get("bidNtceNo", ""))
+            bid_ntce_ord = item.get("bidNtceOrd", "")
+            if orders is None:
+                change = "renotice" if item.get("reNtceYn") == "Y" else "new"
+            elif bid_ntce_ord not in orders:
+                # 같은 공고번호의 새 차수 (정정/재공고)
+                change = "renotice" if item.get("reNtceYn") == "Y" else "revised"
+            elif (item.get("chgDt") or None) != orders[bid_ntce_ord]:
+                change = "revised"
+            else:
+                change = "unchanged"
+            classified.append((item, change))
+        return classified
+
+    def commit(self, plan: SyncPlan, processed: List[Tuple[Dict, Any]], complete: bool) -> Optional[str]:
+        """처리한 공고 기록 후 워터마크 갱신 (누락 페이지가 있으면 워터마크 유지)"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for item, processed_item in processed:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO sync_notices"
+                        " (query_key, bid_ntce_no, bid_ntce_ord, bid_ntce_dt, chg_dt, item, updated_at)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (plan.query_key, item.get("bidNtceNo", ""), item.get("bidNtceOrd", ""),
+                         item.get("bidNtceDt", ""), item.get("chgDt") or None,
+                         dumps(processed_item), now)
+                    )
+
+                watermark = plan.watermark
+                if complete:
+                    row = self._conn.execute(
+                        "SELECT MAX(bid_ntce_dt) FROM sync_notices WHERE query_key = ?", (plan.query_key,)
+                    ).fetchone()
+                    watermark = row[0] or watermark
+                covered_begin = plan.window_begin if plan.mode == "full" else None
+                self._conn.execute(
+                    "INSERT INTO sync_watermarks (query_key, covered_begin, last_bid_dt, runs, updated_at)"
+                    " VALUES (?, ?, ?, 1, ?)"
+                    " ON CONFLICT(query_key) DO UPDATE SET"
+                    " covered_begin = COALESCE(?, covered_begin), last_bid_dt = ?,"
+                    " runs = runs + 1, updated_at = ?",
+                    (plan.query_key, plan.window_begin, watermark, now, covered_begin, watermark, now)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return watermark
+
+    def merged_view(self, plan: SyncPlan) -> List[Dict]:
+        """조회 조건에 대해 지금까지 처리한 공고 (공고번호별 최신 차수, 공고일시 내림차순)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT item FROM sync_notices AS n WHERE query_key = ? AND bid_ntce_ord = ("
+                " SELECT MAX(bid_ntce_ord) FROM sync_notices"
+                " WHERE query_key = n.query_key AND bid_ntce_no = n.bid_ntce_no)"
+                " ORDER BY bid_ntce_dt DESC, bid_ntce_no",
+                (plan.query_key,)
+            ).fetchall()
+        return [loads(row[0]) for row in rows]
+
+    def get_stats(self) -> Dict:
+        """조회 조건/공고 수"""
+        with self._lock:
+            queries = self._conn.execute("SELECT COUNT(*) FROM sync_watermarks").fetchone()[0]
+            notices = self._conn.execute("SELECT COUNT(*) FROM sync_notices").fetchone()[0]
+        return {"queries": queries, "notices": notices}
+
+
+# 전역 증분 동기화 저장소
+delta_sync_store = DeltaSyncStore()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검색 단위 첨부파일 다운로드 스케줄러
+모든 공고의 첨부파일을 하나의 작업 큐에 넣고 N개의 워커가 호스트별 동시성 제한 하에 처리
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+from core.config import settings
+
+
+class DownloadScheduler:
+    """작업 큐 기반 다운로드 스케줄러"""
+
+    def __init__(self,
+                 process_func: Callable[[Dict], Awaitable[Dict]],
+                 workers: int = settings.DOWNLOAD_WORKERS,
+                 per_host_limit: int = settings.DOWNLOAD_PER_HOST_LIMIT):
+        self.process_func = process_func
+        self.workers = max(workers, 1)
+        self.per_host_limit = max(per_host_limit, 1)
+        self.jobs: List[Dict] = []
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.stats = {
+            "queued": 0,
+            "completed": 0,
+            "failed": 0,
+            "elapsed_seconds": 0.0
+        }
+
+    def add(self, job: Dict):
+        """다운로드 작업 추가 (job에는 최소 url 키가 필요)"""
+        self.jobs.append(job)
+        self._queue.put_nowait(job)
+        self.stats["queued"] += 1
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """호스트별 동시 다운로드 제한용 세마포어"""
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_semaphores[host]
+
+    async def _worker(self, on_complete: Optional[Callable[[Dict], Awaitable[None]]]):
+        while True:
+            job = await self._queue.get()
+            try:
+                async with self._host_semaphore(job.get("url", "")):
+                    try:
+                        job["result"] = await self.process_func(job)
+                    except Exception as e:
+                        print(f"다운로드 작업 오류 ({job.get('url')}): {e}")
+                        job["result"] = None
+
+                if job["result"] and job["result"].get("downloaded"):
+                    self.stats["completed"] += 1
+                else:
+                    self.stats["failed"] += 1
+
+                if on_complete:
+                    try:
+                        await on_complete(job)
+                    except Exception as e:
+                        print(f"다운로드 완료 콜백 오류: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def run(self, on_complete: Optional[Callable[[Dict], Awaitable[None]]] = None) -> List[Dict]:
+        """큐가 빌 때까지 워커 실행 후 추가 순서대로 작업 반환"""
+        start_time = time.monotonic()
+        worker_count = min(self.workers, self._queue.qsize())
+        tasks = [asyncio.create_task(self._worker(on_complete)) for _ in range(worker_count)]
+        try:
+            await self._queue.join()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self.stats["elapsed_seconds"] = round(time.monotonic() - start_time, 3)
+        return self.jobs
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다운로드 파일 목록 (SQLite)
+downloads 아래 파일을 기록/삭제할 때마다 크기/수정시각/검색 ID/공고번호/종류를 함께 갱신해
+파일 목록, 디스크 사용량, 오래된 파일 조회를 디렉토리 탐색 없이 색인 조회로 처리.
+누락/불일치는 reconcile()로 실제 디렉토리와 맞춤
+"""
+
+import asyncio
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Collection, Dict, Iterable, List, Optional, Tuple, Union
+
+from core.config import settings
+
+# 파일 종류 (downloads 아래 위치 기준)
+#   attachment: attachments/*      json: json/*.json       segment: json/segments/*.ndjson (공고 JSON 세그먼트)
+#   report: reports/*              search: <search_id>/* (검색별 첨부파일/결과)
+FILE_TYPES = ("attachment", "json", "segment", "report", "search")
+
+# 파일 목록 대상이 아닌 내부 디렉토리
+INTERNAL_DIRS = {"blobs", "cache"}
+
+_SEARCH_ID_PATTERN = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+PathLike = Union[str, Path]
+
+# 기록/보정 공통 (최근 접근 시각은 유지하되, 다시 쓴 파일은 수정 시각을 접근으로 간주)
+_UPSERT_SQL = (
+    "INSERT INTO files (path, name, file_type, search_id, bid_ntce_no, size, mtime, recorded_at, accessed_at, inode)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    " ON CONFLICT(path) DO UPDATE SET"
+    " name = excluded.name, file_type = excluded.file_type, search_id = excluded.search_id,"
+    " bid_ntce_no = COALESCE(excluded.bid_ntce_no, files.bid_ntce_no), size = excluded.size,"
+    " mtime = excluded.mtime, recorded_at = excluded.recorded_at,"
+    " accessed_at = MAX(files.accessed_at, excluded.mtime), inode = excluded.inode"
+)
+
+
+def _is_temporary(name: str) -> bool:
+    # 다운로드/링크 중인 임시 파일
+    return name.startswith(".") or name.endswith(".part") or name.endswith(".tmp")
+
+
+class FileManifest:
+    """downloads 디렉토리 파일 목록 색인"""
+
+    def __init__(self, root: Optional[Path] = None, db_path: Optional[Path] = None):
+        self.root = Path(os.path.abspath(root or settings.DOWNLOADS_DIR))
+        db_path = Path(db_path or self.root / "cache" / "file_manifest.db")
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY,"
+            " name TEXT NOT NULL,"
+            " file_type TEXT NOT NULL,"
+            " search_id TEXT,"
+            " bid_ntce_no TEXT,"
+            " size INTEGER NOT NULL,"
+            " mtime REAL NOT NULL,"
+            " recorded_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL DEFAULT 0,"
+            " inode INTEGER);"
+        )
+        # 접근 시각 열이 없던 이전 색인 보완
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(files)")}
+        if "accessed_at" not in columns:
+            self._conn.execute("ALTER TABLE files ADD COLUMN accessed_at REAL NOT NULL DEFAULT 0")
+            self._conn.execute("UPDATE files SET accessed_at = mtime")
+        # inode 열이 없던 이전 색인 보완 (값은 reconcile()에서 채움)
+        if "inode" not in columns:
+            self._conn.execute("ALTER TABLE files ADD COLUMN inode INTEGER")
+        self._conn.executescript(
+            "CREATE INDEX IF NOT EXISTS idx_files_type_mtime ON files(file_type, mtime);"
+            "CREATE INDEX IF NOT EXISTS idx_files_search ON files(search_id, file_type);"
+            "CREATE INDEX IF NOT EXISTS idx_files_bid ON files(bid_ntce_no);"
+            "CREATE INDEX IF NOT EXISTS idx_files_accessed ON files(accessed_at);"
+        )
+        self.stats = {"recorded": 0, "removed": 0, "reconciles": 0, "last_reconcile": None}
+
+    # ------------------------------------------------------------------
+    # 경로 분류
+    # ------------------------------------------------------------------
+
+    def relative_path(self, path: PathLike) -> Optional[str]:
+        """downloads 기준 상대 경로 (밖의 경로면 None)"""
+        try:
+            return Path(os.path.abspath(path)).relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+    def classify(self, relative: str) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+        """상대 경로 → (종류, 검색 ID, 공고번호). 목록 대상이 아니면 None"""
+        parts = relative.split("/")
+        name = parts[-1]
+        if len(parts) < 2 or _is_temporary(name) or parts[0] in INTERNAL_DIRS:
+            return None
+        top = parts[0]
+        search_id = None
+        bid_ntce_no = None
+        if top == "attachments" and len(parts) == 2:
+            file_type = "attachment"
+        elif top == "json" and len(parts) == 2 and name.endswith(".json"):
+            file_type = "json"
+            bid_ntce_no = name[:-len(".json")]
+        elif top == "json" and len(parts) == 3 and parts[1] == "segments" and name.endswith(".ndjson"):
+            file_type = "segment"
+        elif top == "reports" and len(parts) == 2:
+            file_type = "report"
+        elif len(parts) == 2 and top not in ("attachments", "json", "reports"):
+            file_type = "search"
+            search_id = top
+            # 검색별 첨부파일은 "<공고번호>_<파일명>"
+            prefix = name.split("_", 1)[0]
+            if "_" in name and prefix != top:
+                bid_ntce_no = prefix
+        else:
+            return None
+        if search_id is None:
+            match = _SEARCH_ID_PATTERN.search(name)
+            search_id = match.group(0) if match else None
+        return file_type, search_id, bid_ntce_no
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+
+    def _row(self, path: PathLike, bid_ntce_no: Optional[str] = None,
+             stat: Optional[os.stat_result] = None) -> Optional[Tuple]:
+        relative = self.relative_path(path)
+        if relative is None:
+            return None
+        classified = self.classify(relative)
+        if classified is None:
+            return None
+        file_type, search_id, inferred_bid = classified
+        stat = stat or os.stat(path)
+        return (relative, relative.rsplit("/", 1)[-1], file_type, search_id, bid_ntce_no or inferred_bid,
+                stat.st_size, stat.st_mtime, time.time(), stat.st_mtime, stat.st_ino)
+
+    def _upsert(self, rows: List[Tuple]):
+        with self._lock:
+            self._conn.executemany(_UPSERT_SQL, rows)
+        self.stats["recorded"] += len(rows)
+
+    def record(self, path: PathLike, bid_ntce_no: Optional[str] = None):
+        """파일 기록/갱신 (쓰기 직후 호출, 종류/검색 ID는 위치로 판단)"""
+        try:
+            row = self._row(path, bid_ntce_no)
+        except FileNotFoundError:
+            self.remove(path)
+            return
+        if row:
+            self._upsert([row])
+
+    def record_many(self, paths: Iterable[PathLike]):
+        rows = []
+        for path in paths:
+            try:
+                row = self._row(path)
+            except FileNotFoundError:
+                continue
+            if row:
+                rows.append(row)
+        self._upsert(rows)
+
+    def remove(self, path: PathLike):
+        """파일 삭제 반영"""
+        relative = self.relative_path(path)
+        if relative is None:
+            return
+        with self._lock:
+            deleted = self._conn.execute("DELETE FROM files WHERE path = ?", (relative,)).rowcount
+        self.stats["removed"] += deleted
+
+    def touch(self, paths: Iterable[PathLike]):
+        """파일을 내려받거나 연 시각 기록 (저장 공간 정리 시 오래 안 쓴 파일부터 삭제)"""
+        now = time.time()
+        relatives = [(now, relative) for relative in map(self.relative_path, paths) if relative]
+        if not relatives:
+            return
+        with self._lock:
+            self._conn.executemany("UPDATE files SET accessed_at = ? WHERE path = ?", relatives)
+
+    def absolute_path(self, relative: str) -> Path:
+        return self.root / relative
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def list_files(self, file_type: str, search_id: Optional[str] = None) -> List[Dict]:
+        """종류별 파일 목록 (수정시각 내림차순)"""
+        query = "SELECT path, name, size, mtime, search_id, bid_ntce_no FROM files WHERE file_type = ?"
+        args: List = [file_type]
+        if search_id:
+            query += " AND search_id = ?"
+            args.append(search_id)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY mtime DESC", args).fetchall()
+        return [
+            {"path": path, "filename": name, "size": size, "modified": mtime,
+             "search_id": row_search_id, "bid_ntce_no": bid_ntce_no}
+            for path, name, size, mtime, row_search_id, bid_ntce_no in rows
+        ]
+
+    def usage(self) -> Dict[str, Dict[str, int]]:
+        """종류별 용량/파일 수"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT file_type, COALESCE(SUM(size), 0), COUNT(*) FROM files GROUP BY file_type"
+            ).fetchall()
+        usage = {file_type: {"size_bytes": 0, "file_count": 0} for file_type in FILE_TYPES}
+        for file_type, size, count in rows:
+            usage[file_type] = {"size_bytes": size, "file_count": count}
+        return usage
+
+    def total_size(self) -> int:
+        """파일 크기 합계 (하드링크는 링크마다 중복 계산)"""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM files").fetchone()[0]
+
+    def physical_size(self, exclude_inodes: Collection[int] = ()) -> int:
+        """실제 디스크 사용량 (같은 inode는 한 번만, exclude_inodes는 제외)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT inode, MAX(size) FROM files GROUP BY COALESCE(inode, path)"
+            ).fetchall()
+        return sum(size for inode, size in rows if inode is None or inode not in exclude_inodes)
+
+    def search_usage(self) -> Dict[str, int]:
+        """검색 ID별 검색 디렉토리 용량"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT search_id, SUM(size) FROM files WHERE file_type = 'search' GROUP BY search_id"
+            ).fetchall()
+        return dict(rows)
+
+    def least_recently_accessed(self, file_types: Iterable[str], accessed_before: float,
+                                search_id: Optional[str] = None) -> List[Tuple[str, Optional[str], int]]:
+        """접근 시각 오래된 순 (상대 경로, 검색 ID, 크기)"""
+        file_types = list(file_types)
+        query = (f"SELECT path, search_id, size FROM files"
+                 f" WHERE file_type IN ({','.join('?' * len(file_types))}) AND accessed_at < ?")
+        args: List = [*file_types, accessed_before]
+        if search_id:
+            query += " AND search_id = ?"
+            args.append(search_id)
+        with self._lock:
+            return self._conn.execute(query + " ORDER BY accessed_at", args).fetchall()
+
+    def older_than(self, file_types: Iterable[str], cutoff: float) -> List[str]:
+        """수정시각이 cutoff 이전인 파일 (상대 경로)"""
+        file_types = list(file_types)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT path FROM files WHERE file_type IN ({','.join('?' * len(file_types))}) AND mtime < ?",
+                (*file_types, cutoff)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    # ------------------------------------------------------------------
+    # 실제 디렉토리와 맞추기
+    # ------------------------------------------------------------------
+
+    def _walk(self) -> Dict[str, os.stat_result]:
+        found = {}
+        stack = [str(self.root)]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if directory == str(self.root) and entry.name in INTERNAL_DIRS:
+                        continue
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    found[entry.path] = entry.stat(follow_symlinks=False)
+        return found
+
+    def reconcile(self) -> Dict:
+        """디렉토리를 한 번 훑어 누락된 파일 추가, 바뀐 파일 갱신, 사라진 파일 제거"""
+        started = time.time()
+        found = self._walk()
+        with self._lock:
+            known = {
+                path: (size, mtime, inode)
+                for path, size, mtime, inode in self._conn.execute("SELECT path, size, mtime, inode FROM files")
+            }
+
+        rows = []
+        seen = set()
+        for path, stat in found.items():
+            row = self._row(path, stat=stat)
+            if row is None:
+                continue
+            seen.add(row[0])
+            if known.get(row[0]) != (stat.st_size, stat.st_mtime, stat.st_ino):
+                rows.append(row)
+        missing = [path for path in known if path not in seen]
+
+        added = sum(1 for row in rows if row[0] not in known)
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(_UPSERT_SQL, rows)
+                self._conn.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in missing])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        self.stats["reconciles"] += 1
+        self.stats["last_reconcile"] = time.time()
+        return {
+            "scanned": len(found),
+            "added": added,
+            "updated": len(rows) - added,
+            "removed": len(missing),
+            "elapsed_ms": round((time.time() - started) * 1000, 1)
+        }
+
+    async def reconcile_periodically(self, interval_seconds: float):
+        """주기적으로 reconcile (시작 직후 한 번 포함, 취소될 때까지)"""
+        while True:
+            try:
+                result = await asyncio.to_thread(self.reconcile)
+                if result["added"] or result["removed"]:
+                    print(f"파일 목록 보정: 추가 {result['added']}, 갱신 {result['updated']}, 제거 {result['removed']}")
+            except Exception as e:
+                print(f"파일 목록 보정 오류: {e}")
+            await asyncio.sleep(interval_seconds)
+
+    def get_stats(self) -> Dict:
+        stats = dict(self.stats)
+        with self._lock:
+            stats["files"] = self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        return stats
+
+
+# 전역 다운로드 파일 목록
+file_manifest = FileManifest()
@@ -19,14 +19,29 @@ from urllib.parse import quote, unquote
 import uuid
 import time
 
-# Windows HWP 파일 처리용 - 제거됨 (다운로드만 수행)
-# try:
-#     import win32com.client as win32
-#     import pythoncom
-#     HWP_AVAILABLE = True
-# except ImportError:
-#     HWP_AVAILABLE = False
-HWP_AVAILABLE = False  # HWP 텍스트 분석 기능 비활성화
+from core.config import settings
+from core.file_manifest import FileManifest, file_manifest as default_file_manifest
+from core.blob_store import BlobStore, blob_store as default_blob_store
+from core.http_pool import HTTPConnectionPool, http_pool as default_http_pool
+from core.pipeline import PipelineStage, StagedPipeline
+from core.query_cache import UpstreamQueryCache, query_cache as default_query_cache
+from core.record_store import RecordStore, record_store as default_record_store
+from core.rate_limiter import APIRateLimiter, rate_limiter as default_rate_limiter
+from core.result_cache import SearchResultCache
+from core import text_extractor as text_extraction
+from core.text_extractor import OLEFILE_AVAILABLE, TextExtractor, text_extractor as default_text_extractor
+from core.attachment_index import AttachmentIndex, attachment_index as default_attachment_index, build_snippets, find_matches
+
+# HWP 5.0 텍스트 추출은 olefile 필요 (HWPX는 표준 라이브러리만 사용)
+HWP_AVAILABLE = OLEFILE_AVAILABLE
+
+# 목록 응답에 모두 있으면 상세 조회를 생략하는 필드 (기본 정보, 금액, 담당자, 첨부파일)
+DETAIL_REQUIRED_FIELDS = (
+    ['bidNtceNo', 'bidNtceNm', 'ntceInsttNm', 'bidNtceDt', 'bidClseDt', 'opengDt',
+     'asignBdgtAmt', 'presmptPrce', 'ntceInsttOfclNm', 'ntceInsttOfclTelNo', 'bidNtceDtlUrl']
+    + [f'ntceSpecDocUrl{i}' for i in range(1, 11)]
+    + [f'ntceSpecFileNm{i}' for i in range(1, 11)]
+)
 
 class SearchProgress:
     """검색 진행상황 클래스"""
@@ -37,6 +52,20 @@ class SearchProgress:
         self.current_step = ""
         self.errors = []
         self.start_time = datetime.now()
+        # 처리 완료된 공고 (작업 진행 중 부분 결과 조회용)
+        self.partial_results = []
+        # 첨부파일 다운로드 현황
+        self.files_total = 0
+        self.files_downloaded = 0
+        self.files_failed = 0
+        self.bytes_downloaded = 0
+        # 진행 이벤트 수신자 (event, data) - SSE 브로드캐스터 연결용
+        self.event_sink: Optional[Callable[[str, Dict], None]] = None
+        # 파이프라인 단계별 현황 (목록 → 상세 → 저장 → 첨부파일)
+        self.stages: Dict[str, Dict] = {}
+        # 상세 조회 API 호출 수 / 목록 응답으로 대체해 생략한 호출 수
+        self.detail_calls = 0
+        self.detail_calls_avoided = 0
         
     def to_dict(self):
         return {
@@ -45,16 +74,37 @@ class SearchProgress:
             "current_bid": self.current_bid,
             "current_step": self.current_step,
             "progress_percent": (self.processed_bids / self.total_bids * 100) if self.total_bids > 0 else 0,
+            "files_total": self.files_total,
+            "files_downloaded": self.files_downloaded,
+            "files_failed": self.files_failed,
+            "bytes_downloaded": self.bytes_downloaded,
+            "stages": self.stages,
+            "detail_calls": self.detail_calls,
+            "detail_calls_avoided": self.detail_calls_avoided,
             "errors": self.errors,
             "elapsed_time": (datetime.now() - self.start_time).seconds
         }
+    
+    def emit(self, event: str, data: Optional[Dict] = None):
+        """진행 이벤트 전달 (현재 진행 상황 포함)"""
+        if self.event_sink:
+            payload = dict(data or {})
+            payload["progress"] = self.to_dict()
+            self.event_sink(event, payload)
 
 class G2BWebSearchSystem:
     """나라장터 입찰공고 검색 시스템 (웹 버전)"""
     
-    def __init__(self, base_dir: Path):
-        self.service_key = "0WB5pvvWESBosIfBKdnHwsHyTGAJUnJXMcuomkHoPLQGW4ZB3GZ2Ooay73OlNQGfZBY+6vDpPfCJxYhMnLMVgw=="
-        self.base_url = "http://apis.data.go.kr/1230000/ad/BidPublicInfoService"
+    def __init__(self, base_dir: Path, http_pool: Optional[HTTPConnectionPool] = None,
+                 blob_store: Optional[BlobStore] = None,
+                 query_cache: Optional[UpstreamQueryCache] = None,
+                 rate_limiter: Optional[APIRateLimiter] = None,
+                 text_extractor: Optional[TextExtractor] = None,
+                 attachment_index: Optional[AttachmentIndex] = None,
+                 record_store: Optional[RecordStore] = None,
+                 file_manifest: Optional[FileManifest] = None):
+        self.service_key = settings.G2B_SERVICE_KEY
+        self.base_url = settings.G2B_AD_BASE_URL
         
         # 디렉토리 설정
         self.base_dir = base_dir
@@ -65,9 +115,31 @@ class G2BWebSearchSystem:
         for directory in [self.json_dir, self.attachment_dir, self.reports_dir]:
             directory.mkdir(parents=True, exist_ok=True)
         
-        # 검색 상태 저장
-        self.search_status: Dict[str, SearchProgress] = {}
-        self.search_results: Dict[str, Any] = {}
+        # 검색 상태 저장 (진행 상태는 메모리 전용, 결과는 SQLite에도 보관)
+        self.search_status = SearchResultCache("web_search_status", persist=False)
+        self.search_results = SearchResultCache("web_search_results")
+        
+        # 공유 커넥션 풀, 첨부파일 저장소, API 응답 캐시
+        self.http_pool = http_pool or default_http_pool
+        self.blob_store = blob_store or default_blob_store
+        self.query_cache = query_cache or default_query_cache
+        self.rate_limiter = rate_limiter or default_rate_limiter
+        self.text_extractor = text_extractor or default_text_extractor
+        self.attachment_index = attachment_index or default_attachment_index
+        self.record_store = record_store or default_record_store
+        self.file_manifest = file_manifest or default_file_manifest
+    
+    async def _api_get(self, url: str, params: Dict) -> Dict:
+        """API 호출 (응답 캐시 경유, 동일 요청 병합, 전역 호출 제한 및 백오프 재시도)"""
+        async def request() -> Dict:
+            session = await self.http_pool.get_session()
+            async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                print(f"[DEBUG] API 응답 상태: {response.status}")
+                return await self.rate_limiter.read_response(response)
+        
+        return await self.query_cache.get_or_fetch(
+            url, params, lambda: self.rate_limiter.call(request, max_attempts=3)
+        )
     
     async def search_bid_list_async(self, keyword: str, start_date: str, end_date: str, num_rows: int = 100) -> List[Dict]:
         """비동기 입찰공고 목록 검색"""
@@ -88,39 +160,35 @@ class G2BWebSearchSystem:
             print(f"[DEBUG] API 요청 URL: {url}")
             print(f"[DEBUG] API 파라미터: {params}")
             
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                async with session.get(url, params=params) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    print(f"[DEBUG] API 응답 상태: {response.status}")
-                    print(f"[DEBUG] API 응답 헤더: {data.get('response', {}).get('header', {})}")
-                    
-                    if data.get('response', {}).get('header', {}).get('resultCode') == '00':
-                        body = data.get('response', {}).get('body', {})
-                        items = body.get('items', [])
-                        total_count = body.get('totalCount', 0)                       
-                        print(f"[DEBUG] API 응답 성공")
-                        print(f"[DEBUG] totalCount: {total_count}")
-                        print(f"[DEBUG] items 타입: {type(items)}")
-                        
-                        if isinstance(items, list) and len(items) > 0:
-                            print(f"[DEBUG] 검색된 공고 수: {len(items)}")
-                            # 첫 번째 항목의 키를 출력하여 구조 확인
-                            if items:
-                                print(f"[DEBUG] 첫 번째 항목 키: {list(items[0].keys())}")                            
-                            return items
-                        elif total_count == 0:
-                            print(f"[DEBUG] 검색 조건에 맞는 공고가 없습니다.")
-                            return []
-                        else:
-                            print(f"[DEBUG] 예상치 못한 items 구조: {items}")
-                            return []
-                    else:
-                        result_code = data.get('response', {}).get('header', {}).get('resultCode', 'Unknown')
-                        result_msg = data.get('response', {}).get('header', {}).get('resultMsg', '알 수 없는 오류')
-                        print(f"[DEBUG] API 오류 - 코드: {result_code}, 메시지: {result_msg}")
-                        return []
-                    
+            data = await self._api_get(url, params)
+            print(f"[DEBUG] API 응답 헤더: {data.get('response', {}).get('header', {})}")
+            
+            if data.get('response', {}).get('header', {}).get('resultCode') == '00':
+                body = data.get('response', {}).get('body', {})
+                items = body.get('items', [])
+                total_count = body.get('totalCount', 0)                       
+                print(f"[DEBUG] API 응답 성공")
+                print(f"[DEBUG] totalCount: {total_count}")
+                print(f"[DEBUG] items 타입: {type(items)}")
+                
+                if isinstance(items, list) and len(items) > 0:
+                    print(f"[DEBUG] 검색된 공고 수: {len(items)}")
+                    # 첫 번째 항목의 키를 출력하여 구조 확인
+                    if items:
+                        print(f"[DEBUG] 첫 번째 항목 키: {list(items[0].keys())}")                            
+                    return items
+                elif total_count == 0:
+                    print(f"[DEBUG] 검색 조건에 맞는 공고가 없습니다.")
+                    return []
+                else:
+                    print(f"[DEBUG] 예상치 못한 items 구조: {items}")
+                    return []
+            else:
+                result_code = data.get('response', {}).get('header', {}).get('resultCode', 'Unknown')
+                result_msg = data.get('response', {}).get('header', {}).get('resultMsg', '알 수 없는 오류')
+                print(f"[DEBUG] API 오류 - 코드: {result_code}, 메시지: {result_msg}")
+                return []
+            
         except Exception as e:
             print(f"API 호출 오류: {e}")
             return []
@@ -138,44 +206,49 @@ class G2BWebSearchSystem:
         }
         
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-                async with session.get(url, params=params) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    
-                    print(f"[DEBUG] 상세조회 API 응답 상태: {response.status}")
-                    print(f"[DEBUG] 상세조회 API 응답 헤더: {data.get('response', {}).get('header', {})}")
-                    if data.get('response', {}).get('header', {}).get('resultCode') == '00':
-                        body = data.get('response', {}).get('body', {})
-                        items = body.get('items', [])
-                        
-                        print(f"[DEBUG] 상세조회 items 타입: {type(items)}")
-                        print(f"[DEBUG] 상세조회 items 길이: {len(items) if isinstance(items, list) else 'Not a list'}")
-                        
-                        # 실제 JSON 구조: response.body.items는 배열
-                        if isinstance(items, list) and len(items) > 0:
-                            print(f"[DEBUG] 상세조회 성공 - 첫 번째 항목 반환")
-                            return items[0]
-                        else:
-                            print(f"[DEBUG] 상세조회 결과 없음 또는 빈 배열")
-                            return {}
-                    else:
-                        result_code = data.get('response', {}).get('header', {}).get('resultCode', 'Unknown')
-                        result_msg = data.get('response', {}).get('header', {}).get('resultMsg', '알 수 없는 오류')
-                        print(f"[DEBUG] 상세조회 API 오류 - 코드: {result_code}, 메시지: {result_msg}")
-                        return {}
-                    
+            data = await self._api_get(url, params)
+            
+            print(f"[DEBUG] 상세조회 API 응답 헤더: {data.get('response', {}).get('header', {})}")
+            if data.get('response', {}).get('header', {}).get('resultCode') == '00':
+                body = data.get('response', {}).get('body', {})
+                items = body.get('items', [])
+                
+                print(f"[DEBUG] 상세조회 items 타입: {type(items)}")
+                print(f"[DEBUG] 상세조회 items 길이: {len(items) if isinstance(items, list) else 'Not a list'}")
+                
+                # 실제 JSON 구조: response.body.items는 배열
+                if isinstance(items, list) and len(items) > 0:
+                    print(f"[DEBUG] 상세조회 성공 - 첫 번째 항목 반환")
+                    return items[0]
+                else:
+                    print(f"[DEBUG] 상세조회 결과 없음 또는 빈 배열")
+                    return {}
+            else:
+                result_code = data.get('response', {}).get('header', {}).get('resultCode', 'Unknown')
+                result_msg = data.get('response', {}).get('header', {}).get('resultMsg', '알 수 없는 오류')
+                print(f"[DEBUG] 상세조회 API 오류 - 코드: {result_code}, 메시지: {result_msg}")
+                return {}
+            
         except Exception as e:
             print(f"상세 조회 오류: {e}")
             return {}
     
+    @staticmethod
+    def is_list_item_complete(bid_item: Dict) -> bool:
+        """목록 항목에 상세 조회 없이 처리할 필드가 모두 있는지 확인"""
+        if any(field not in bid_item for field in DETAIL_REQUIRED_FIELDS):
+            return False
+        # 파일명만 있고 URL이 빠진 첨부파일은 상세 조회로 보완
+        return all(
+            bid_item.get(f'ntceSpecDocUrl{i}') or not bid_item.get(f'ntceSpecFileNm{i}')
+            for i in range(1, 11)
+        )
+    
     async def save_bid_json_async(self, bid_data: Dict, bid_no: str) -> Optional[str]:
-        """비동기 JSON 저장"""
-        filepath = self.json_dir / f"{bid_no}.json"
+        """공고 JSON 저장 (세그먼트 저장소에 group commit, /api/download/json/{bid_no}.json 으로 조회)"""
         try:
-            async with aiofiles.open(filepath, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(bid_data, ensure_ascii=False, indent=4))
-            return str(filepath)
+            await self.record_store.put(bid_no, bid_data)
+            return str(self.json_dir / f"{bid_no}.json")
         except Exception as e:
             print(f"JSON 저장 오류: {e}")
             return None
@@ -193,62 +266,73 @@ class G2BWebSearchSystem:
         filepath = self.attachment_dir / safe_filename
         
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=120)) as session:
-                async with session.get(url) as response:
+            # 이미 받은 URL이면 다운로드 없이 연결
+            blob = await asyncio.to_thread(self.blob_store.lookup_url, url)
+            if not blob or not await asyncio.to_thread(self.blob_store.link_to, blob["sha256"], filepath):
+                session = await self.http_pool.get_session()
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=120)) as response:
                     response.raise_for_status()
-                    
-                    async with aiofiles.open(filepath, 'wb') as f:
-                        async for chunk in response.content.iter_chunked(8192):
-                            await f.write(chunk)
+                    # 청크 단위 스트리밍 저장 (크기 제한 적용)
+                    blob = await self.blob_store.store_response(response, url)
+                if not await asyncio.to_thread(self.blob_store.link_to, blob["sha256"], filepath):
+                    raise FileNotFoundError(f"저장한 원본이 사라졌습니다: {blob['sha256']}")
             
+            await asyncio.to_thread(self.file_manifest.record, filepath)
             return str(filepath)
             
         except Exception as e:
             print(f"파일 다운로드 오류 ({filename}): {e}")
             return None
     
-    # HWP 텍스트 추출 기능 제거됨 (다운로드만 수행)
-    # def extract_text_from_hwp(self, hwp_path: str) -> str:
-    #     """HWP 파일 텍스트 추출 (동기) - 제거됨"""
-    #     return ""
+    def extract_text_from_hwp(self, hwp_path: str) -> str:
+        """HWP 파일 텍스트 추출 (동기, OLE BodyText 섹션)"""
+        return text_extraction.extract_text_from_hwp(hwp_path)
     
-    # def extract_text_from_hwpx(self, hwpx_path: str) -> str:
-    #     """HWPX 파일 텍스트 추출 - 제거됨"""
-    #     return ""
+    def extract_text_from_hwpx(self, hwpx_path: str) -> str:
+        """HWPX 파일 텍스트 추출 (동기, section XML 스트리밍)"""
+        return text_extraction.extract_text_from_hwpx(hwpx_path)
     
-    # def search_keyword_in_text(self, text: str, keyword: str, context_chars: int = 100) -> List[str]:
-    #     """텍스트에서 키워드 검색 및 스니펫 생성 - 제거됨"""    #     return []
+    def search_keyword_in_text(self, text: str, keyword: str,
+                               context_chars: int = settings.SNIPPET_CONTEXT_CHARS) -> List[str]:
+        """텍스트에서 키워드 검색 및 스니펫 생성 (공백/대소문자 무시, 겹치는 구간은 병합)"""
+        return [snippet['text'] for snippet in build_snippets(text, find_matches(text, keyword), context_chars)]
     
     async def process_bid_attachments_async(self, bid_detail: Dict, keyword: str, progress: SearchProgress) -> Dict:
-        """비동기 첨부파일 처리 (다운로드만)"""
+        """비동기 첨부파일 처리 (다운로드만, 공고 내 첨부파일은 동시 다운로드)"""
         attachment_results = {}
         
         # 첨부파일 처리 (최대 10개)
+        files = []
         for i in range(1, 11):
             file_url_key = f"ntceSpecDocUrl{i}"
             file_name_key = f"ntceSpecFileNm{i}"
             
-            file_url = bid_detail.get(file_url_key)
+            file_url = settings.rewrite_attachment_url(bid_detail.get(file_url_key))
             file_name = bid_detail.get(file_name_key)
             
             if file_name and file_url:
-                progress.current_step = f"첨부파일 다운로드: {file_name}"
+                files.append((file_url, file_name))
+        
+        if files:
+            progress.current_step = f"첨부파일 다운로드: {', '.join(name for _, name in files)}"
+        downloaded_paths = await asyncio.gather(
+            *[self.download_attachment_async(file_url, file_name) for file_url, file_name in files]
+        )
+        
+        for (file_url, file_name), downloaded_path in zip(files, downloaded_paths):
+            if downloaded_path:
+                file_ext = os.path.splitext(file_name.lower())[1]
                 
-                downloaded_path = await self.download_attachment_async(file_url, file_name)
+                # 파일 정보만 저장 (내용 분석 없이)
+                attachment_results[file_name] = {
+                    'path': downloaded_path,
+                    'file_size': os.path.getsize(downloaded_path),
+                    'file_extension': file_ext,
+                    'download_url': f'/downloads/attachments/{os.path.basename(downloaded_path)}',
+                    'downloaded': True
+                }
                 
-                if downloaded_path:
-                    file_ext = os.path.splitext(file_name.lower())[1]
-                    
-                    # 파일 정보만 저장 (내용 분석 없이)
-                    attachment_results[file_name] = {
-                        'path': downloaded_path,
-                        'file_size': os.path.getsize(downloaded_path),
-                        'file_extension': file_ext,
-                        'download_url': f'/downloads/attachments/{os.path.basename(downloaded_path)}',
-                        'downloaded': True
-                    }
-                    
-                    print(f"[DEBUG] 첨부파일 다운로드 완료: {file_name} ({os.path.getsize(downloaded_path)} bytes)")
+                print(f"[DEBUG] 첨부파일 다운로드 완료: {file_name} ({os.path.getsize(downloaded_path)} bytes)")
         
         return attachment_results
     
@@ -267,14 +351,101 @@ class G2BWebSearchSystem:
         try:
             async with aiofiles.open(report_path, 'w', encoding='utf-8') as f:
                 await f.write(json.dumps(report_data, ensure_ascii=False, indent=4))
+            await asyncio.to_thread(self.file_manifest.record, report_path)
             return str(report_path)
         except Exception as e:
             print(f"보고서 저장 오류: {e}")
             return ""
     
+    def build_search_pipeline(self, keyword: str, progress: SearchProgress,
+                              progress_callback: Optional[Callable] = None) -> StagedPipeline:
+        """공고 처리 파이프라인 구성 (상세 조회 → JSON 저장 → 첨부파일 → 텍스트 추출, 단계별 워커 수 제한)"""
+        async def fetch_detail(entry: Dict) -> Optional[Dict]:
+            bid_item = entry['item']
+            bid_ntce_no = bid_item['bidNtceNo']
+            progress.current_bid = f"{bid_ntce_no} - {bid_item.get('bidNtceNm', '')}"
+            
+            # 목록 응답에 필요한 필드가 모두 있으면 상세 조회 생략
+            if self.is_list_item_complete(bid_item):
+                progress.detail_calls_avoided += 1
+                entry['detail'] = bid_item
+                return entry
+            
+            # 부족한 항목만 상세 조회 (detail 단계 워커 수만큼 동시 실행)
+            progress.current_step = "상세 정보 조회 중..."
+            progress.detail_calls += 1
+            bid_detail = await self.get_bid_detail_async(bid_ntce_no, bid_item.get('bidNtceOrd', '01'))
+            if not bid_detail:
+                progress.errors.append(f"상세 조회 실패: {bid_ntce_no}")
+                progress.processed_bids += 1
+                return None
+            entry['detail'] = bid_detail
+            return entry
+        
+        async def persist(entry: Dict) -> Dict:
+            await self.save_bid_json_async(entry['detail'], entry['item']['bidNtceNo'])
+            return entry
+        
+        async def download(entry: Dict) -> Optional[Dict]:
+            try:
+                attachment_results = await self.process_bid_attachments_async(entry['detail'], keyword, progress)
+            finally:
+                progress.processed_bids += 1
+            if not attachment_results:
+                return None
+            return {
+                'index': entry['index'],
+                'bid_info': entry['detail'],
+                'attachments': attachment_results,
+                'processed_date': datetime.now().isoformat()
+            }
+        
+        async def extract(entry: Dict) -> Dict:
+            # 프로세스 풀에서 본문 텍스트 추출 (파일 해시 기준 캐시)
+            for file_name, attachment in entry['attachments'].items():
+                if not self.text_extractor.is_extractable(file_name):
+                    continue
+                # 첨부파일 하나의 추출/색인 실패가 공고 전체를 잃지 않도록 파일 단위로 처리
+                try:
+                    extracted = await self.text_extractor.extract(attachment['path'])
+                    if not extracted['error']:
+                        # 본문 역색인에 추가 (같은 blob은 공고 참조만 기록)
+                        await asyncio.to_thread(
+                            self.attachment_index.add_document, extracted['sha256'], extracted['text'],
+                            entry['bid_info'].get('bidNtceNo', ''), entry['bid_info'].get('bidNtceOrd', ''), file_name
+                        )
+                except Exception as e:
+                    extracted = {'text': '', 'error': str(e)}
+                attachment['text_extracted'] = not extracted['error']
+                attachment['text_chars'] = len(extracted['text'])
+                if extracted['error']:
+                    attachment['text_error'] = extracted['error']
+                    continue
+                # 공고명 검색어가 본문에도 있으면 스니펫 기록
+                snippets = self.search_keyword_in_text(extracted['text'], keyword)
+                if snippets:
+                    attachment['keyword_snippets'] = snippets[:3]
+            return entry
+        
+        async def notify():
+            if progress_callback:
+                await progress_callback(progress.to_dict())
+        
+        queue_size = settings.PIPELINE_QUEUE_SIZE
+        stages = [
+            PipelineStage("detail", fetch_detail, settings.PIPELINE_DETAIL_CONCURRENCY, queue_size),
+            PipelineStage("persist", persist, settings.PIPELINE_PERSIST_CONCURRENCY, queue_size),
+            PipelineStage("attachments", download, settings.PIPELINE_ATTACHMENT_CONCURRENCY, queue_size)
+        ]
+        if settings.TEXT_EXTRACTION_ENABLED:
+            stages.append(PipelineStage("extract", extract, self.text_extractor.workers, queue_size))
+        pipeline = StagedPipeline(stages, source_name="list", on_update=notify)
+        progress.stages = pipeline.stats
+        return pipeline
+    
     async def run_search_async(self, keyword: str, start_date: str, end_date: str, 
                              progress_callback: Optional[Callable] = None) -> str:
-        """비동기 전체 검색 프로세스"""
+        """비동기 전체 검색 프로세스 (목록 → 상세 → 저장 → 첨부파일 → 텍스트 추출 단계별 동시 처리)"""
         search_id = str(uuid.uuid4())
         progress = SearchProgress()
         
@@ -286,55 +457,30 @@ class G2BWebSearchSystem:
             if progress_callback:
                 await progress_callback(progress.to_dict())
             
-            bid_list = await self.search_bid_list_async(keyword, start_date, end_date)
-            if not bid_list:
+            async def list_bids():
+                bid_list = await self.search_bid_list_async(keyword, start_date, end_date)
+                progress.total_bids = len(bid_list)
+                for index, bid_item in enumerate(bid_list):
+                    if bid_item.get('bidNtceNo'):
+                        yield {'index': index, 'item': bid_item}
+                    else:
+                        progress.processed_bids += 1
+            
+            # 2~4단계: 공고별 처리 (가장 느린 단계의 처리량에 맞춰 진행)
+            pipeline = self.build_search_pipeline(keyword, progress, progress_callback)
+            completed = await pipeline.run(list_bids())
+            progress.errors.extend(pipeline.errors)
+            
+            if progress.total_bids == 0:
                 progress.current_step = "검색 결과 없음"
                 progress.errors.append("검색된 공고가 없습니다")
                 if progress_callback:
                     await progress_callback(progress.to_dict())
                 return search_id
             
-            progress.total_bids = len(bid_list)
-            all_results = []
-            
-            # 각 공고 처리
-            for idx, bid_item in enumerate(bid_list):
-                bid_ntce_no = bid_item.get('bidNtceNo')
-                bid_ntce_ord = bid_item.get('bidNtceOrd', '01')
-                
-                if not bid_ntce_no:
-                    continue
-                
-                progress.processed_bids = idx + 1
-                progress.current_bid = f"{bid_ntce_no} - {bid_item.get('bidNtceNm', '')}"
-                progress.current_step = "상세 정보 조회 중..."
-                
-                if progress_callback:
-                    await progress_callback(progress.to_dict())
-                
-                # 상세 정보 조회
-                bid_detail = await self.get_bid_detail_async(bid_ntce_no, bid_ntce_ord)
-                if not bid_detail:
-                    progress.errors.append(f"상세 조회 실패: {bid_ntce_no}")
-                    continue
-                
-                # JSON 저장
-                await self.save_bid_json_async(bid_detail, bid_ntce_no)
-                
-                # 첨부파일 처리
-                attachment_results = await self.process_bid_attachments_async(bid_detail, keyword, progress)
-                
-                # 결과 수집
-                if attachment_results:
-                    result_entry = {
-                        'bid_info': bid_detail,
-                        'attachments': attachment_results,
-                        'processed_date': datetime.now().isoformat()
-                    }
-                    all_results.append(result_entry)
-                
-                # API 호출 제한
-                await asyncio.sleep(0.5)
+            # 목록 순서대로 정렬
+            completed.sort(key=lambda entry: entry['index'])
+            all_results = [{key: value for key, value in entry.items() if key != 'index'} for entry in completed]
             
             # 최종 보고서 생성
             progress.current_step = "보고서 생성 중..."
@@ -349,7 +495,9 @@ class G2BWebSearchSystem:
                 'report_path': report_path,
                 'keyword': keyword,
                 'search_date': datetime.now().isoformat(),
-                'total_found': len(all_results)
+                'total_found': len(all_results),
+                'detail_calls': progress.detail_calls,
+                'detail_calls_avoided': progress.detail_calls_avoided
             }
             
             progress.current_step = "완료"
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공유 HTTP 커넥션 풀
+나라장터 API 및 첨부파일 요청이 하나의 aiohttp 세션(keep-alive, DNS 캐시)을 재사용
+"""
+
+import aiohttp
+from typing import Dict, Optional
+
+from core.config import settings
+
+
+class HTTPConnectionPool:
+    """애플리케이션 수명 동안 유지되는 aiohttp 세션 관리자"""
+
+    def __init__(self,
+                 limit: int = settings.HTTP_POOL_LIMIT,
+                 limit_per_host: int = settings.HTTP_POOL_LIMIT_PER_HOST,
+                 keepalive_timeout: float = settings.HTTP_KEEPALIVE_TIMEOUT,
+                 dns_cache_ttl: int = settings.HTTP_DNS_CACHE_TTL):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # 커넥션 재사용 통계
+        self.stats = {
+            "requests": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+            "sessions_opened": 0
+        }
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        """커넥션 생성/재사용 카운터용 트레이스 설정"""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            self.stats["requests"] += 1
+
+        async def on_connection_create_end(session, ctx, params):
+            self.stats["connections_created"] += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self.stats["connections_reused"] += 1
+
+        async def on_dns_cache_hit(session, ctx, params):
+            self.stats["dns_cache_hits"] += 1
+
+        async def on_dns_cache_miss(session, ctx, params):
+            self.stats["dns_cache_misses"] += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    async def start(self) -> aiohttp.ClientSession:
+        """세션 생성 (이미 열려 있으면 그대로 반환)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                trace_configs=[self._build_trace_config()]
+            )
+            self.stats["sessions_opened"] += 1
+        return self._session
+
+    async def close(self):
+        """세션 종료"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """공유 세션 조회 (lifespan 밖에서 호출되면 지연 생성)"""
+        return await self.start()
+
+    @property
+    def is_open(self) -> bool:
+        return self._session is not None and not self._session.closed
+
+    def get_stats(self) -> Dict:
+        """커넥션 재사용 통계"""
+        stats = dict(self.stats)
+        requests = stats["connections_created"] + stats["connections_reused"]
+        stats["reuse_ratio"] = round(stats["connections_reused"] / requests, 4) if requests else 0.0
+        stats["is_open"] = self.is_open
+        stats["limit"] = self.limit
+        stats["limit_per_host"] = self.limit_per_host
+        return stats
+
+
+# 전역 커넥션 풀 인스턴스 (main.py lifespan에서 열고 닫음)
+http_pool = HTTPConnectionPool()
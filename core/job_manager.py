@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+백그라운드 검색 작업 관리
+POST /api/search 요청은 search_id만 즉시 반환하고 실제 검색/다운로드는 관리되는 태스크로 실행
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from core.config import settings
+from core.g2b_search import SearchProgress
+from core.progress_events import ProgressBroadcaster, progress_broadcaster as default_broadcaster
+
+
+class SearchJob:
+    """백그라운드 검색 작업 상태"""
+
+    def __init__(self, search_id: str, search_params: Dict):
+        self.search_id = search_id
+        self.search_params = search_params
+        self.status = "pending"  # pending / running / completed / failed / cancelled
+        self.progress = SearchProgress()
+        self.error: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+        self.created_at = datetime.now()
+        self.finished_at: Optional[datetime] = None
+
+    @property
+    def is_complete(self) -> bool:
+        return self.status in ("completed", "failed", "cancelled")
+
+    def to_dict(self) -> Dict:
+        return {
+            "search_id": self.search_id,
+            "status": self.status,
+            "is_complete": self.is_complete,
+            "results_available": self.status == "completed",
+            "error": self.error,
+            "progress": self.progress.to_dict(),
+            "partial_count": len(self.progress.partial_results),
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None
+        }
+
+
+class SearchJobManager:
+    """검색 작업 제출/조회/종료 관리자"""
+
+    def __init__(self, max_concurrent: int = settings.MAX_CONCURRENT_SEARCHES,
+                 broadcaster: Optional[ProgressBroadcaster] = None):
+        self.jobs: Dict[str, SearchJob] = {}
+        self._semaphore = asyncio.Semaphore(max(max_concurrent, 1))
+        # 진행 이벤트 브로드캐스터 (SSE)
+        self.broadcaster = broadcaster or default_broadcaster
+
+    def submit(self, search_id: str, search_params: Dict,
+               runner: Callable[[SearchJob], Awaitable[Dict]]) -> SearchJob:
+        """작업 등록 후 백그라운드 태스크로 실행"""
+        self.cleanup_finished()
+        job = SearchJob(search_id, search_params)
+        job.progress.event_sink = lambda event, data: self.broadcaster.publish(search_id, event, data)
+        self.jobs[search_id] = job
+        job.task = asyncio.create_task(self._run(job, runner))
+        return job
+
+    async def _run(self, job: SearchJob, runner: Callable[[SearchJob], Awaitable[Dict]]):
+        # 동시 실행 검색 수 제한 (초과분은 pending 상태로 대기)
+        async with self._semaphore:
+            job.status = "running"
+            job.progress.start_time = datetime.now()
+            job.progress.emit("status", {"status": job.status})
+            try:
+                result = await asyncio.wait_for(runner(job), timeout=settings.SEARCH_TIMEOUT)
+                if "error" in result:
+                    job.status = "failed"
+                    job.error = result["error"]
+                    job.progress.errors.append(result["error"])
+                else:
+                    job.status = "completed"
+                    job.progress.current_step = "완료"
+            except asyncio.CancelledError:
+                job.status = "cancelled"
+                job.progress.current_step = "취소됨"
+                raise
+            except asyncio.TimeoutError:
+                job.status = "failed"
+                job.error = f"검색 시간 초과 ({settings.SEARCH_TIMEOUT}초)"
+                job.progress.errors.append(job.error)
+                job.progress.current_step = "오류 발생"
+            except Exception as e:
+                job.status = "failed"
+                job.error = f"검색 작업 오류: {str(e)}"
+                job.progress.errors.append(job.error)
+                job.progress.current_step = "오류 발생"
+            finally:
+                job.finished_at = datetime.now()
+                # 완료 이벤트 전송 후 채널 종료
+                self.broadcaster.publish(job.search_id, "done", job.to_dict())
+                self.broadcaster.close(job.search_id)
+
+    def get(self, search_id: str) -> Optional[SearchJob]:
+        """작업 조회"""
+        return self.jobs.get(search_id)
+
+    def active_search_ids(self) -> List[str]:
+        """실행 중이거나 대기 중인 작업 ID 목록"""
+        return [search_id for search_id, job in self.jobs.items() if not job.is_complete]
+
+    def cleanup_finished(self, max_age_hours: int = settings.CACHE_EXPIRE_HOURS):
+        """완료 후 오래된 작업 정리"""
+        cutoff = datetime.now() - timedelta(hours=max_age_hours)
+        expired = [search_id for search_id, job in self.jobs.items()
+                   if job.finished_at and job.finished_at < cutoff]
+        for search_id in expired:
+            self.jobs.pop(search_id, None)
+            self.broadcaster.discard(search_id)
+
+    async def shutdown(self):
+        """애플리케이션 종료 시 진행 중인 작업 취소"""
+        tasks = [job.task for job in self.jobs.values() if job.task and not job.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict:
+        """작업 상태별 개수"""
+        stats: Dict[str, int] = {}
+        for job in self.jobs.values():
+            stats[job.status] = stats.get(job.status, 0) + 1
+        return stats
+
+
+# 전역 작업 관리자 인스턴스
+job_manager = SearchJobManager()
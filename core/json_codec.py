@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON 직렬화 (orjson이 있으면 사용, 없으면 표준 json)
+to_json() 메서드가 있는 객체(NoticeRecord 등)는 그 결과로, 나머지 미지원 타입은 문자열로 직렬화
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import Response
+
+# 빠른 JSON 인코더 (선택 의존성)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> Any:
+    to_json = getattr(obj, "to_json", None)
+    if to_json is not None:
+        return to_json()
+    return str(obj)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """UTF-8 JSON 바이트"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """JSON 문자열 (SQLite TEXT 저장용)"""
+    return dumps_bytes(obj).decode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(Response):
+    """FastAPI 기본 jsonable_encoder 변환을 거치지 않고 바로 직렬화하는 응답"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다중 키워드 매칭 (Aho-Corasick)
+키워드 수와 관계없이 본문 길이에 비례하는 시간으로 모든 키워드 출현을 한 번에 찾음
+"""
+
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+
+def normalize_text(text: str) -> str:
+    """대소문자/연속 공백 차이 무시"""
+    return re.sub(r"\s+", " ", str(text or "")).strip().casefold()
+
+
+class AhoCorasickMatcher:
+    """키워드 목록으로 만든 Aho-Corasick 오토마톤"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for pattern in patterns:
+            normalized = normalize_text(pattern)
+            if not normalized or normalized in self.patterns:
+                continue
+            self.patterns.append(normalized)
+            self._insert(normalized, len(self.patterns) - 1)
+        self._build_failure_links()
+
+    def _insert(self, pattern: str, pattern_id: int):
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append(pattern_id)
+
+    def _build_failure_links(self):
+        """BFS로 실패 링크 계산 후 출력 목록 병합"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find(self, text: str) -> Set[int]:
+        """본문에 등장하는 키워드 번호 집합"""
+        found: Set[int] = set()
+        state = 0
+        goto, fail, output = self._goto, self._fail, self._output
+        for char in normalize_text(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def __len__(self) -> int:
+        return len(self.patterns)
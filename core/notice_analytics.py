@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공고 통계 집계 (SQLite)
+API로 받은 공고를 받을 때마다 기관/계약방법/공고종류 × 월 단위 건수·예산 합계와
+월별 예산 구간 분포를 갱신해 두고, 조회는 집계 테이블만 읽는다.
+정정 공고(같은 공고번호/차수)는 이전 값을 빼고 새 값을 더해 중복 집계하지 않음
+"""
+
+import sqlite3
+import threading
+from bisect import bisect_right
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from core.config import settings
+from core.notice_record import format_currency, parse_amount
+
+# 집계 차원 → 공고 필드
+DIMENSIONS = {
+    "institution": "ntceInsttNm",
+    "contract_method": "cntrctCnclsMthdNm",
+    "notice_kind": "ntceKindNm"
+}
+
+# 예산 구간 (하한, 이름). 0원은 미기재로 따로 집계
+BUDGET_BUCKETS: Tuple[Tuple[int, str], ...] = (
+    (0, "미기재"),
+    (1, "1천만원 미만"),
+    (10_000_000, "1천만~5천만원"),
+    (50_000_000, "5천만~1억원"),
+    (100_000_000, "1억~5억원"),
+    (500_000_000, "5억~10억원"),
+    (1_000_000_000, "10억~50억원"),
+    (5_000_000_000, "50억원 이상")
+)
+_BUCKET_BOUNDS = [lower for lower, _ in BUDGET_BUCKETS]
+
+UNKNOWN = "기타"
+
+
+def budget_bucket(amount: int) -> int:
+    return max(bisect_right(_BUCKET_BOUNDS, amount) - 1, 0)
+
+
+def notice_month(value: str) -> str:
+    """공고일시 → YYYYMM (없으면 000000)"""
+    digits = "".join(c for c in str(value or "") if c.isdigit())
+    return digits[:6] if len(digits) >= 6 else "000000"
+
+
+class NoticeAnalytics:
+    """공고 단위 사실 테이블 + 증분 집계 테이블"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        db_path = Path(db_path or settings.downloads_cache_dir / "notice_analytics.db")
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            # 공고별 집계 기준 값 (정정 시 이전 기여분을 빼기 위해 보관)
+            "CREATE TABLE IF NOT EXISTS facts ("
+            " bid_ntce_no TEXT NOT NULL,"
+            " bid_ntce_ord TEXT NOT NULL,"
+            " month TEXT NOT NULL,"
+            " institution TEXT NOT NULL,"
+            " contract_method TEXT NOT NULL,"
+            " notice_kind TEXT NOT NULL,"
+            " budget INTEGER NOT NULL,"
+            " PRIMARY KEY (bid_ntce_no, bid_ntce_ord)) WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS aggregates ("
+            " dimension TEXT NOT NULL,"
+            " value TEXT NOT NULL,"
+            " month TEXT NOT NULL,"
+            " notices INTEGER NOT NULL,"
+            " budget_sum INTEGER NOT NULL,"
+            " PRIMARY KEY (dimension, value, month)) WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS idx_aggregates_month ON aggregates(dimension, month);"
+            "CREATE TABLE IF NOT EXISTS budget_histogram ("
+            " month TEXT NOT NULL,"
+            " bucket INTEGER NOT NULL,"
+            " notices INTEGER NOT NULL,"
+            " budget_sum INTEGER NOT NULL,"
+            " PRIMARY KEY (month, bucket)) WITHOUT ROWID;"
+        )
+        self.stats = {"ingested": 0, "unchanged": 0}
+
+    @staticmethod
+    def _fact(item: Dict) -> Tuple:
+        return (
+            notice_month(item.get("bidNtceDt")),
+            *((item.get(field) or UNKNOWN) for field in DIMENSIONS.values()),
+            parse_amount(item.get("asignBdgtAmt"))
+        )
+
+    def add_items(self, items: List[Dict]):
+        """공고 반영 (새 공고는 더하고, 내용이 바뀐 공고는 이전 값을 빼고 더함)"""
+        rows = [
+            (item["bidNtceNo"], item.get("bidNtceOrd", "") or "", self._fact(item))
+            for item in items if item.get("bidNtceNo")
+        ]
+        if not rows:
+            return
+        aggregate_delta: Dict[Tuple[str, str, str], List[int]] = defaultdict(lambda: [0, 0])
+        histogram_delta: Dict[Tuple[str, int], List[int]] = defaultdict(lambda: [0, 0])
+
+        def apply(fact: Tuple, sign: int):
+            month, budget = fact[0], fact[-1]
+            for dimension, value in zip(DIMENSIONS, fact[1:-1]):
+                delta = aggregate_delta[(dimension, value, month)]
+                delta[0] += sign
+                delta[1] += sign * budget
+            delta = histogram_delta[(month, budget_bucket(budget))]
+            delta[0] += sign
+            delta[1] += sign * budget
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                changed: Dict[Tuple[str, str], Tuple] = {}
+                for bid_ntce_no, bid_ntce_ord, fact in rows:
+                    key = (bid_ntce_no, bid_ntce_ord)
+                    old = changed.get(key) or self._conn.execute(
+                        "SELECT month, institution, contract_method, notice_kind, budget FROM facts"
+                        " WHERE bid_ntce_no = ? AND bid_ntce_ord = ?", key
+                    ).fetchone()
+                    if old == fact:
+                        self.stats["unchanged"] += 1
+                        continue
+                    if old:
+                        apply(old, -1)
+                    apply(fact, 1)
+                    changed[key] = fact
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO facts VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(*key, *fact) for key, fact in changed.items()]
+                )
+                self._conn.executemany(
+                    "INSERT INTO aggregates (dimension, value, month, notices, budget_sum) VALUES (?, ?, ?, ?, ?)"
+                    " ON CONFLICT(dimension, value, month) DO UPDATE SET"
+                    " notices = notices + excluded.notices, budget_sum = budget_sum + excluded.budget_sum",
+                    [(*key, *delta) for key, delta in aggregate_delta.items() if delta != [0, 0]]
+                )
+                self._conn.executemany(
+                    "INSERT INTO budget_histogram (month, bucket, notices, budget_sum) VALUES (?, ?, ?, ?)"
+                    " ON CONFLICT(month, bucket) DO UPDATE SET"
+                    " notices = notices + excluded.notices, budget_sum = budget_sum + excluded.budget_sum",
+                    [(*key, *delta) for key, delta in histogram_delta.items() if delta != [0, 0]]
+                )
+                # 정정으로 건수가 0이 된 그룹 정리
+                self._conn.executemany(
+                    "DELETE FROM aggregates WHERE dimension = ? AND value = ? AND month = ? AND notices <= 0",
+                    [key for key, delta in aggregate_delta.items() if delta[0] < 0]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        self.stats["ingested"] += len(changed)
+
+    @staticmethod
+    def _month_range(start_month: Optional[str], end_month: Optional[str]) -> Tuple[str, str]:
+        return start_month or "000000", end_month or "999999"
+
+    def group_by(self, dimension: str, start_month: Optional[str] = None, end_month: Optional[str] = None,
+                 limit: int = 50, offset: int = 0) -> Dict:
+        """차원별(또는 month) 건수/예산 합계 (건수 내림차순)"""
+        if dimension != "month" and dimension not in DIMENSIONS:
+            raise ValueError(f"지원하지 않는 집계 기준: {dimension} (사용 가능: month, {', '.join(DIMENSIONS)})")
+        begin, end = self._month_range(start_month, end_month)
+        # 월별 합계는 어느 차원으로 합쳐도 같으므로 그룹 수가 가장 적은 공고종류 집계를 사용
+        source = "notice_kind" if dimension == "month" else dimension
+        group_column = "month" if dimension == "month" else "value"
+        order = "month" if dimension == "month" else "notices DESC, budget_sum DESC, value"
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {group_column}, SUM(notices) AS notices, SUM(budget_sum) AS budget_sum FROM aggregates"
+                f" WHERE dimension = ? AND month BETWEEN ? AND ?"
+                f" GROUP BY {group_column} ORDER BY {order}",
+                (source, begin, end)
+            ).fetchall()
+
+        total_notices = sum(row[1] for row in rows)
+        total_budget = sum(row[2] for row in rows)
+        return {
+            "dimension": dimension,
+            "start_month": start_month,
+            "end_month": end_month,
+            "total_groups": len(rows),
+            "total_notices": total_notices,
+            "total_budget": total_budget,
+            "total_budget_formatted": format_currency(total_budget),
+            "groups": [
+                {"value": value, "notices": notices, "budget_sum": budget_sum,
+                 "budget_formatted": format_currency(budget_sum)}
+                for value, notices, budget_sum in rows[offset:offset + limit]
+            ]
+        }
+
+    def budget_histogram(self, start_month: Optional[str] = None, end_month: Optional[str] = None) -> Dict:
+        """월별 예산 구간 분포"""
+        begin, end = self._month_range(start_month, end_month)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT month, bucket, notices, budget_sum FROM budget_histogram"
+                " WHERE month BETWEEN ? AND ? AND notices > 0 ORDER BY month, bucket",
+                (begin, end)
+            ).fetchall()
+
+        months: Dict[str, List[Dict]] = {}
+        for month, bucket, notices, budget_sum in rows:
+            months.setdefault(month, []).append({
+                "bucket": bucket,
+                "label": BUDGET_BUCKETS[bucket][1],
+                "lower": BUDGET_BUCKETS[bucket][0],
+                "notices": notices,
+                "budget_sum": budget_sum
+            })
+        return {
+            "start_month": start_month,
+            "end_month": end_month,
+            "buckets": [{"bucket": i, "label": label, "lower": lower} for i, (lower, label) in enumerate(BUDGET_BUCKETS)],
+            "months": [{"month": month, "buckets": buckets} for month, buckets in months.items()]
+        }
+
+    def get_stats(self) -> Dict:
+        """집계 공고 수/그룹 수"""
+        stats = dict(self.stats)
+        with self._lock:
+            stats["notices"] = self._conn.execute("SELECT COUNT(*) FROM facts").fetchone()[0]
+            stats["aggregate_rows"] = self._conn.execute("SELECT COUNT(*) FROM aggregates").fetchone()[0]
+        return stats
+
+
+# 전역 공고 통계
+notice_analytics = NoticeAnalytics()
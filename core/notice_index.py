@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 공고 색인 (SQLite FTS5, trigram 토크나이저)
+API로 받은 공고를 모두 색인하고, 조회 조건별로 빠짐없이 받아 둔 기간(coverage)을 기록해
+요청 기간이 모두 덮여 있으면 API 호출 없이 로컬에서 응답
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from core.config import settings
+from core.query_cache import UpstreamQueryCache
+
+# 정상 응답 헤더 (로컬 응답도 API 응답과 같은 구조로 반환)
+NORMAL_HEADER = {"resultCode": "00", "resultMsg": "NORMAL SERVICE."}
+
+# trigram 토크나이저는 3글자 이상만 색인 검색 가능 (미만은 LIKE로 대체)
+TRIGRAM_MIN_LENGTH = 3
+
+
+def window_keys(begin: str, end: str) -> Tuple[str, str]:
+    """조회 기간을 비교용 12자리 키(YYYYMMDDHHMM)로 변환 (날짜만 있으면 하루 끝까지)"""
+    begin_digits = "".join(c for c in str(begin or "") if c.isdigit())
+    end_digits = "".join(c for c in str(end or "") if c.isdigit())
+    begin_key = begin_digits[:12].ljust(12, "0") if begin_digits else "000000000000"
+    if not end_digits:
+        end_key = "999999999999"
+    elif len(end_digits) <= 8:
+        end_key = end_digits[:8] + "2359"
+    else:
+        end_key = end_digits[:12].ljust(12, "0")
+    return begin_key, end_key
+
+
+def _notice_dt_key(value: str) -> str:
+    digits = "".join(c for c in str(value or "") if c.isdigit())
+    return digits[:12].ljust(12, "0")
+
+
+def _like_pattern(text: str) -> str:
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class NoticeIndex:
+    """공고 전문 색인 + 조회 조건별 수집 구간"""
+
+    def __init__(self, db_path: Optional[Path] = None,
+                 freshness_seconds: float = settings.INDEX_FRESHNESS_SECONDS):
+        db_path = Path(db_path or settings.downloads_cache_dir / "notice_index.db")
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # 수집 시점 이후 구간을 이 시간 동안은 최신으로 간주
+        self.freshness_seconds = freshness_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS notices ("
+            " id INTEGER PRIMARY KEY,"
+            " bid_ntce_no TEXT NOT NULL,"
+            " bid_ntce_ord TEXT NOT NULL,"
+            " bid_ntce_dt TEXT NOT NULL,"
+            " bid_ntce_nm TEXT NOT NULL,"
+            " ntce_instt_nm TEXT NOT NULL,"
+            " item TEXT NOT NULL,"
+            " indexed_at REAL NOT NULL,"
+            " UNIQUE (bid_ntce_no, bid_ntce_ord));"
+            "CREATE INDEX IF NOT EXISTS idx_notices_dt ON notices(bid_ntce_dt);"
+            "CREATE VIRTUAL TABLE IF NOT EXISTS notices_fts USING fts5("
+            " bid_ntce_nm, ntce_instt_nm, content='notices', content_rowid='id', tokenize='trigram');"
+            "CREATE TRIGGER IF NOT EXISTS notices_ai AFTER INSERT ON notices BEGIN"
+            " INSERT INTO notices_fts(rowid, bid_ntce_nm, ntce_instt_nm)"
+            " VALUES (new.id, new.bid_ntce_nm, new.ntce_instt_nm); END;"
+            "CREATE TRIGGER IF NOT EXISTS notices_ad AFTER DELETE ON notices BEGIN"
+            " INSERT INTO notices_fts(notices_fts, rowid, bid_ntce_nm, ntce_instt_nm)"
+            " VALUES ('delete', old.id, old.bid_ntce_nm, old.ntce_instt_nm); END;"
+            "CREATE TRIGGER IF NOT EXISTS notices_au AFTER UPDATE ON notices BEGIN"
+            " INSERT INTO notices_fts(notices_fts, rowid, bid_ntce_nm, ntce_instt_nm)"
+            " VALUES ('delete', old.id, old.bid_ntce_nm, old.ntce_instt_nm);"
+            " INSERT INTO notices_fts(rowid, bid_ntce_nm, ntce_instt_nm)"
+            " VALUES (new.id, new.bid_ntce_nm, new.ntce_instt_nm); END;"
+            "CREATE TABLE IF NOT EXISTS coverage ("
+            " signature TEXT NOT NULL,"
+            " begin_key TEXT NOT NULL,"
+            " end_key TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS idx_coverage_signature ON coverage(signature);"
+        )
+        self.stats = {"local_hits": 0, "local_misses": 0, "indexed": 0}
+
+    @staticmethod
+    def filter_signature(keyword: Optional[str], institution: Optional[str], inqry_div: Optional[str]) -> str:
+        """조회 필터 식별 키 (기간 제외)"""
+        return UpstreamQueryCache.make_key("notice_index", {
+            "bidNtceNm": keyword, "ntceInsttNm": institution, "inqryDivCd": inqry_div
+        })
+
+    def add_items(self, items: List[Dict]):
+        """공고 색인 (같은 공고번호/차수는 최신 내용으로 교체)"""
+        if not items:
+            return
+        now = time.time()
+        rows = [
+            (item.get("bidNtceNo", ""), item.get("bidNtceOrd", ""), _notice_dt_key(item.get("bidNtceDt", "")),
+             item.get("bidNtceNm", "") or "", item.get("ntceInsttNm", "") or "",
+             json.dumps(item, ensure_ascii=False), now)
+            for item in items if item.get("bidNtceNo")
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO notices (bid_ntce_no, bid_ntce_ord, bid_ntce_dt, bid_ntce_nm, ntce_instt_nm,"
+                    " item, indexed_at) VALUES (?, ?, ?, ?, ?, ?, ?)"
+                    " ON CONFLICT(bid_ntce_no, bid_ntce_ord) DO UPDATE SET"
+                    " bid_ntce_dt = excluded.bid_ntce_dt, bid_ntce_nm = excluded.bid_ntce_nm,"
+                    " ntce_instt_nm = excluded.ntce_instt_nm, item = excluded.item,"
+                    " indexed_at = excluded.indexed_at",
+                    rows
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        self.stats["indexed"] += len(rows)
+
+    def add_coverage(self, search_params: Dict):
+        """조회 조건의 기간을 빠짐없이 수집했음을 기록 (미래 구간은 수집 시점까지만)"""
+        signature = self.filter_signature(
+            search_params.get("bidNtceNm"), search_params.get("ntceInsttNm"), search_params.get("inqryDivCd")
+        )
+        begin_key, end_key = window_keys(search_params.get("inqryBgnDt"), search_params.get("inqryEndDt"))
+        now = time.time()
+        end_key = min(end_key, time.strftime("%Y%m%d%H%M", time.localtime(now)))
+        if end_key < begin_key:
+            return
+        with self._lock:
+            # 새 구간에 포함되는 이전 기록 정리
+            self._conn.execute(
+                "DELETE FROM coverage WHERE signature = ? AND begin_key >= ? AND end_key <= ?",
+                (signature, begin_key, end_key)
+            )
+            self._conn.execute(
+                "INSERT INTO coverage (signature, begin_key, end_key, fetched_at) VALUES (?, ?, ?, ?)",
+                (signature, begin_key, end_key, now)
+            )
+
+    def is_covered(self, search_params: Dict) -> bool:
+        """요청 기간이 같은(또는 더 넓은) 필터로 수집한 구간들로 모두 덮이는지 확인"""
+        keyword = search_params.get("bidNtceNm") or None
+        institution = search_params.get("ntceInsttNm") or None
+        inqry_div = search_params.get("inqryDivCd")
+        # 더 넓은 필터(키워드 없음/기관 없음)로 받은 구간도 사용 가능
+        signatures = {
+            self.filter_signature(k, i, inqry_div)
+            for k in {keyword, None} for i in {institution, None}
+        }
+        begin_key, end_key = window_keys(search_params.get("inqryBgnDt"), search_params.get("inqryEndDt"))
+
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT begin_key, end_key, fetched_at FROM coverage"
+                f" WHERE signature IN ({','.join('?' * len(signatures))}) AND end_key >= ? AND begin_key <= ?",
+                (*signatures, begin_key, end_key)
+            ).fetchall()
+
+        intervals = []
+        for row_begin, row_end, fetched_at in rows:
+            # 최근 수집분은 수집 이후 구간도 최신으로 간주
+            if now - fetched_at <= self.freshness_seconds and row_end >= time.strftime(
+                    "%Y%m%d%H%M", time.localtime(fetched_at)):
+                row_end = "999999999999"
+            intervals.append((row_begin, row_end))
+
+        cursor = begin_key
+        for row_begin, row_end in sorted(intervals):
+            if row_begin > cursor:
+                return False
+            if row_end >= end_key:
+                return True
+            cursor = max(cursor, self._next_minute(row_end))
+        return False
+
+    @staticmethod
+    def _next_minute(key: str) -> str:
+        """구간 끝 다음 분 (인접 구간 연결용)"""
+        try:
+            return time.strftime("%Y%m%d%H%M", time.localtime(time.mktime(time.strptime(key, "%Y%m%d%H%M")) + 60))
+        except (ValueError, OverflowError):
+            return key
+
+    def query(self, search_params: Dict) -> Optional[Dict]:
+        """수집 구간이 요청 기간을 덮으면 로컬 색인으로 API 응답 형식 결과 생성 (아니면 None)"""
+        if not self.is_covered(search_params):
+            self.stats["local_misses"] += 1
+            return None
+
+        begin_key, end_key = window_keys(search_params.get("inqryBgnDt"), search_params.get("inqryEndDt"))
+        conditions = ["n.bid_ntce_dt BETWEEN ? AND ?"]
+        args: List = [begin_key, end_key]
+        for column, value in (("bid_ntce_nm", search_params.get("bidNtceNm")),
+                              ("ntce_instt_nm", search_params.get("ntceInsttNm"))):
+            value = (value or "").strip()
+            if not value:
+                continue
+            if len(value) >= TRIGRAM_MIN_LENGTH:
+                phrase = value.replace('"', '""')
+                conditions.append("n.id IN (SELECT rowid FROM notices_fts WHERE notices_fts MATCH ?)")
+                args.append(f'{column} : "{phrase}"')
+            else:
+                conditions.append(f"n.{column} LIKE ? ESCAPE '\\'")
+                args.append(_like_pattern(value))
+        where = " AND ".join(conditions)
+
+        num_rows = max(int(search_params.get("numOfRows") or 100), 1)
+        page_no = max(int(search_params.get("pageNo") or 1), 1)
+        paging = "" if search_params.get("allPages") else f" LIMIT {num_rows} OFFSET {(page_no - 1) * num_rows}"
+        with self._lock:
+            total_count = self._conn.execute(f"SELECT COUNT(*) FROM notices AS n WHERE {where}", args).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT n.item FROM notices AS n WHERE {where}"
+                f" ORDER BY n.bid_ntce_dt DESC, n.bid_ntce_no, n.bid_ntce_ord{paging}",
+                args
+            ).fetchall()
+
+        items = [json.loads(row[0]) for row in rows]
+        self.stats["local_hits"] += 1
+        return {
+            "response": {
+                "header": dict(NORMAL_HEADER),
+                "body": {
+                    "items": items,
+                    "numOfRows": len(items) if search_params.get("allPages") else num_rows,
+                    "pageNo": 1 if search_params.get("allPages") else page_no,
+                    "totalCount": total_count
+                }
+            },
+            "source": "local_index"
+        }
+
+    def get_stats(self) -> Dict:
+        """색인 공고 수/수집 구간 수/로컬 응답 비율"""
+        stats = dict(self.stats)
+        with self._lock:
+            stats["notices"] = self._conn.execute("SELECT COUNT(*) FROM notices").fetchone()[0]
+            stats["coverage_intervals"] = self._conn.execute("SELECT COUNT(*) FROM coverage").fetchone()[0]
+        return stats
+
+
+# 전역 공고 색인
+notice_index = NoticeIndex()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검색 결과 공고 레코드
+API 응답 항목을 받을 때 한 번만 표시용 문자열/금액을 계산해 __slots__ 객체로 보관.
+원본 응답(original_data)은 복사하지 않고 공고/차수/변경일시가 같은 항목끼리 하나를 공유
+"""
+
+import weakref
+from typing import Any, Dict, Iterable, List, Optional
+
+# 응답 기본 필드 (표시용 값, original_data 제외)
+DISPLAY_FIELDS = (
+    "bidNtceNo", "bidNtceNm", "ntceInsttNm", "bidNtceDt", "opengDt", "bidClseDt",
+    "asignBdgtAmt", "presmptPrce", "cntrctCnclsMthdNm", "ntceKindNm", "bidNtceDtlUrl",
+    "ntceInsttOfclNm", "ntceInsttOfclTelNo", "ntceInsttOfclEmailAdrs"
+)
+DATE_FIELDS = ("bidNtceDt", "opengDt", "bidClseDt")
+
+DEFAULT_FIELDS = DISPLAY_FIELDS + ("attachments", "change")
+
+# fields= 로 선택할 수 있는 레코드 속성 (그 밖의 필드는 원본 항목에서)
+RECORD_FIELDS = frozenset(DISPLAY_FIELDS + ("budget_amount", "price_amount", "attachments"))
+
+
+def format_currency(amount: Any) -> str:
+    """금액 포맷팅 (원화 단위)"""
+    return f"{parse_amount(amount):,}원"
+
+
+def parse_amount(amount: Any) -> int:
+    """금액 문자열을 정수로 (없거나 숫자가 아니면 0)"""
+    if not amount:
+        return 0
+    try:
+        return int(amount)
+    except (ValueError, TypeError):
+        return 0
+
+
+def format_date(date_str: Any) -> str:
+    """날짜 포맷팅 ("2025-06-02 09:27:20" -> "2025-06-02")"""
+    if not date_str:
+        return "-"
+    return str(date_str).split(" ")[0]
+
+
+class RawPayload(dict):
+    """공유되는 원본 API 항목 (약한 참조 풀에 등록하기 위한 dict)"""
+    __slots__ = ("__weakref__",)
+
+
+# 살아 있는 원본 항목 풀 (검색 결과가 모두 해제되면 함께 사라짐)
+_payload_pool: "weakref.WeakValueDictionary[tuple, RawPayload]" = weakref.WeakValueDictionary()
+
+
+def share_payload(item: Dict) -> RawPayload:
+    """같은 공고/차수/변경일시의 동일한 원본 항목이 이미 있으면 그것을 재사용"""
+    if isinstance(item, RawPayload):
+        return item
+    key = (item.get("bidNtceNo"), item.get("bidNtceOrd"), item.get("chgDt"), item.get("rgstDt"), len(item))
+    shared = _payload_pool.get(key)
+    if shared is not None and shared == item:
+        return shared
+    payload = RawPayload(item)
+    _payload_pool[key] = payload
+    return payload
+
+
+class NoticeRecord:
+    """표시용 값이 미리 계산된 공고 레코드"""
+
+    __slots__ = DISPLAY_FIELDS + ("budget_amount", "price_amount", "attachments", "change", "raw")
+
+    def __init__(self, raw: Dict, attachments: Optional[List[Dict]] = None, change: Optional[str] = None):
+        raw = share_payload(raw)
+        for field in DISPLAY_FIELDS:
+            setattr(self, field, raw.get(field, "") or "")
+        for field in DATE_FIELDS:
+            setattr(self, field, format_date(raw.get(field)))
+        self.budget_amount = parse_amount(raw.get("asignBdgtAmt"))
+        self.price_amount = parse_amount(raw.get("presmptPrce"))
+        self.asignBdgtAmt = f"{self.budget_amount:,}원"
+        self.presmptPrce = f"{self.price_amount:,}원"
+        self.attachments = attachments if attachments is not None else []
+        self.change = change
+        self.raw = raw
+
+    @classmethod
+    def from_stored(cls, data: Dict) -> "NoticeRecord":
+        """to_json() 으로 저장한 형태에서 복원"""
+        return cls(data.get("original_data") or data, data.get("attachments"), data.get("change"))
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """표시 필드 → 원본 필드 순으로 조회"""
+        if field in RECORD_FIELDS:
+            return getattr(self, field)
+        return self.raw.get(field, default)
+
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> Dict:
+        """응답 항목 (original_data 는 fields 에 명시한 경우만)"""
+        result = {}
+        for field in fields or DEFAULT_FIELDS:
+            if field == "original_data":
+                result[field] = self.raw
+            elif field == "change":
+                if self.change is not None:
+                    result[field] = self.change
+            elif field in RECORD_FIELDS:
+                result[field] = getattr(self, field)
+            elif field in self.raw:
+                result[field] = self.raw[field]
+        return result
+
+    def to_json(self) -> Dict:
+        """저장용 전체 항목 (original_data 포함)"""
+        return self.to_dict(DEFAULT_FIELDS + ("original_data",))
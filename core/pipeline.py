@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+단계별 비동기 처리 파이프라인
+단계마다 고정 수의 워커가 크기 제한 큐로 연결되어, 뒤 단계가 밀리면 앞 단계가 대기(backpressure)
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+# 처리 결과를 다음 단계로 넘기고, None을 반환하면 해당 항목은 여기서 종료
+StageHandler = Callable[[Any], Awaitable[Optional[Any]]]
+
+_END = object()
+
+
+class PipelineStage:
+    """파이프라인 단계 정의"""
+
+    def __init__(self, name: str, handler: StageHandler, concurrency: int = 1, queue_size: int = 0):
+        self.name = name
+        self.handler = handler
+        self.concurrency = max(concurrency, 1)
+        # 입력 큐 크기 (0이면 concurrency * 2)
+        self.queue_size = queue_size or self.concurrency * 2
+
+
+class StagedPipeline:
+    """원천(source) → 단계1 → 단계2 ... 순서로 항목을 흘려보내는 파이프라인"""
+
+    def __init__(self, stages: List[PipelineStage], source_name: str = "source",
+                 on_update: Optional[Callable[[], Awaitable[None]]] = None):
+        self.stages = stages
+        self.source_name = source_name
+        self.on_update = on_update
+        # 단계별 현황 (SearchProgress.stages 에서 그대로 참조)
+        self.stats: Dict[str, Dict] = {
+            source_name: {"concurrency": 1, "queued": 0, "active": 0, "completed": 0, "failed": 0, "busy_seconds": 0.0}
+        }
+        for stage in stages:
+            self.stats[stage.name] = {
+                "concurrency": stage.concurrency,
+                "queued": 0,
+                "active": 0,
+                "completed": 0,
+                "failed": 0,
+                "busy_seconds": 0.0
+            }
+        self.errors: List[str] = []
+
+    async def _notify(self):
+        if self.on_update:
+            try:
+                await self.on_update()
+            except Exception as e:
+                print(f"파이프라인 진행 알림 오류: {e}")
+
+    async def _feed(self, source: Union[Iterable, AsyncIterable], queue: asyncio.Queue):
+        stats = self.stats[self.source_name]
+        first_stats = self.stats[self.stages[0].name]
+        stats["active"] = 1
+        started = time.monotonic()
+        try:
+            if hasattr(source, "__aiter__"):
+                async for item in source:
+                    stats["completed"] += 1
+                    await queue.put(item)
+                    first_stats["queued"] = queue.qsize()
+            else:
+                for item in source:
+                    stats["completed"] += 1
+                    await queue.put(item)
+                    first_stats["queued"] = queue.qsize()
+        except Exception as e:
+            stats["failed"] += 1
+            self.errors.append(f"{self.source_name}: {e}")
+        finally:
+            stats["active"] = 0
+            stats["busy_seconds"] += time.monotonic() - started
+
+    async def _worker(self, stage: PipelineStage, inbox: asyncio.Queue,
+                      outbox: Optional[asyncio.Queue], next_stats: Optional[Dict], results: List):
+        stats = self.stats[stage.name]
+        while True:
+            item = await inbox.get()
+            if item is _END:
+                stats["queued"] = 0
+                return
+            stats["queued"] = inbox.qsize()
+            stats["active"] += 1
+            started = time.monotonic()
+            try:
+                output = await stage.handler(item)
+            except Exception as e:
+                output = None
+                stats["failed"] += 1
+                self.errors.append(f"{stage.name}: {e}")
+            else:
+                stats["completed"] += 1
+            finally:
+                stats["active"] -= 1
+                stats["busy_seconds"] += time.monotonic() - started
+
+            if output is not None:
+                if outbox is not None:
+                    # 다음 단계 큐가 가득 차면 여기서 대기
+                    await outbox.put(output)
+                    next_stats["queued"] = outbox.qsize()
+                else:
+                    results.append(output)
+            await self._notify()
+
+    async def run(self, source: Union[Iterable, AsyncIterable]) -> List:
+        """모든 항목 처리 후 마지막 단계 결과 목록 반환 (완료 순)"""
+        queues = [asyncio.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        results: List = []
+        worker_groups = []
+        for index, stage in enumerate(self.stages):
+            has_next = index + 1 < len(self.stages)
+            outbox = queues[index + 1] if has_next else None
+            next_stats = self.stats[self.stages[index + 1].name] if has_next else None
+            worker_groups.append([
+                asyncio.create_task(self._worker(stage, queues[index], outbox, next_stats, results))
+                for _ in range(stage.concurrency)
+            ])
+
+        try:
+            await self._feed(source, queues[0])
+            # 앞 단계 워커가 모두 끝난 뒤 다음 단계에 종료 신호 전달
+            for index, stage in enumerate(self.stages):
+                for _ in range(stage.concurrency):
+                    await queues[index].put(_END)
+                await asyncio.gather(*worker_groups[index])
+        finally:
+            for group in worker_groups:
+                for task in group:
+                    task.cancel()
+        return results
+
+    def get_stats(self) -> Dict:
+        """단계별 처리량/대기 현황"""
+        return {name: dict(stats, busy_seconds=round(stats["busy_seconds"], 3))
+                for name, stats in self.stats.items()}
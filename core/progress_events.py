@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검색 진행 이벤트 브로드캐스터 (Server-Sent Events)
+검색별 이벤트 기록을 유지해 Last-Event-ID 재연결을 지원하고, 여러 구독자에게 같은 이벤트를 전달
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from typing import AsyncIterator, Dict, Optional, Set, Tuple
+
+from core.config import settings
+
+# (event_id, event_type, data)
+ProgressEvent = Tuple[int, str, Dict]
+
+
+class _EventChannel:
+    """검색 하나의 이벤트 채널"""
+
+    def __init__(self, history_size: int):
+        self.history: deque = deque(maxlen=history_size)
+        self.last_id = 0
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.closed = False
+        self.closed_at: Optional[float] = None
+
+
+class ProgressBroadcaster:
+    """검색별 진행 이벤트 팬아웃"""
+
+    def __init__(self, history_size: int = settings.SSE_HISTORY_SIZE,
+                 heartbeat_seconds: float = settings.SSE_HEARTBEAT_SECONDS):
+        self.history_size = max(history_size, 1)
+        self.heartbeat_seconds = heartbeat_seconds
+        self._channels: Dict[str, _EventChannel] = {}
+
+    def _channel(self, search_id: str) -> _EventChannel:
+        if search_id not in self._channels:
+            self._channels[search_id] = _EventChannel(self.history_size)
+        return self._channels[search_id]
+
+    def has_channel(self, search_id: str) -> bool:
+        return search_id in self._channels
+
+    def publish(self, search_id: str, event: str, data: Dict):
+        """이벤트 기록 후 모든 구독자 큐에 전달"""
+        channel = self._channel(search_id)
+        if channel.closed:
+            return
+        channel.last_id += 1
+        item = (channel.last_id, event, data)
+        channel.history.append(item)
+        for queue in channel.subscribers:
+            queue.put_nowait(item)
+
+    def close(self, search_id: str):
+        """채널 종료 (구독자 스트림 종료)"""
+        channel = self._channel(search_id)
+        channel.closed = True
+        channel.closed_at = time.time()
+        for queue in channel.subscribers:
+            queue.put_nowait(None)
+
+    def discard(self, search_id: str):
+        """채널 제거"""
+        self._channels.pop(search_id, None)
+
+    async def subscribe(self, search_id: str, last_event_id: int = 0) -> AsyncIterator[Optional[ProgressEvent]]:
+        """last_event_id 이후 기록을 재전송한 뒤 새 이벤트 대기 (대기 시간 초과 시 None으로 하트비트)"""
+        channel = self._channel(search_id)
+        # 재전송 중 발행된 이벤트를 놓치지 않도록 기록을 읽기 전에 큐를 먼저 등록
+        queue: asyncio.Queue = asyncio.Queue()
+        channel.subscribers.add(queue)
+        try:
+            closed = channel.closed
+            last_sent = last_event_id
+            for item in list(channel.history):
+                if item[0] > last_sent:
+                    yield item
+                    last_sent = item[0]
+            if closed:
+                return
+
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=self.heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if item is None:
+                    break
+                # 기록 재전송으로 이미 보낸 이벤트는 건너뜀
+                if item[0] <= last_sent:
+                    continue
+                last_sent = item[0]
+                yield item
+        finally:
+            channel.subscribers.discard(queue)
+
+    @staticmethod
+    def format_sse(item: ProgressEvent) -> str:
+        """SSE 전송 형식으로 변환"""
+        event_id, event, data = item
+        return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+    def get_stats(self) -> Dict:
+        """채널/구독자 수"""
+        return {
+            "channels": len(self._channels),
+            "open_channels": sum(1 for channel in self._channels.values() if not channel.closed),
+            "subscribers": sum(len(channel.subscribers) for channel in self._channels.values())
+        }
+
+
+# 전역 브로드캐스터 인스턴스
+progress_broadcaster = ProgressBroadcaster()
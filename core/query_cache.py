@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+나라장터 API 응답 캐시
+정규화된 조회 조건 기준 단기 캐시 + 동일 요청 단일 실행(single-flight)
+"""
+
+import asyncio
+import json
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Tuple
+
+from core.config import settings
+
+# 캐시 키에서 제외할 파라미터 (인증키/응답형식)
+IGNORED_PARAMS = {"serviceKey", "ServiceKey", "type"}
+
+
+class UpstreamQueryCache:
+    """API 응답 캐시 및 요청 병합"""
+
+    def __init__(self,
+                 ttl_seconds: float = settings.QUERY_CACHE_TTL,
+                 past_ttl_seconds: float = settings.QUERY_CACHE_PAST_TTL,
+                 max_entries: int = settings.QUERY_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.past_ttl_seconds = past_ttl_seconds
+        self.max_entries = max(max_entries, 1)
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "evictions": 0
+        }
+
+    @staticmethod
+    def make_key(operation: str, params: Dict) -> str:
+        """오퍼레이션 + 정규화된 파라미터로 캐시 키 생성"""
+        normalized = {}
+        for key, value in params.items():
+            if key in IGNORED_PARAMS or value is None or value == "":
+                continue
+            value = re.sub(r"\s+", " ", str(value)).strip()
+            normalized[key] = value
+        return json.dumps([operation, sorted(normalized.items())], ensure_ascii=False)
+
+    def ttl_for(self, params: Dict) -> float:
+        """조회 기간이 모두 과거이면 긴 TTL 적용"""
+        end_date = str(params.get("inqryEndDt") or "")[:8]
+        if len(end_date) == 8 and end_date < datetime.now().strftime("%Y%m%d"):
+            return self.past_ttl_seconds
+        return self.ttl_seconds
+
+    @staticmethod
+    def is_cacheable(result: Dict) -> bool:
+        """정상 응답만 캐시"""
+        if not isinstance(result, dict) or "error" in result:
+            return False
+        header = result.get("response", {}).get("header", {})
+        return header.get("resultCode", "00") == "00"
+
+    async def get_or_fetch(self, operation: str, params: Dict,
+                           fetch: Callable[[], Awaitable[Dict]]) -> Dict:
+        """캐시 조회 후 없으면 fetch 실행 (동일 키 동시 요청은 하나로 병합)"""
+        key = self.make_key(operation, params)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry[1]
+            self._entries.pop(key, None)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(inflight)
+
+        self.stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fetch()
+            if self.is_cacheable(result):
+                self._store(key, result, self.ttl_for(params))
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            # 대기 중인 동일 요청에도 실패 전달
+            error = e if isinstance(e, Exception) else RuntimeError("API 요청이 취소되었습니다")
+            future.set_exception(error)
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def _store(self, key: str, result: Dict, ttl: float):
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def clear(self):
+        """캐시 비우기"""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """적중/병합 통계"""
+        stats = dict(self.stats)
+        stats["entries"] = len(self._entries)
+        stats["inflight"] = len(self._inflight)
+        return stats
+
+
+# 전역 API 응답 캐시 인스턴스 (두 검색 엔진이 공유)
+query_cache = UpstreamQueryCache()
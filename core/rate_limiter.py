@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+나라장터 API 호출 제한기
+프로세스 전역 토큰 버킷(초당 호출 수 + 일일 한도) + 지터 지수 백오프 재시도
+"""
+
+import asyncio
+import json
+import random
+import time
+from datetime import date
+from typing import Awaitable, Callable, Dict, Optional
+
+import aiohttp
+
+from core.config import settings
+
+# data.go.kr 호출 한도 초과 resultCode (LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS)
+QUOTA_RESULT_CODES = {"22"}
+# 일시 장애로 재시도할 resultCode (APPLICATION_ERROR, HTTP_ERROR, SERVICETIMEOUT)
+TRANSIENT_RESULT_CODES = {"01", "04", "05"}
+# 한도 초과 시 type=json 이어도 XML 오류 응답이 오는 경우가 있음
+QUOTA_ERROR_MARKERS = ("LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS", "<returnReasonCode>22<")
+
+
+class DailyQuotaExceeded(Exception):
+    """설정된 일일 API 호출 한도(Settings.API_DAILY_QUOTA) 소진"""
+    pass
+
+
+class RetryableAPIError(Exception):
+    """재시도 대상 응답 (429/5xx/호출 한도 초과/일시 장애 resultCode)"""
+
+    def __init__(self, message: str, throttled: bool = False):
+        super().__init__(message)
+        self.throttled = throttled
+
+
+class APIRateLimiter:
+    """토큰 버킷 호출 제한 + 한도 초과 응답 시 호출 속도 자동 감소"""
+
+    def __init__(self,
+                 rate_per_second: float = settings.API_RATE_LIMIT,
+                 burst: int = settings.API_RATE_BURST,
+                 daily_quota: int = settings.API_DAILY_QUOTA,
+                 backoff_base: float = settings.API_CALL_DELAY,
+                 backoff_max: float = settings.API_BACKOFF_MAX):
+        self.rate = max(rate_per_second, 0.01)
+        self.burst = max(burst, 1)
+        self.daily_quota = daily_quota  # 0 = 무제한
+        self.backoff_base = max(backoff_base, 0.01)
+        self.backoff_max = max(backoff_max, self.backoff_base)
+        # 한도 초과 응답 시 절반으로 줄이고, 성공할 때마다 설정 속도까지 서서히 회복
+        self.min_rate = self.rate / 16
+        self.current_rate = self.rate
+
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._cooldown_until = 0.0
+        self._lock = asyncio.Lock()
+        self._quota_day = date.today()
+        self._daily_used = 0
+
+        self.stats = {
+            "calls": 0,
+            "waits": 0,
+            "wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "retries": 0,
+            "throttled": 0,
+            "server_errors": 0,
+            "quota_rejections": 0
+        }
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.current_rate)
+        self._updated_at = now
+
+    def _check_daily_quota(self):
+        today = date.today()
+        if today != self._quota_day:
+            self._quota_day = today
+            self._daily_used = 0
+        if self.daily_quota and self._daily_used >= self.daily_quota:
+            self.stats["quota_rejections"] += 1
+            raise DailyQuotaExceeded(f"일일 API 호출 한도({self.daily_quota}회)를 모두 사용했습니다")
+
+    async def acquire(self):
+        """호출 토큰 1개 획득 (부족하면 대기, 대기 순서는 도착 순)"""
+        started = time.monotonic()
+        async with self._lock:
+            self._check_daily_quota()
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._cooldown_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+                    wait = (1 - self._tokens) / self.current_rate
+                await asyncio.sleep(wait)
+            self._daily_used += 1
+
+        waited = time.monotonic() - started
+        self.stats["calls"] += 1
+        if waited > 0.001:
+            self.stats["waits"] += 1
+            self.stats["wait_seconds"] += waited
+            self.stats["max_wait_seconds"] = max(self.stats["max_wait_seconds"], waited)
+
+    def backoff_delay(self, attempt: int) -> float:
+        """지터 지수 백오프 대기 시간 (full jitter)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def record_success(self):
+        if self.current_rate < self.rate:
+            self.current_rate = min(self.rate, self.current_rate + self.rate * 0.05)
+
+    def record_throttled(self, delay: float):
+        """한도 초과 응답: 호출 속도 절반 + 모든 호출자 공동 대기"""
+        self.stats["throttled"] += 1
+        self.current_rate = max(self.min_rate, self.current_rate / 2)
+        self._cooldown_until = max(self._cooldown_until, time.monotonic() + delay)
+
+    @staticmethod
+    async def read_response(response: aiohttp.ClientResponse) -> Dict:
+        """응답 상태/본문 검사 후 JSON 반환 (재시도 대상이면 RetryableAPIError)"""
+        if response.status == 429:
+            raise RetryableAPIError("HTTP 429", throttled=True)
+        if response.status >= 500:
+            raise RetryableAPIError(f"HTTP {response.status}")
+        response.raise_for_status()
+
+        text = await response.text()
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            if any(marker in text for marker in QUOTA_ERROR_MARKERS):
+                raise RetryableAPIError("API 호출 한도 초과", throttled=True)
+            raise RetryableAPIError("API 응답이 JSON 형식이 아님")
+
+        header = data.get("response", {}).get("header", {}) if isinstance(data, dict) else {}
+        result_code = header.get("resultCode")
+        if result_code in QUOTA_RESULT_CODES:
+            raise RetryableAPIError(f"API 호출 한도 초과 (resultCode {result_code})", throttled=True)
+        if result_code in TRANSIENT_RESULT_CODES:
+            raise RetryableAPIError(f"API 일시 오류 (resultCode {result_code}: {header.get('resultMsg', '')})")
+        return data
+
+    async def call(self, request: Callable[[], Awaitable[Dict]], max_attempts: int = 5) -> Dict:
+        """호출 제한을 적용해 request 실행 (재시도 대상 오류는 지터 지수 백오프 후 재시도)"""
+        last_error: Optional[Exception] = None
+        for attempt in range(max_attempts):
+            await self.acquire()
+            try:
+                result = await request()
+                self.record_success()
+                return result
+            except RetryableAPIError as e:
+                last_error = e
+                delay = self.backoff_delay(attempt)
+                if e.throttled:
+                    self.record_throttled(delay)
+                else:
+                    self.stats["server_errors"] += 1
+            except aiohttp.ClientResponseError:
+                # 429/5xx 이외의 HTTP 오류는 재시도하지 않음
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = e
+                delay = self.backoff_delay(attempt)
+
+            if attempt + 1 < max_attempts:
+                self.stats["retries"] += 1
+                print(f"API 요청 실패: {last_error} (시도 {attempt+1}/{max_attempts}), {delay:.2f}초 후 재시도")
+                await asyncio.sleep(delay)
+
+        raise RetryableAPIError(f"API 요청이 {max_attempts}회 연속 실패했습니다: {last_error}")
+
+    def get_stats(self) -> Dict:
+        """현재 호출 속도/대기 시간/일일 사용량"""
+        stats = dict(self.stats)
+        stats["wait_seconds"] = round(stats["wait_seconds"], 3)
+        stats["max_wait_seconds"] = round(stats["max_wait_seconds"], 3)
+        stats["avg_wait_seconds"] = round(stats["wait_seconds"] / stats["calls"], 4) if stats["calls"] else 0.0
+        stats["configured_rate"] = self.rate
+        stats["current_rate"] = round(self.current_rate, 3)
+        stats["cooldown_remaining"] = round(max(self._cooldown_until - time.monotonic(), 0.0), 3)
+        stats["daily_quota"] = self.daily_quota
+        stats["daily_used"] = self._daily_used
+        return stats
+
+
+# 전역 호출 제한기 인스턴스 (두 검색 엔진이 공유)
+rate_limiter = APIRateLimiter()
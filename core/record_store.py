@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공고 JSON 레코드 저장소 (추가 전용 NDJSON 세그먼트)
+공고마다 파일을 만들지 않고 세그먼트 파일 끝에 한 줄씩 추가하며, SQLite 색인에
+(세그먼트, 오프셋, 길이)를 기록해 공고번호로 한 번의 seek/read로 읽는다.
+동시에 들어온 저장 요청은 모아서 한 번의 write/fsync/트랜잭션으로 기록(group commit)하고,
+덮어쓴 레코드가 많아진 세그먼트는 살아 있는 레코드만 옮겨 적고 삭제(compaction)
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from core.config import settings
+from core.file_manifest import FileManifest, file_manifest as default_file_manifest
+from core.json_codec import dumps_bytes, loads
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".ndjson"
+
+
+class RecordStore:
+    """키(공고번호) → JSON 레코드 세그먼트 저장소"""
+
+    def __init__(self, root: Optional[Path] = None,
+                 segment_max_bytes: int = settings.RECORD_SEGMENT_MAX_MB * 1024 * 1024,
+                 group_commit_ms: float = settings.RECORD_GROUP_COMMIT_MS,
+                 group_commit_max: int = settings.RECORD_GROUP_COMMIT_MAX,
+                 compact_dead_ratio: float = settings.RECORD_COMPACT_DEAD_RATIO,
+                 fsync: bool = settings.RECORD_FSYNC,
+                 manifest: Optional[FileManifest] = None):
+        self.root = Path(root or settings.downloads_json_dir / "segments")
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = max(segment_max_bytes, 1024)
+        self.group_commit_seconds = group_commit_ms / 1000
+        self.group_commit_max = max(group_commit_max, 1)
+        self.compact_dead_ratio = compact_dead_ratio
+        self.fsync = fsync
+        self.manifest = manifest or default_file_manifest
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.root / "index.db"), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            " key TEXT PRIMARY KEY,"
+            " segment INTEGER NOT NULL,"
+            " offset INTEGER NOT NULL,"
+            " length INTEGER NOT NULL,"
+            " stored_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_records_segment ON records(segment)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS segments ("
+            " segment INTEGER PRIMARY KEY,"
+            " total_bytes INTEGER NOT NULL,"
+            " live_bytes INTEGER NOT NULL)"
+        )
+
+        # 가장 최근 세그먼트에 이어서 기록 (색인에 없는 끝부분은 중단된 기록이므로 잘라냄)
+        row = self._conn.execute("SELECT MAX(segment) FROM segments").fetchone()
+        self._active = row[0] or 0
+        self._active_file = None
+        self._active_size = 0
+        if self._active:
+            self._open_active()
+        else:
+            self._roll_segment()
+
+        # 대기 중인 저장 요청 (이벤트 루프 전용)
+        self._pending: List[Tuple[str, Any, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+        self.stats = {
+            "records_written": 0,
+            "batches": 0,
+            "bytes_written": 0,
+            "reads": 0,
+            "segments_compacted": 0,
+            "bytes_reclaimed": 0
+        }
+
+    # ------------------------------------------------------------------
+    # 세그먼트 파일
+    # ------------------------------------------------------------------
+
+    def segment_path(self, segment: int) -> Path:
+        return self.root / f"{SEGMENT_PREFIX}{segment:06d}{SEGMENT_SUFFIX}"
+
+    def _open_active(self):
+        path = self.segment_path(self._active)
+        row = self._conn.execute(
+            "SELECT total_bytes FROM segments WHERE segment = ?", (self._active,)
+        ).fetchone()
+        self._active_file = open(path, "ab")
+        if row and self._active_file.tell() > row[0]:
+            self._active_file.truncate(row[0])
+        self._active_file.seek(0, os.SEEK_END)
+        self._active_size = self._active_file.tell()
+
+    def _roll_segment(self):
+        """새 세그먼트 시작 (이전 세그먼트는 봉인되어 압축 대상이 됨)"""
+        if self._active_file is not None:
+            self._active_file.close()
+        self._active += 1
+        self._conn.execute(
+            "INSERT OR IGNORE INTO segments (segment, total_bytes, live_bytes) VALUES (?, 0, 0)", (self._active,)
+        )
+        self._active_file = open(self.segment_path(self._active), "ab")
+        self._active_size = self._active_file.tell()
+
+    def _append(self, lines: List[Tuple[str, bytes]]) -> List[Tuple[str, int, int, int]]:
+        """현재 세그먼트 끝에 기록 (세그먼트 한도를 넘으면 다음 세그먼트로). (키, 세그먼트, 오프셋, 길이)"""
+        locations = []
+        buffer = bytearray()
+        start = self._active_size
+        for key, line in lines:
+            if self._active_size > 0 and self._active_size + len(line) > self.segment_max_bytes:
+                self._write_buffer(buffer)
+                buffer.clear()
+                self._roll_segment()
+            locations.append((key, self._active, self._active_size, len(line)))
+            buffer += line
+            self._active_size += len(line)
+        self._write_buffer(buffer)
+        return locations
+
+    def _write_buffer(self, buffer: bytearray):
+        if not buffer:
+            return
+        self._active_file.write(buffer)
+        self._active_file.flush()
+        if self.fsync:
+            os.fsync(self._active_file.fileno())
+
+    def _index(self, locations: List[Tuple[str, int, int, int]], now: float):
+        """색인 갱신과 세그먼트별 유효 바이트 계산 (트랜잭션 안에서 호출)"""
+        for key, segment, offset, length in locations:
+            old = self._conn.execute("SELECT segment, length FROM records WHERE key = ?", (key,)).fetchone()
+            if old:
+                self._conn.execute(
+                    "UPDATE segments SET live_bytes = live_bytes - ? WHERE segment = ?", (old[1], old[0])
+                )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO records (key, segment, offset, length, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (key, segment, offset, length, now)
+            )
+            self._conn.execute(
+                "INSERT INTO segments (segment, total_bytes, live_bytes) VALUES (?, ?, ?)"
+                " ON CONFLICT(segment) DO UPDATE SET total_bytes = total_bytes + excluded.total_bytes,"
+                " live_bytes = live_bytes + excluded.live_bytes",
+                (segment, length, length)
+            )
+
+    def write_batch(self, records: List[Tuple[str, Any]]) -> int:
+        """레코드 묶음을 한 번의 기록/fsync/트랜잭션으로 저장 (동기, 같은 키는 마지막 값이 유효)"""
+        if not records:
+            return 0
+        now = time.time()
+        lines = [(key, self._encode(key, record, now)) for key, record in records]
+        with self._lock:
+            sealed_before = self._active
+            locations = self._append(lines)
+            self._conn.execute("BEGIN")
+            try:
+                self._index(locations, now)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self.stats["records_written"] += len(lines)
+            self.stats["batches"] += 1
+            self.stats["bytes_written"] += sum(len(line) for _, line in lines)
+            if self._active != sealed_before:
+                self._compact_locked()
+            touched = {segment for _, segment, _, _ in locations} | {self._active}
+        # 세그먼트 크기를 다운로드 파일 목록에 반영
+        self.manifest.record_many(self.segment_path(segment) for segment in touched)
+        return len(lines)
+
+    @staticmethod
+    def _encode(key: str, record: Any, now: float) -> bytes:
+        return dumps_bytes({"key": key, "stored_at": now, "record": record}) + b"\n"
+
+    # ------------------------------------------------------------------
+    # 비동기 저장 (group commit)
+    # ------------------------------------------------------------------
+
+    async def put(self, key: str, record: Any):
+        """레코드 저장. 짧은 시간 안에 들어온 요청은 한 번에 기록되며, 기록이 끝나면 반환"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((key, record, future))
+        if len(self._pending) >= self.group_commit_max:
+            self._schedule_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.group_commit_seconds, self._schedule_flush
+            )
+        await future
+
+    def _schedule_flush(self):
+        # 종료 시 기다릴 수 있도록 기록 작업 참조 보관
+        task = asyncio.ensure_future(self._flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def put_many(self, records: List[Tuple[str, Any]]) -> int:
+        """이미 모아 둔 레코드 묶음 저장 (스레드에서 기록)"""
+        return await asyncio.to_thread(self.write_batch, records)
+
+    def _cancel_flush_timer(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    @staticmethod
+    def _resolve(batch: List[Tuple[str, Any, asyncio.Future]], error: Optional[Exception] = None):
+        for _, _, future in batch:
+            if not future.done():
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(None)
+
+    async def _flush(self):
+        self._cancel_flush_timer()
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return
+            try:
+                await asyncio.to_thread(self.write_batch, [(key, record) for key, record, _ in batch])
+            except Exception as e:
+                self._resolve(batch, e)
+                return
+            self._resolve(batch)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def _locate(self, key: str) -> Optional[Tuple[int, int, int, float]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT segment, offset, length, stored_at FROM records WHERE key = ?", (key,)
+            ).fetchone()
+
+    def get_entry(self, key: str) -> Optional[Dict]:
+        """저장된 줄 전체 ({key, stored_at, record})"""
+        location = self._locate(key)
+        if location is None:
+            return None
+        segment, offset, length, _ = location
+        self.stats["reads"] += 1
+        try:
+            with open(self.segment_path(segment), "rb") as f:
+                f.seek(offset)
+                data = f.read(length)
+        except FileNotFoundError:
+            # 압축 중 옮겨진 경우 새 위치로 다시 조회
+            relocated = self._locate(key)
+            if relocated is None or relocated[0] == segment:
+                return None
+            return self.get_entry(key)
+        return loads(data)
+
+    def get(self, key: str) -> Optional[Any]:
+        """공고번호로 레코드 조회"""
+        entry = self.get_entry(key)
+        return entry["record"] if entry else None
+
+    def contains(self, key: str) -> bool:
+        return self._locate(key) is not None
+
+    # ------------------------------------------------------------------
+    # 압축
+    # ------------------------------------------------------------------
+
+    def _compact_locked(self) -> int:
+        """유효 비율이 낮은 봉인 세그먼트의 살아 있는 레코드를 현재 세그먼트로 옮기고 삭제"""
+        candidates = self._conn.execute(
+            "SELECT segment, total_bytes, live_bytes FROM segments"
+            " WHERE segment < ? AND total_bytes > 0 AND live_bytes <= total_bytes * ?",
+            (self._active, 1 - self.compact_dead_ratio)
+        ).fetchall()
+        compacted = 0
+        for segment, total_bytes, live_bytes in candidates:
+            rows = self._conn.execute(
+                "SELECT key, offset, length, stored_at FROM records WHERE segment = ? ORDER BY offset", (segment,)
+            ).fetchall()
+            path = self.segment_path(segment)
+            moved = []
+            if rows:
+                with open(path, "rb") as f:
+                    for key, offset, length, stored_at in rows:
+                        f.seek(offset)
+                        moved.append((key, f.read(length), stored_at))
+            locations = self._append([(key, line) for key, line, _ in moved])
+            self._conn.execute("BEGIN")
+            try:
+                for (key, new_segment, offset, length), (_, _, stored_at) in zip(locations, moved):
+                    self._conn.execute(
+                        "UPDATE records SET segment = ?, offset = ?, length = ? WHERE key = ?",
+                        (new_segment, offset, length, key)
+                    )
+                    self._conn.execute(
+                        "UPDATE segments SET total_bytes = total_bytes + ?, live_bytes = live_bytes + ?"
+                        " WHERE segment = ?",
+                        (length, length, new_segment)
+                    )
+                self._conn.execute("DELETE FROM segments WHERE segment = ?", (segment,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            path.unlink(missing_ok=True)
+            self.manifest.remove(path)
+            compacted += 1
+            self.stats["segments_compacted"] += 1
+            self.stats["bytes_reclaimed"] += total_bytes - live_bytes
+        return compacted
+
+    def compact(self) -> int:
+        """압축 실행 (현재 세그먼트를 봉인한 뒤 대상 세그먼트 정리). 정리한 세그먼트 수"""
+        with self._lock:
+            if self._active_size > 0:
+                self._roll_segment()
+            compacted = self._compact_locked()
+            active = self.segment_path(self._active)
+        self.manifest.record(active)
+        return compacted
+
+    async def close(self):
+        """진행 중인 기록을 기다리고 대기 중인 저장 요청을 기록한 뒤 세그먼트 닫기"""
+        self._cancel_flush_timer()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        batch, self._pending = self._pending, []
+        if batch:
+            try:
+                self.write_batch([(key, record) for key, record, _ in batch])
+            except Exception as e:
+                self._resolve(batch, e)
+            else:
+                self._resolve(batch)
+        with self._lock:
+            if self._active_file is not None:
+                self._active_file.close()
+                self._active_file = None
+
+    def get_stats(self) -> Dict:
+        """세그먼트/레코드/유효 바이트 통계"""
+        with self._lock:
+            segments = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(total_bytes), 0), COALESCE(SUM(live_bytes), 0) FROM segments"
+            ).fetchone()
+            records = self._conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+        stats = dict(self.stats)
+        stats.update(
+            segments=segments[0],
+            total_bytes=segments[1],
+            live_bytes=segments[2],
+            records=records,
+            active_segment=self._active,
+            avg_batch_size=round(stats["records_written"] / stats["batches"], 2) if stats["batches"] else 0.0
+        )
+        return stats
+
+
+# 전역 공고 JSON 저장소
+record_store = RecordStore()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검색 결과 캐시
+메모리 LRU(앞단) + SQLite(뒷단) 2단 구조, TTL/개수 기반 만료
+"""
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from core.config import settings
+from core.json_codec import dumps, loads
+
+
+class SearchResultCache:
+    """크기/기간 제한이 있는 검색 결과 캐시"""
+
+    def __init__(self, namespace: str,
+                 persist: bool = True,
+                 db_path: Optional[Path] = None,
+                 max_memory_items: int = settings.MAX_CACHED_SEARCHES,
+                 max_persisted_items: int = settings.CACHE_DB_MAX_SEARCHES,
+                 ttl_hours: float = settings.CACHE_EXPIRE_HOURS):
+        self.namespace = namespace
+        self.max_memory_items = max(max_memory_items, 1)
+        self.max_persisted_items = max(max_persisted_items, 1)
+        self.ttl_seconds = ttl_hours * 3600
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if persist:
+            db_path = Path(db_path or settings.downloads_cache_dir / "search_cache.db")
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " stored_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_search_cache_accessed ON search_cache(namespace, accessed_at)"
+            )
+
+        self.stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0,
+            "expired": 0
+        }
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return self.ttl_seconds > 0 and time.time() - stored_at > self.ttl_seconds
+
+    def _remember(self, key: str, stored_at: float, value: Any):
+        """메모리 LRU에 저장 (초과분은 가장 오래 사용하지 않은 항목부터 제거)"""
+        self._memory[key] = (stored_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+            self.stats["memory_evictions"] += 1
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """캐시 조회 (메모리 → SQLite 순)"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._is_expired(entry[0]):
+                    self._memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    return entry[1]
+                self._delete(key)
+                self.stats["expired"] += 1
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT value, stored_at FROM search_cache WHERE namespace = ? AND key = ?",
+                    (self.namespace, key)
+                ).fetchone()
+                if row:
+                    if not self._is_expired(row[1]):
+                        self._conn.execute(
+                            "UPDATE search_cache SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                            (time.time(), self.namespace, key)
+                        )
+                        value = loads(row[0])
+                        self._remember(key, row[1], value)
+                        self.stats["disk_hits"] += 1
+                        return value
+                    self._delete(key)
+                    self.stats["expired"] += 1
+
+            self.stats["misses"] += 1
+            return default
+
+    def set(self, key: str, value: Any):
+        """캐시 저장 (영속 모드면 SQLite에도 기록)"""
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO search_cache (namespace, key, value, stored_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (self.namespace, key, dumps(value), now, now)
+                )
+                self._evict_persisted()
+
+    def _evict_persisted(self):
+        """SQLite 만료/초과 항목 정리"""
+        if self.ttl_seconds > 0:
+            cursor = self._conn.execute(
+                "DELETE FROM search_cache WHERE namespace = ? AND stored_at < ?",
+                (self.namespace, time.time() - self.ttl_seconds)
+            )
+            self.stats["expired"] += max(cursor.rowcount, 0)
+
+        cursor = self._conn.execute(
+            "DELETE FROM search_cache WHERE namespace = ? AND key IN ("
+            " SELECT key FROM search_cache WHERE namespace = ?"
+            " ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.namespace, self.namespace, self.max_persisted_items)
+        )
+        self.stats["disk_evictions"] += max(cursor.rowcount, 0)
+
+    def _delete(self, key: str):
+        self._memory.pop(key, None)
+        if self._conn is not None:
+            self._conn.execute(
+                "DELETE FROM search_cache WHERE namespace = ? AND key = ?", (self.namespace, key)
+            )
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """항목 제거 후 반환"""
+        with self._lock:
+            value = self.get(key, default)
+            self._delete(key)
+            return value
+
+    def keys(self) -> List[str]:
+        """메모리에 있는 키 목록"""
+        with self._lock:
+            return list(self._memory.keys())
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """메모리에 있는 항목 목록"""
+        with self._lock:
+            return [(key, entry[1]) for key, entry in self._memory.items()]
+
+    def __contains__(self, key: str) -> bool:
+        # 존재 여부만 확인 (적중/실패 통계와 LRU 순서는 건드리지 않음)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and not self._is_expired(entry[0]):
+                return True
+            if self._conn is None:
+                return False
+            row = self._conn.execute(
+                "SELECT stored_at FROM search_cache WHERE namespace = ? AND key = ?", (self.namespace, key)
+            ).fetchone()
+            return row is not None and not self._is_expired(row[0])
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any):
+        self.set(key, value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def get_stats(self) -> Dict:
+        """적중/실패/만료 통계"""
+        stats = dict(self.stats)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_ratio"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else 0.0
+        stats["memory_items"] = len(self._memory)
+        if self._conn is not None:
+            with self._lock:
+                stats["persisted_items"] = self._conn.execute(
+                    "SELECT COUNT(*) FROM search_cache WHERE namespace = ?", (self.namespace,)
+                ).fetchone()[0]
+        return stats
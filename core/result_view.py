@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검색 결과 조회용 정렬/페이지/필드 선택
+저장된 검색 결과(NoticeRecord) 전체를 정렬 키로만 정렬하고, 응답할 페이지의 레코드만 필드를 골라 dict로 만든다
+(원본 API 응답 original_data 는 요청한 경우에만 포함)
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.notice_record import DEFAULT_FIELDS, NoticeRecord
+
+
+def _raw(field: str) -> Callable[[NoticeRecord], Any]:
+    # 날짜는 포맷 전 원본 값 기준 (날짜 문자열은 사전순 = 시간순)
+    return lambda record: str(record.raw.get(field) or "")
+
+
+def _attr(name: str) -> Callable[[NoticeRecord], Any]:
+    return lambda record: getattr(record, name)
+
+
+# 정렬 키 (UI 별칭 포함, 금액은 수집 시 계산한 정수 기준)
+SORT_KEYS: Dict[str, Callable[[NoticeRecord], Any]] = {
+    "date": _raw("bidNtceDt"),
+    "bidNtceDt": _raw("bidNtceDt"),
+    "opening": _raw("opengDt"),
+    "opengDt": _raw("opengDt"),
+    "closing": _raw("bidClseDt"),
+    "bidClseDt": _raw("bidClseDt"),
+    "name": _attr("bidNtceNm"),
+    "bidNtceNm": _attr("bidNtceNm"),
+    "agency": _attr("ntceInsttNm"),
+    "ntceInsttNm": _attr("ntceInsttNm"),
+    "budget": _attr("budget_amount"),
+    "asignBdgtAmt": _attr("budget_amount"),
+    "price": _attr("price_amount"),
+    "presmptPrce": _attr("price_amount"),
+    "attachments": lambda record: len(record.attachments)
+}
+
+
+def parse_fields(fields: Optional[str]) -> Tuple[str, ...]:
+    """fields=a,b,c 파싱 (미지정 시 기본 필드)"""
+    if not fields:
+        return DEFAULT_FIELDS
+    parsed = tuple(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+    return parsed or DEFAULT_FIELDS
+
+
+def parse_sort(sort: Optional[str], order: Optional[str] = None) -> Tuple[Optional[str], bool]:
+    """sort=key 또는 sort=-key (order=asc/desc 로도 지정). (정렬 키, 내림차순 여부)"""
+    if not sort:
+        return None, False
+    descending = sort.startswith("-")
+    key = sort.lstrip("-+")
+    if key not in SORT_KEYS:
+        raise ValueError(f"지원하지 않는 정렬 키: {key} (사용 가능: {', '.join(SORT_KEYS)})")
+    if order:
+        if order not in ("asc", "desc"):
+            raise ValueError("order 는 asc 또는 desc 입니다")
+        descending = order == "desc"
+    return key, descending
+
+
+def encode_cursor(offset: int, sort_key: Optional[str], descending: bool) -> str:
+    payload = json.dumps({"o": offset, "s": sort_key, "d": descending}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: Optional[str], descending: bool) -> int:
+    """커서에서 시작 위치 복원 (다른 정렬로 만든 커서는 거부)"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        offset = int(payload["o"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError("잘못된 커서입니다")
+    if payload.get("s") != sort_key or bool(payload.get("d")) != descending or offset < 0:
+        raise ValueError("커서의 정렬 조건이 요청과 다릅니다")
+    return offset
+
+
+def paginate_results(items: List[NoticeRecord], *, page: Optional[int] = None, limit: int = 50,
+                     cursor: Optional[str] = None, sort: Optional[str] = None, order: Optional[str] = None,
+                     fields: Optional[str] = None, bid_ntce_no: Optional[str] = None) -> Dict:
+    """정렬 → (공고번호 필터) → 페이지 → 필드 선택. 응답 크기는 페이지 크기에 비례"""
+    sort_key, descending = parse_sort(sort, order)
+    selected = parse_fields(fields)
+
+    if bid_ntce_no:
+        items = [record for record in items if record.bidNtceNo == bid_ntce_no]
+    if sort_key:
+        items = sorted(items, key=SORT_KEYS[sort_key], reverse=descending)
+
+    if cursor:
+        offset = decode_cursor(cursor, sort_key, descending)
+    else:
+        offset = (max(page or 1, 1) - 1) * limit
+    page_items = items[offset:offset + limit]
+    next_offset = offset + len(page_items)
+    has_more = next_offset < len(items)
+
+    return {
+        "total_items": len(items),
+        "page": offset // limit + 1,
+        "limit": limit,
+        "offset": offset,
+        "sort": sort_key,
+        "order": "desc" if descending else "asc",
+        "fields": list(selected),
+        "has_more": has_more,
+        "next_cursor": encode_cursor(next_offset, sort_key, descending) if has_more else None,
+        "results": [record.to_dict(selected) for record in page_items]
+    }
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다운로드 저장 공간 정리 (백그라운드)
+검색별 용량 한도와 전체 용량 한도를 넘으면 파일 목록 색인(FileManifest)에서
+가장 오래 접근하지 않은 파일부터 삭제하고, 연결이 모두 끊긴 blob 원본을 회수.
+전체 한도는 실제 디스크 사용량(blob 원본 + 하드링크가 아닌 파일) 기준이며,
+진행 중인 검색의 파일과 최근에 쓰거나 연 파일은 삭제하지 않음
+"""
+
+import asyncio
+import os
+import time
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+from core.blob_store import BlobStore, blob_store as default_blob_store
+from core.config import settings
+from core.file_manifest import FileManifest, file_manifest as default_file_manifest
+from core.job_manager import SearchJobManager, job_manager as default_job_manager
+
+# 삭제 대상 파일 종류 (공고 JSON 세그먼트는 RecordStore 압축으로 관리)
+EVICTABLE_TYPES = ("search", "attachment", "report", "json")
+
+
+class StorageJanitor:
+    """용량 한도 기반 LRU 파일 정리"""
+
+    def __init__(self, manifest: Optional[FileManifest] = None,
+                 blob_store: Optional[BlobStore] = None,
+                 job_manager: Optional[SearchJobManager] = None,
+                 budget_bytes: int = settings.STORAGE_BUDGET_MB * 1024 * 1024,
+                 search_quota_bytes: int = settings.STORAGE_SEARCH_QUOTA_MB * 1024 * 1024,
+                 min_age_seconds: float = settings.STORAGE_EVICT_MIN_AGE_MINUTES * 60):
+        self.manifest = manifest or default_file_manifest
+        self.blob_store = blob_store or default_blob_store
+        self.job_manager = job_manager or default_job_manager
+        self.budget_bytes = budget_bytes
+        self.search_quota_bytes = search_quota_bytes
+        self.min_age_seconds = min_age_seconds
+        self._running = asyncio.Lock()
+        self.stats = {
+            "runs": 0,
+            "files_evicted": 0,
+            "bytes_evicted": 0,
+            "bytes_freed": 0,
+            "quota_evictions": 0,
+            "budget_evictions": 0,
+            "skipped_active": 0,
+            "blobs_collected": 0,
+            "blob_bytes_freed": 0,
+            "last_run": None,
+            "last_duration_ms": None,
+            "last_error": None
+        }
+
+    def physical_usage(self) -> Tuple[int, Dict[int, Tuple[str, int]]]:
+        """실제 디스크 사용량과 blob 원본 inode 목록 (원본의 하드링크는 원본 크기로 한 번만 계산)"""
+        blobs = self.blob_store.inodes()
+        used = sum(size for _, size in blobs.values()) + self.manifest.physical_size(blobs.keys())
+        return used, blobs
+
+    def _evict(self, relative: str, blobs: Dict[int, Tuple[str, int]], accessed_before: float,
+               result: Dict) -> Optional[int]:
+        """파일 삭제. 실제로 비워진 바이트 수 반환 (실패 시 None)"""
+        path = self.manifest.absolute_path(relative)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            stat = None
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            print(f"파일 정리 실패: {path} - {e}")
+            return None
+        self.manifest.remove(path)
+        if stat is None:
+            return 0
+        if stat.st_nlink == 1:
+            return stat.st_size
+        # 원본의 마지막 하드링크였으면 원본까지 회수해야 공간이 비워짐
+        blob = blobs.get(stat.st_ino)
+        if blob is None or stat.st_nlink > 2:
+            return 0
+        freed = self.blob_store.release(blob[0], accessed_before)
+        if freed is None:
+            return 0
+        result["blobs_collected"] += 1
+        result["blob_bytes_freed"] += freed
+        return freed
+
+    def sweep(self, protected_search_ids: Set[str]) -> Dict:
+        """한 번 정리 (동기, 스레드에서 실행). 검색별 한도 → 전체 한도 순"""
+        accessed_before = time.time() - self.min_age_seconds
+        result = {
+            "quota_evictions": 0,
+            "budget_evictions": 0,
+            "bytes_evicted": 0,
+            "bytes_freed": 0,
+            "skipped_active": 0,
+            "blobs_collected": 0,
+            "blob_bytes_freed": 0
+        }
+        emptied_dirs = set()
+        physical_used, blobs = self.physical_usage()
+
+        # 검색별 한도
+        if self.search_quota_bytes > 0:
+            for search_id, used in self.manifest.search_usage().items():
+                if used <= self.search_quota_bytes:
+                    continue
+                if search_id in protected_search_ids:
+                    result["skipped_active"] += 1
+                    continue
+                for relative, _, size in self.manifest.least_recently_accessed(("search",), accessed_before, search_id):
+                    if used <= self.search_quota_bytes:
+                        break
+                    freed = self._evict(relative, blobs, accessed_before, result)
+                    if freed is not None:
+                        used -= size
+                        result["quota_evictions"] += 1
+                        result["bytes_evicted"] += size
+                        result["bytes_freed"] += freed
+                        emptied_dirs.add(search_id)
+
+        # 전체 한도 (실제 디스크 사용량 기준, 실제로 비워진 바이트만 차감)
+        if self.budget_bytes > 0:
+            used = physical_used - result["bytes_freed"]
+            if used > self.budget_bytes:
+                for relative, search_id, size in self.manifest.least_recently_accessed(EVICTABLE_TYPES, accessed_before):
+                    if used <= self.budget_bytes:
+                        break
+                    if search_id in protected_search_ids:
+                        result["skipped_active"] += 1
+                        continue
+                    freed = self._evict(relative, blobs, accessed_before, result)
+                    if freed is not None:
+                        used -= freed
+                        result["budget_evictions"] += 1
+                        result["bytes_evicted"] += size
+                        result["bytes_freed"] += freed
+                        if search_id:
+                            emptied_dirs.add(search_id)
+
+        # 비워진 검색 디렉토리 삭제
+        for search_id in emptied_dirs:
+            try:
+                os.rmdir(self.manifest.absolute_path(search_id))
+            except OSError:
+                pass
+
+        # 검색 디렉토리 하드링크가 모두 지워진 원본 회수
+        collected = self.blob_store.collect_unreferenced(accessed_before)
+        result["blobs_collected"] += collected["blobs_collected"]
+        result["blob_bytes_freed"] += collected["blob_bytes_freed"]
+        return result
+
+    async def run_once(self, extra_protected: Iterable[str] = ()) -> Dict:
+        """진행 중인 검색을 제외하고 정리 (파일 작업은 스레드에서)"""
+        async with self._running:
+            protected = set(self.job_manager.active_search_ids()) | set(extra_protected)
+            started = time.time()
+            result = await asyncio.to_thread(self.sweep, protected)
+            evicted = result["quota_evictions"] + result["budget_evictions"]
+            self.stats["runs"] += 1
+            self.stats["files_evicted"] += evicted
+            for key in ("bytes_evicted", "bytes_freed", "quota_evictions", "budget_evictions", "skipped_active",
+                        "blobs_collected", "blob_bytes_freed"):
+                self.stats[key] += result[key]
+            self.stats["last_run"] = started
+            self.stats["last_duration_ms"] = round((time.time() - started) * 1000, 1)
+            self.stats["last_error"] = None
+            return {"files_evicted": evicted, **result, "duration_ms": self.stats["last_duration_ms"]}
+
+    async def run_periodically(self, interval_seconds: float,
+                               extra_protected: Callable[[], Iterable[str]] = lambda: ()):
+        """주기적으로 정리 (취소될 때까지)"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                result = await self.run_once(extra_protected())
+                if result["files_evicted"] or result["blobs_collected"]:
+                    print(f"저장 공간 정리: 파일 {result['files_evicted']}개 ({result['bytes_evicted']} bytes),"
+                          f" blob {result['blobs_collected']}개")
+            except Exception as e:
+                self.stats["last_error"] = str(e)
+                print(f"저장 공간 정리 오류: {e}")
+
+    def get_stats(self) -> Dict:
+        """정리 통계와 현재 사용량/한도"""
+        stats = dict(self.stats)
+        stats.update(
+            used_bytes=self.physical_usage()[0],
+            logical_bytes=self.manifest.total_size(),
+            budget_bytes=self.budget_bytes,
+            search_quota_bytes=self.search_quota_bytes
+        )
+        return stats
+
+
+# 전역 저장 공간 정리
+storage_janitor = StorageJanitor()
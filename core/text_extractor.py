@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+첨부파일 텍스트 추출 (HWPX / HWP 5.0)
+HWPX는 zip 안의 section XML을 스트리밍 파싱하고, HWP 5.0은 OLE 복합 문서의 BodyText 섹션을
+raw deflate 해제 후 레코드 단위로 읽음. 추출은 ProcessPoolExecutor에서 실행되어 이벤트 루프를 막지 않으며
+결과는 파일 SHA-256 기준으로 SQLite에 캐시
+"""
+
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import re
+import sqlite3
+import struct
+import threading
+import time
+import zipfile
+import zlib
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core.config import settings
+
+# HWP 5.0 OLE 파싱 (선택 의존성)
+try:
+    import olefile
+    OLEFILE_AVAILABLE = True
+except ImportError:
+    OLEFILE_AVAILABLE = False
+
+# 추출 대상 확장자
+EXTRACTABLE_EXTENSIONS = {".hwp", ".hwpx"}
+
+ZIP_MAGIC = b"PK\x03\x04"
+OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+# HWP 5.0 레코드 태그 (HWPTAG_BEGIN + 51)
+HWPTAG_PARA_TEXT = 67
+# FileHeader 속성 비트
+HWP_FLAG_COMPRESSED = 0x01
+HWP_FLAG_PASSWORD = 0x02
+HWP_FLAG_DISTRIBUTION = 0x04
+
+# PARA_TEXT 제어 문자: 1 WCHAR 크기 문자 제어 (나머지 0~31은 8 WCHAR 크기 인라인/확장 제어)
+HWP_CHAR_CONTROLS = {0, 10, 13, 24, 25, 26, 27, 28, 29, 30, 31}
+_CONTROL_RE = re.compile(r"[\x00-\x1f]")
+
+_SECTION_RE = re.compile(r"^Contents/section(\d+)\.xml$")
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def extract_text_from_hwpx(path: str) -> str:
+    """HWPX 본문 텍스트 추출 (section XML 스트리밍 파싱, 문단마다 줄바꿈)"""
+    parts: List[str] = []
+    with zipfile.ZipFile(path) as archive:
+        sections = sorted(
+            (int(match.group(1)), name)
+            for name in archive.namelist()
+            for match in [_SECTION_RE.match(name)] if match
+        )
+        for _, name in sections:
+            with archive.open(name) as stream:
+                for _, elem in ET.iterparse(stream, events=("end",)):
+                    tag = _local_name(elem.tag)
+                    if tag == "t":
+                        if elem.text:
+                            parts.append(elem.text)
+                        # <hp:t>텍스트<hp:tab/>텍스트</hp:t> 형태의 자식 요소 뒤 텍스트
+                        for child in elem:
+                            if _local_name(child.tag) == "tab":
+                                parts.append("\t")
+                            if child.tail:
+                                parts.append(child.tail)
+                    elif tag == "p":
+                        parts.append("\n")
+                        elem.clear()
+    return "".join(parts)
+
+
+def _decode_para_text(payload: bytes) -> str:
+    """PARA_TEXT 레코드(UTF-16LE)에서 제어 문자를 걸러 텍스트로 변환"""
+    text = payload[:len(payload) & ~1].decode("utf-16-le", errors="surrogatepass")
+    if not _CONTROL_RE.search(text):
+        return text
+
+    out = []
+    pos = 0
+    while pos < len(text):
+        match = _CONTROL_RE.search(text, pos)
+        if not match:
+            out.append(text[pos:])
+            break
+        start = match.start()
+        out.append(text[pos:start])
+        code = ord(text[start])
+        if code in (10, 13):
+            out.append("\n")
+            pos = start + 1
+        elif code in HWP_CHAR_CONTROLS:
+            if code in (30, 31):  # 묶음 빈칸/고정폭 빈칸
+                out.append(" ")
+            pos = start + 1
+        else:
+            if code == 9:
+                out.append("\t")
+            pos = start + 8
+    return "".join(out)
+
+
+def _iter_para_text(data: bytes):
+    """섹션 레코드 스트림에서 PARA_TEXT 레코드 본문 순회"""
+    offset = 0
+    length = len(data)
+    while offset + 4 <= length:
+        header = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        tag_id = header & 0x3FF
+        size = (header >> 20) & 0xFFF
+        if size == 0xFFF:
+            if offset + 4 > length:
+                break
+            size = struct.unpack_from("<I", data, offset)[0]
+            offset += 4
+        if tag_id == HWPTAG_PARA_TEXT:
+            yield data[offset:offset + size]
+        offset += size
+
+
+def extract_text_from_hwp(path: str) -> str:
+    """HWP 5.0 본문 텍스트 추출 (OLE BodyText/Section*, 배포용/암호 문서는 미리보기 텍스트)"""
+    if not OLEFILE_AVAILABLE:
+        raise RuntimeError("olefile 패키지가 설치되지 않아 HWP 텍스트를 추출할 수 없습니다")
+
+    with olefile.OleFileIO(path) as ole:
+        header = ole.openstream("FileHeader").read()
+        if not header.startswith(b"HWP Document File"):
+            raise ValueError("HWP 5.0 문서가 아닙니다")
+        flags = struct.unpack_from("<I", header, 36)[0]
+
+        sections = sorted(
+            (int(entry[1][len("Section"):]), "/".join(entry))
+            for entry in ole.listdir()
+            if len(entry) == 2 and entry[0] == "BodyText" and entry[1].startswith("Section")
+            and entry[1][len("Section"):].isdigit()
+        )
+        if flags & (HWP_FLAG_PASSWORD | HWP_FLAG_DISTRIBUTION) or not sections:
+            # 본문이 암호화된 문서는 미리보기 텍스트만 사용
+            if ole.exists("PrvText"):
+                return ole.openstream("PrvText").read().decode("utf-16-le", errors="ignore")
+            return ""
+
+        parts = []
+        for _, name in sections:
+            data = ole.openstream(name).read()
+            if flags & HWP_FLAG_COMPRESSED:
+                data = zlib.decompress(data, -15)
+            for payload in _iter_para_text(data):
+                parts.append(_decode_para_text(payload))
+    return "".join(parts).encode("utf-8", errors="ignore").decode("utf-8")
+
+
+def detect_format(path: str) -> Optional[str]:
+    """파일 시그니처로 형식 판별 (확장자보다 우선)"""
+    with open(path, "rb") as f:
+        magic = f.read(8)
+    if magic.startswith(ZIP_MAGIC):
+        return "hwpx"
+    if magic == OLE_MAGIC:
+        return "hwp"
+    return None
+
+
+def extract_text(path: str) -> Dict:
+    """파일 하나의 텍스트 추출 (프로세스 풀 작업 단위)"""
+    started = time.perf_counter()
+    result = {"format": None, "text": "", "error": None}
+    try:
+        file_format = detect_format(path)
+        result["format"] = file_format
+        if file_format == "hwpx":
+            result["text"] = extract_text_from_hwpx(path)
+        elif file_format == "hwp":
+            result["text"] = extract_text_from_hwp(path)
+        else:
+            result["error"] = "지원하지 않는 파일 형식"
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(settings.DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TextExtractor:
+    """프로세스 풀 기반 텍스트 추출기 (파일 해시 기준 캐시)"""
+
+    def __init__(self, db_path: Optional[Path] = None, workers: int = settings.EXTRACT_WORKERS):
+        db_path = Path(db_path or settings.downloads_cache_dir / "extracted_text.db")
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.workers = max(workers, 1)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS extracted_text ("
+            " sha256 TEXT PRIMARY KEY,"
+            " format TEXT,"
+            " text TEXT NOT NULL,"
+            " error TEXT,"
+            " size INTEGER NOT NULL,"
+            " seconds REAL NOT NULL,"
+            " extracted_at REAL NOT NULL)"
+        )
+        self.stats = {
+            "cache_hits": 0,
+            "extracted": 0,
+            "failed": 0,
+            "bytes_processed": 0,
+            "cpu_seconds": 0.0
+        }
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # 스레드와 SQLite 연결을 가진 서버 프로세스를 fork하면 상속된 잠금으로 자식이 멈출 수 있어
+            # 깨끗한 프로세스에서 시작 (forkserver가 없는 플랫폼은 spawn)
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context(method))
+        return self._pool
+
+    def get_cached(self, sha256: str) -> Optional[Dict]:
+        """캐시된 추출 결과"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT format, text, error, size FROM extracted_text WHERE sha256 = ?", (sha256,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"sha256": sha256, "format": row[0], "text": row[1], "error": row[2], "size": row[3]}
+
+    def _store(self, sha256: str, result: Dict, size: int):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO extracted_text (sha256, format, text, error, size, seconds, extracted_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (sha256, result["format"], result["text"], result["error"], size, result["seconds"], time.time())
+            )
+
+    async def extract(self, path: str, sha256: Optional[str] = None) -> Dict:
+        """텍스트 추출 (캐시 우선, 같은 파일 동시 요청은 한 번만 추출)"""
+        if not sha256:
+            sha256 = await asyncio.to_thread(file_sha256, path)
+
+        cached = await asyncio.to_thread(self.get_cached, sha256)
+        if cached is not None:
+            self.stats["cache_hits"] += 1
+            return dict(cached, cached=True)
+
+        inflight = self._inflight.get(sha256)
+        if inflight is not None:
+            return dict(await asyncio.shield(inflight), cached=True)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[sha256] = future
+        try:
+            size = os.path.getsize(path)
+            if size > settings.MAX_FILE_SIZE * 1024 * 1024:
+                result = {"format": None, "text": "", "error": "파일 크기 제한 초과", "seconds": 0.0}
+            else:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._get_pool(), extract_text, str(path))
+
+            self.stats["bytes_processed"] += size
+            self.stats["cpu_seconds"] += result["seconds"]
+            self.stats["failed" if result["error"] else "extracted"] += 1
+            await asyncio.to_thread(self._store, sha256, result, size)
+
+            extracted = {"sha256": sha256, "format": result["format"], "text": result["text"],
+                         "error": result["error"], "size": size}
+            future.set_result(extracted)
+            return dict(extracted, cached=False)
+        except BaseException as e:
+            future.set_exception(e if isinstance(e, Exception) else RuntimeError("텍스트 추출이 취소되었습니다"))
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(sha256, None)
+
+    @staticmethod
+    def is_extractable(filename: str) -> bool:
+        return os.path.splitext(filename.lower())[1] in EXTRACTABLE_EXTENSIONS
+
+    def shutdown(self):
+        """프로세스 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def get_stats(self) -> Dict:
+        """추출 처리량/캐시 통계"""
+        stats = dict(self.stats)
+        stats["cpu_seconds"] = round(stats["cpu_seconds"], 3)
+        stats["workers"] = self.workers
+        stats["olefile_available"] = OLEFILE_AVAILABLE
+        with self._lock:
+            stats["cached_documents"] = self._conn.execute("SELECT COUNT(*) FROM extracted_text").fetchone()[0]
+        return stats
+
+
+# 전역 텍스트 추출기
+text_extractor = TextExtractor()
@@ -1,20 +1,79 @@
 import os
 import uuid
-import json
 import aiohttp
 import asyncio
+import math
 import subprocess
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from urllib.parse import urljoin, urlparse, parse_qs
 
+from core.blob_store import BlobStore, FileSizeLimitExceeded, blob_store as default_blob_store
+from core.config import settings
+from core.delta_sync import DeltaSyncStore, delta_sync_store as default_delta_sync_store
+from core.file_manifest import FileManifest, file_manifest as default_file_manifest
+from core.download_scheduler import DownloadScheduler
+from core.g2b_search import SearchProgress
+from core.http_pool import HTTPConnectionPool, http_pool as default_http_pool
+from core.notice_analytics import NoticeAnalytics, notice_analytics as default_notice_analytics
+from core.notice_index import NoticeIndex, notice_index as default_notice_index
+from core.query_cache import UpstreamQueryCache, query_cache as default_query_cache
+from core.record_store import RecordStore, record_store as default_record_store
+from core.rate_limiter import APIRateLimiter, DailyQuotaExceeded, RetryableAPIError, rate_limiter as default_rate_limiter
+from core.result_cache import SearchResultCache
+from core.text_extractor import TextExtractor, text_extractor as default_text_extractor
+from core.attachment_index import AttachmentIndex, attachment_index as default_attachment_index
+from core.notice_record import NoticeRecord, format_currency, format_date
+from core.json_codec import dumps_bytes
+
 class UnifiedG2BSearch:
-    def __init__(self):
-        self.base_url = "http://apis.data.go.kr/1230000/BidPublicInfoService"
-        self.service_key = "0WB5pvvWESBosIfBKdnHwsHyTGAJUnJXMcuomkHoPLQGW4ZB3GZ2Ooay73OlNQGfZBY+6vDpPfCJxYhMnLMVgw=="
+    def __init__(self, http_pool: Optional[HTTPConnectionPool] = None,
+                 blob_store: Optional[BlobStore] = None,
+                 query_cache: Optional[UpstreamQueryCache] = None,
+                 rate_limiter: Optional[APIRateLimiter] = None,
+                 sync_store: Optional[DeltaSyncStore] = None,
+                 notice_index: Optional[NoticeIndex] = None,
+                 text_extractor: Optional[TextExtractor] = None,
+                 attachment_index: Optional[AttachmentIndex] = None,
+                 record_store: Optional[RecordStore] = None,
+                 analytics: Optional[NoticeAnalytics] = None,
+                 file_manifest: Optional[FileManifest] = None):
+        self.base_url = settings.G2B_BASE_URL
+        self.service_key = settings.G2B_SERVICE_KEY
         self.base_dir = os.path.join(os.getcwd(), "downloads")
-        self.search_cache = {}
+        # 검색 결과 캐시 (메모리 LRU + SQLite, CACHE_EXPIRE_HOURS/MAX_CACHED_SEARCHES 적용)
+        self.search_cache = SearchResultCache("unified_search")
+        # 공유 커넥션 풀 (요청마다 세션을 새로 만들지 않음)
+        self.http_pool = http_pool or default_http_pool
+        # 내용 주소 기반 첨부파일 저장소 (검색 간 중복 다운로드 방지)
+        self.blob_store = blob_store or default_blob_store
+        # API 응답 캐시 (동일 조회 동시 요청 병합)
+        self.query_cache = query_cache or default_query_cache
+        # 프로세스 전역 API 호출 제한 (토큰 버킷 + 지터 지수 백오프)
+        self.rate_limiter = rate_limiter or default_rate_limiter
+        # 조회 조건별 워터마크 (증분 검색 모드)
+        self.sync_store = sync_store or default_delta_sync_store
+        # API로 받은 공고 전문 색인 (수집 구간 내 검색은 로컬 응답)
+        self.notice_index = notice_index or default_notice_index
+        # 첨부파일 본문 텍스트 추출 (프로세스 풀)
+        self.text_extractor = text_extractor or default_text_extractor
+        # 추출된 첨부파일 본문 역색인 (blob 단위)
+        self.attachment_index = attachment_index or default_attachment_index
+        # 공고별 원본 JSON (NDJSON 세그먼트, 공고번호로 조회)
+        self.record_store = record_store or default_record_store
+        # 받은 공고 전체의 기관/계약방법/공고종류별 증분 집계
+        self.analytics = analytics or default_notice_analytics
+        # 다운로드 파일 목록 (기록/삭제 시 갱신)
+        self.file_manifest = file_manifest or default_file_manifest
+        # 실행 중인 검색 ID (동기 모드 검색 포함)
+        self.running_searches: Set[str] = set()
         
+    @staticmethod
+    def _write_bytes(path: str, data: bytes):
+        with open(path, 'wb') as f:
+            f.write(data)
+    
     def create_search_directory(self, search_id: str) -> str:
         """검색 ID별 디렉토리 생성"""
         search_dir = os.path.join(self.base_dir, search_id)
@@ -23,23 +82,11 @@ class UnifiedG2BSearch:
     
     def format_currency(self, amount: str) -> str:
         """금액 포맷팅 (원화 단위)"""
-        if not amount or amount == "":
-            return "0원"
-        try:
-            num = int(amount)
-            return f"{num:,}원"
-        except (ValueError, TypeError):
-            return "0원"
+        return format_currency(amount)
     
     def format_date(self, date_str: str) -> str:
         """날짜 포맷팅"""
-        if not date_str or date_str == "":
-            return "-"
-        try:
-            # "2025-06-02 09:27:20" -> "2025-06-02"
-            return date_str.split(' ')[0]
-        except:
-            return date_str
+        return format_date(date_str)
     
     def extract_attachments(self, item: Dict) -> List[Dict]:
         """첨부파일 정보 추출"""
@@ -51,39 +98,45 @@ class UnifiedG2BSearch:
             if item.get(url_key) and item.get(name_key):
                 attachments.append({
                     "filename": item[name_key],
-                    "url": item[url_key],
+                    "url": settings.rewrite_attachment_url(item[url_key]),
                     "seq": i
                 })
         return attachments
     
-    async def download_file(self, url: str, filepath: str) -> bool:
-        """파일 다운로드"""
+    async def download_file(self, url: str, filepath: str) -> Optional[Dict]:
+        """파일 다운로드 (blob 저장소 경유, 성공 시 blob 정보 반환)"""
         try:
+            # 이미 받은 URL이면 다운로드 없이 검색 디렉토리에 연결
+            blob = await asyncio.to_thread(self.blob_store.lookup_url, url)
+            if blob and await asyncio.to_thread(self.blob_store.link_to, blob["sha256"], filepath):
+                return blob
+            
             # 최대 3번 재시도
             for attempt in range(3):
                 try:
                     timeout = aiohttp.ClientTimeout(total=60)  # 60초 타임아웃 설정
-                    async with aiohttp.ClientSession(timeout=timeout) as session:
-                        async with session.get(url) as response:
-                            if response.status == 200:
-                                with open(filepath, 'wb') as f:
-                                    f.write(await response.read())
-                                return True
-                            else:
-                                print(f"다운로드 실패 (상태 코드: {response.status}), 재시도 {attempt+1}/3")
+                    session = await self.http_pool.get_session()
+                    async with session.get(url, timeout=timeout) as response:
+                        if response.status == 200:
+                            # 청크 단위 스트리밍 저장 후 검색 디렉토리에 하드링크
+                            blob = await self.blob_store.store_response(response, url)
+                            if await asyncio.to_thread(self.blob_store.link_to, blob["sha256"], filepath):
+                                return blob
+                            print(f"다운로드한 원본이 사라짐, 재시도 {attempt+1}/3")
+                        else:
+                            print(f"다운로드 실패 (상태 코드: {response.status}), 재시도 {attempt+1}/3")
                 except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                     print(f"다운로드 중 오류 발생: {e}, 재시도 {attempt+1}/3")
                     await asyncio.sleep(1)  # 1초 대기 후 재시도
+        except FileSizeLimitExceeded as e:
+            print(f"파일 크기 제한({settings.MAX_FILE_SIZE}MB) 초과로 다운로드 중단: {url} ({e})")
         except Exception as e:
             print(f"Download error: {e}")
-        return False
+        return None
     
-    async def download_attachments(self, attachments: List[Dict], search_dir: str, bid_notice_no: str) -> List[Dict]:
-        """첨부파일들 다운로드"""
-        downloaded_files = []
+    def build_download_tasks(self, attachments: List[Dict], search_dir: str, bid_notice_no: str) -> List[Dict]:
+        """첨부파일 다운로드 작업 목록 생성"""
         download_tasks = []
-        
-        # 다운로드 작업 생성
         for attachment in attachments:
             filename = attachment["filename"]
             url = attachment["url"]
@@ -92,29 +145,32 @@ class UnifiedG2BSearch:
             safe_filename = f"{bid_notice_no}_{filename}"
             filepath = os.path.join(search_dir, safe_filename)
             
-            # 비동기 다운로드 작업 목록에 추가
             download_tasks.append({
                 "url": url,
                 "filepath": filepath,
                 "filename": filename,
+                "bid_notice_no": bid_notice_no,
                 "attachment": attachment
             })
+        return download_tasks
+    
+    def _task_result(self, task: Dict) -> Dict:
+        """스케줄러 작업 결과 (예외로 결과가 없으면 실패로 처리)"""
+        return task.get("result") or {
+            "filename": task["filename"],
+            "local_path": None,
+            "url": task["url"],
+            "downloaded": False
+        }
+    
+    async def download_attachments(self, attachments: List[Dict], search_dir: str, bid_notice_no: str) -> List[Dict]:
+        """첨부파일들 다운로드"""
+        scheduler = DownloadScheduler(self.process_download_task)
+        for task in self.build_download_tasks(attachments, search_dir, bid_notice_no):
+            scheduler.add(task)
         
-        # 최대 5개 동시 다운로드 실행
-        concurrent_downloads = min(5, len(download_tasks))
-        chunks = [download_tasks[i:i + concurrent_downloads] 
-                  for i in range(0, len(download_tasks), concurrent_downloads)]
-        
-        for chunk in chunks:
-            # 각 청크를 병렬로 다운로드
-            tasks = [self.process_download_task(task) for task in chunk]
-            download_results = await asyncio.gather(*tasks)
-            downloaded_files.extend(download_results)
-            
-            # 청크 간 약간의 딜레이 (서버 부하 방지)
-            await asyncio.sleep(0.5)
-        
-        return downloaded_files
+        tasks = await scheduler.run()
+        return [self._task_result(task) for task in tasks]
     
     async def process_download_task(self, task: Dict) -> Dict:
         """단일 다운로드 작업 처리"""
@@ -123,14 +179,18 @@ class UnifiedG2BSearch:
         filename = task["filename"]
         
         # 다운로드 실행
-        success = await self.download_file(url, filepath)
+        blob = await self.download_file(url, filepath)
         
-        if success:
+        if blob:
+            await asyncio.to_thread(self.file_manifest.record, filepath, task.get("bid_notice_no"))
             return {
                 "filename": filename,
                 "local_path": filepath,
                 "url": url,
-                "downloaded": True
+                "downloaded": True,
+                "sha256": blob["sha256"],
+                "size": blob["size"],
+                "cached": blob["cached"]
             }
         else:
             return {
@@ -140,121 +200,298 @@ class UnifiedG2BSearch:
                 "downloaded": False
             }
     
-    async def search_api(self, search_params: Dict) -> Dict:
-        """나라장터 API 검색"""
+    async def extract_attachment_text(self, file_result: Dict, item: Optional[Dict] = None):
+        """다운로드한 HWP/HWPX 본문 텍스트 추출 (파일 해시 기준 캐시) 후 본문 색인에 추가"""
+        item = item or {}
         try:
-            # 기본 파라미터 설정
-            params = {
-                "serviceKey": self.service_key,
-                "numOfRows": search_params.get("numOfRows", 100),
-                "pageNo": search_params.get("pageNo", 1),
-                "type": "json"
-            }
-            
-            # 검색 조건 추가
-            if search_params.get("bidNtceNm"):
-                params["bidNtceNm"] = search_params["bidNtceNm"]
-            if search_params.get("ntceInsttNm"):
-                params["ntceInsttNm"] = search_params["ntceInsttNm"]
-            if search_params.get("inqryDivCd"):
-                params["inqryDivCd"] = search_params["inqryDivCd"]
-            if search_params.get("inqryBgnDt"):
-                params["inqryBgnDt"] = search_params["inqryBgnDt"]
-            if search_params.get("inqryEndDt"):
-                params["inqryEndDt"] = search_params["inqryEndDt"]
-            
-            url = f"{self.base_url}/getBidPblancListInfoThng"
-            
-            # 최대 5번 재시도
-            max_attempts = 5
-            for attempt in range(max_attempts):
-                try:
-                    timeout = aiohttp.ClientTimeout(total=30)  # 30초 타임아웃 설정
-                    async with aiohttp.ClientSession(timeout=timeout) as session:
-                        async with session.get(url, params=params) as response:
-                            if response.status == 200:
-                                try:
-                                    data = await response.json()
-                                    # 응답 구조 확인
-                                    if "response" in data:
-                                        return data
-                                    else:
-                                        print(f"API 응답 구조 오류 (시도 {attempt+1}/{max_attempts})")
-                                except json.JSONDecodeError:
-                                    print(f"API 응답이 JSON 형식이 아님 (시도 {attempt+1}/{max_attempts})")
-                            else:
-                                print(f"API 요청 실패: {response.status} (시도 {attempt+1}/{max_attempts})")
-                    
-                    # 재시도 간 대기 시간 (점진적 증가)
-                    wait_time = 1 * (attempt + 1)
-                    print(f"{wait_time}초 후 재시도...")
-                    await asyncio.sleep(wait_time)
-                    
-                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                    print(f"API 요청 중 네트워크 오류: {str(e)} (시도 {attempt+1}/{max_attempts})")
-                    await asyncio.sleep(2)  # 2초 대기 후 재시도
-            
-            return {"error": f"API 요청이 5회 연속 실패했습니다. 네트워크 연결을 확인하세요."}
+            extracted = await self.text_extractor.extract(file_result["local_path"], file_result.get("sha256"))
+            if not extracted["error"]:
+                await asyncio.to_thread(
+                    self.attachment_index.add_document, extracted["sha256"], extracted["text"],
+                    item.get("bidNtceNo", ""), item.get("bidNtceOrd", ""), file_result["filename"]
+                )
+        except Exception as e:
+            extracted = {"text": "", "error": str(e)}
+        file_result["text_extracted"] = not extracted["error"]
+        file_result["text_chars"] = len(extracted["text"])
+        if extracted["error"]:
+            file_result["text_error"] = extracted["error"]
+    
+    def _extract_items(self, body: Dict) -> List[Dict]:
+        """응답 body에서 items 목록 추출"""
+        items = body.get("items", [])
+        if isinstance(items, dict):
+            items = items.get("item", [])
+            if isinstance(items, dict):
+                items = [items]
+        return items if isinstance(items, list) else []
+    
+    async def fetch_page(self, url: str, params: Dict) -> Dict:
+        """단일 페이지 API 호출 (응답 캐시 경유)"""
+        return await self.query_cache.get_or_fetch(url, params, lambda: self._request_and_index(url, params))
+    
+    async def _request_and_index(self, url: str, params: Dict) -> Dict:
+        """API 호출 후 받은 공고를 로컬 색인/통계 집계에 추가"""
+        result = await self._request_page(url, params)
+        if "error" not in result:
+            items = self._extract_items(result["response"].get("body", {}) or {})
+            if settings.LOCAL_INDEX_ENABLED:
+                await asyncio.to_thread(self.notice_index.add_items, items)
+            await asyncio.to_thread(self.analytics.add_items, items)
+        return result
+    
+    async def _request_page(self, url: str, params: Dict) -> Dict:
+        """단일 페이지 API 호출 (호출 제한 적용, 실패 시 지터 지수 백오프로 최대 5회 시도)"""
+        async def request() -> Dict:
+            timeout = aiohttp.ClientTimeout(total=30)  # 30초 타임아웃 설정
+            session = await self.http_pool.get_session()
+            async with session.get(url, params=params, timeout=timeout) as response:
+                data = await self.rate_limiter.read_response(response)
+                # 응답 구조 확인
+                if "response" not in data:
+                    raise RetryableAPIError("API 응답 구조 오류")
+                return data
         
+        try:
+            return await self.rate_limiter.call(request, max_attempts=5)
+        except DailyQuotaExceeded as e:
+            return {"error": str(e)}
+        except RetryableAPIError:
+            return {"error": f"API 요청이 5회 연속 실패했습니다. 네트워크 연결을 확인하세요."}
         except Exception as e:
             return {"error": f"API 호출 중 오류: {str(e)}"}
     
-    async def search_and_download(self, search_params: Dict, search_id: str) -> Dict:
-        """통합 검색 및 다운로드 실행"""
+    async def search_api(self, search_params: Dict) -> Dict:
+        """나라장터 API 검색"""
+        # 기본 파라미터 설정
+        params = {
+            "serviceKey": self.service_key,
+            "numOfRows": search_params.get("numOfRows", 100),
+            "pageNo": search_params.get("pageNo", 1),
+            "type": "json"
+        }
+        
+        # 검색 조건 추가
+        if search_params.get("bidNtceNm"):
+            params["bidNtceNm"] = search_params["bidNtceNm"]
+        if search_params.get("ntceInsttNm"):
+            params["ntceInsttNm"] = search_params["ntceInsttNm"]
+        if search_params.get("inqryDivCd"):
+            params["inqryDivCd"] = search_params["inqryDivCd"]
+        if search_params.get("inqryBgnDt"):
+            params["inqryBgnDt"] = search_params["inqryBgnDt"]
+        if search_params.get("inqryEndDt"):
+            params["inqryEndDt"] = search_params["inqryEndDt"]
+        
+        url = f"{self.base_url}/getBidPblancListInfoThng"
+        
+        # 요청 기간을 이미 빠짐없이 수집했으면 로컬 색인으로 응답
+        if settings.LOCAL_INDEX_ENABLED:
+            local_result = await asyncio.to_thread(
+                self.notice_index.query, dict(params, allPages=search_params.get("allPages"))
+            )
+            if local_result is not None:
+                return local_result
+        
+        # 전체 페이지 모드
+        if search_params.get("allPages"):
+            result = await self.search_api_all_pages(url, params)
+            complete = "error" not in result and result["pages"]["complete"]
+        else:
+            result = await self.fetch_page(url, params)
+            if "error" in result:
+                return result
+            body = result["response"].get("body", {}) or {}
+            try:
+                complete = int(params["pageNo"]) == 1 and int(body.get("totalCount", 0) or 0) <= len(self._extract_items(body))
+            except (ValueError, TypeError):
+                complete = False
+        
+        if "error" in result:
+            return result
+        if complete and settings.LOCAL_INDEX_ENABLED:
+            # 이 조건/기간은 이후 로컬 색인으로 응답 가능
+            await asyncio.to_thread(self.notice_index.add_coverage, params)
+        return dict(result, source="upstream")
+    
+    async def search_api_all_pages(self, url: str, params: Dict) -> Dict:
+        """totalCount 기반 전체 페이지 동시 조회"""
+        # 1페이지로 totalCount 확인
+        first_result = await self.fetch_page(url, dict(params, pageNo=1))
+        if "error" in first_result:
+            return first_result
+        
+        header = first_result["response"].get("header", {})
+        body = first_result["response"].get("body", {}) or {}
+        try:
+            total_count = int(body.get("totalCount", 0) or 0)
+        except (ValueError, TypeError):
+            total_count = 0
+        num_rows = max(int(params.get("numOfRows") or 100), 1)
+        total_pages = min(math.ceil(total_count / num_rows), settings.MAX_SEARCH_PAGES)
+        
+        pages = {1: self._extract_items(body)}
+        failed_pages = []
+        
+        # 나머지 페이지 동시 조회 (동시 요청 수 제한)
+        semaphore = asyncio.Semaphore(settings.API_PAGE_CONCURRENCY)
+        
+        async def fetch(page_no: int):
+            async with semaphore:
+                return page_no, await self.fetch_page(url, dict(params, pageNo=page_no))
+        
+        page_results = await asyncio.gather(*[fetch(page_no) for page_no in range(2, total_pages + 1)])
+        for page_no, page_result in page_results:
+            if "error" in page_result:
+                print(f"페이지 {page_no} 조회 실패: {page_result['error']}")
+                failed_pages.append(page_no)
+                continue
+            pages[page_no] = self._extract_items(page_result["response"].get("body", {}) or {})
+        
+        # 페이지 순서대로 병합 + (bidNtceNo, bidNtceOrd) 기준 중복 제거
+        merged_items = []
+        seen = set()
+        for page_no in sorted(pages):
+            for item in pages[page_no]:
+                key = (item.get("bidNtceNo", ""), item.get("bidNtceOrd", ""))
+                if key in seen:
+                    continue
+                seen.add(key)
+                merged_items.append(item)
+        
+        return {
+            "response": {
+                "header": header,
+                "body": {
+                    "items": merged_items,
+                    "numOfRows": len(merged_items),
+                    "pageNo": 1,
+                    "totalCount": total_count
+                }
+            },
+            "pages": {
+                "total_pages": total_pages,
+                "fetched_pages": len(pages),
+                "failed_pages": sorted(failed_pages),
+                "complete": not failed_pages and total_pages * num_rows >= total_count
+            }
+        }
+    
+    async def search_and_download(self, search_params: Dict, search_id: str,
+                                  progress: Optional[SearchProgress] = None) -> Dict:
+        """통합 검색 및 다운로드 실행 (search_params["incremental"]이면 워터마크 이후 신규/정정 공고만 처리)"""
+        progress = progress or SearchProgress()
+        # 진행 중인 검색 디렉토리는 저장 공간 정리 대상에서 제외
+        self.running_searches.add(search_id)
         try:
             # 검색 디렉토리 생성
             search_dir = self.create_search_directory(search_id)
             
+            # 증분 모드: 워터마크 이후 구간만 조회
+            sync_plan = self.sync_store.plan(search_params) if search_params.get("incremental") else None
+            
             # API 검색 실행
-            api_result = await self.search_api(search_params)
+            progress.current_step = "공고 목록 검색 중..."
+            api_result = await self.search_api(sync_plan.fetch_params if sync_plan else search_params)
             
             if "error" in api_result:
                 return api_result
             
-            # JSON 파일 저장
+            # JSON 파일 저장 (압축 형식, 이벤트 루프를 막지 않도록 스레드에서 기록)
             json_filepath = os.path.join(search_dir, f"{search_id}_search_results.json")
-            with open(json_filepath, 'w', encoding='utf-8') as f:
-                json.dump(api_result, f, ensure_ascii=False, indent=2)
+            await asyncio.to_thread(self._write_bytes, json_filepath, dumps_bytes(api_result))
+            await asyncio.to_thread(self.file_manifest.record, json_filepath)
             
             # 결과 처리
             if "response" in api_result and "body" in api_result["response"]:
                 body = api_result["response"]["body"]
                 items = body.get("items", [])
                 
-                # 각 입찰공고의 첨부파일 다운로드
-                processed_items = []
+                changes = None
+                if sync_plan:
+                    # 이미 처리한 공고(같은 공고번호/차수, 변경일시 동일)는 건너뜀
+                    classified = self.sync_store.classify(sync_plan, items)
+                    items = [item for item, change in classified if change != "unchanged"]
+                    changes = [change for _, change in classified if change != "unchanged"]
+                    unchanged_count = len(classified) - len(items)
                 
-                for item in items:
+                # 공고별 원본 JSON 저장 (한 번의 기록/트랜잭션)
+                await self.record_store.put_many(
+                    [(item["bidNtceNo"], item) for item in items if item.get("bidNtceNo")]
+                )
+                
+                # 모든 입찰공고의 첨부파일을 하나의 다운로드 큐로 처리
+                processed_items: List[NoticeRecord] = []
+                item_tasks: Dict[int, List[Dict]] = {}
+                remaining: Dict[int, int] = {}
+                extraction_tasks: List[asyncio.Task] = []
+                scheduler = DownloadScheduler(self.process_download_task)
+                progress.total_bids = len(items)
+                progress.current_step = "첨부파일 다운로드 중..."
+                progress.emit("progress")
+                
+                def complete_item(index: int):
+                    # 공고의 모든 첨부파일 처리 완료 시 추가 순서대로 결과 조립
+                    record = processed_items[index]
+                    record.attachments = [self._task_result(task) for task in item_tasks[index]]
+                    progress.processed_bids += 1
+                    progress.current_bid = f"{record.bidNtceNo} - {record.bidNtceNm}"
+                    progress.partial_results.append(record)
+                    progress.emit("bid", {
+                        "bidNtceNo": record.bidNtceNo,
+                        "bidNtceNm": record.bidNtceNm,
+                        "attachments": len(record.attachments)
+                    })
+                
+                async def on_download_complete(task: Dict):
+                    file_result = self._task_result(task)
+                    if file_result["downloaded"]:
+                        # 다운로드가 끝난 문서부터 텍스트 추출 시작 (결과는 첨부파일 정보에 반영)
+                        if settings.TEXT_EXTRACTION_ENABLED and self.text_extractor.is_extractable(file_result["filename"]):
+                            extraction_tasks.append(asyncio.create_task(
+                                self.extract_attachment_text(file_result, items[task["item_index"]])
+                            ))
+                        progress.files_downloaded += 1
+                        progress.bytes_downloaded += file_result.get("size", 0)
+                        progress.emit("file", {
+                            "filename": file_result["filename"],
+                            "bytes": file_result.get("size", 0),
+                            "cached": file_result.get("cached", False)
+                        })
+                    else:
+                        progress.files_failed += 1
+                        error = f"첨부파일 다운로드 실패: {file_result['filename']}"
+                        progress.errors.append(error)
+                        progress.emit("error", {"message": error, "url": file_result["url"]})
+                    
+                    index = task["item_index"]
+                    remaining[index] -= 1
+                    if remaining[index] == 0:
+                        complete_item(index)
+                
+                for index, item in enumerate(items):
                     bid_notice_no = item.get("bidNtceNo", "")
                     attachments = self.extract_attachments(item)
                     
-                    # 첨부파일 다운로드
-                    downloaded_files = []
-                    if attachments:
-                        downloaded_files = await self.download_attachments(
-                            attachments, search_dir, bid_notice_no
-                        )
+                    item_tasks[index] = self.build_download_tasks(attachments, search_dir, bid_notice_no)
+                    remaining[index] = len(item_tasks[index])
+                    progress.files_total += remaining[index]
+                    for task in item_tasks[index]:
+                        task["item_index"] = index
+                        scheduler.add(task)
                     
-                    # 아이템 정보 정리
-                    processed_item = {
-                        "bidNtceNo": bid_notice_no,
-                        "bidNtceNm": item.get("bidNtceNm", ""),
-                        "ntceInsttNm": item.get("ntceInsttNm", ""),
-                        "bidNtceDt": self.format_date(item.get("bidNtceDt", "")),
-                        "opengDt": self.format_date(item.get("opengDt", "")),
-                        "bidClseDt": self.format_date(item.get("bidClseDt", "")),  # 마감일 추가
-                        "asignBdgtAmt": self.format_currency(item.get("asignBdgtAmt", "")),
-                        "presmptPrce": self.format_currency(item.get("presmptPrce", "")),
-                        "cntrctCnclsMthdNm": item.get("cntrctCnclsMthdNm", ""),
-                        "ntceKindNm": item.get("ntceKindNm", ""),
-                        "bidNtceDtlUrl": item.get("bidNtceDtlUrl", ""),
-                        "ntceInsttOfclNm": item.get("ntceInsttOfclNm", ""),  # 담당자
-                        "ntceInsttOfclTelNo": item.get("ntceInsttOfclTelNo", ""),  # 연락처
-                        "ntceInsttOfclEmailAdrs": item.get("ntceInsttOfclEmailAdrs", ""),  # 이메일
-                        "attachments": downloaded_files,
-                        "original_data": item
-                    }
-                    processed_items.append(processed_item)
+                    # 표시용 값은 여기서 한 번만 계산 (첨부파일은 다운로드 완료 후 채움)
+                    processed_items.append(NoticeRecord(item, change=changes[index] if changes else None))
+                
+                # 첨부파일이 없는 공고는 바로 완료 처리
+                for index in range(len(processed_items)):
+                    if remaining[index] == 0:
+                        complete_item(index)
+                
+                await scheduler.run(on_complete=on_download_complete)
+                if extraction_tasks:
+                    progress.current_step = "첨부파일 텍스트 추출 중..."
+                    await asyncio.gather(*extraction_tasks)
                 
                 # 검색 결과 캐시에 저장
                 result = {
@@ -263,11 +500,31 @@ class UnifiedG2BSearch:
                     "search_dir": search_dir,
                     "json_file": json_filepath,
                     "total_count": body.get("totalCount", 0),
+                    "source": api_result.get("source", "upstream"),
                     "items": processed_items,
                     "timestamp": datetime.now().isoformat()
                 }
                 
-                self.search_cache[search_id] = result
+                if sync_plan:
+                    # 실패 페이지나 최대 페이지 수 초과로 못 받은 공고가 없을 때만 워터마크 전진
+                    # (로컬 색인 응답은 pages 정보가 없고 항상 구간 전체)
+                    complete = api_result.get("pages", {}).get("complete", True)
+                    watermark = await asyncio.to_thread(
+                        self.sync_store.commit, sync_plan, list(zip(items, processed_items)), complete
+                    )
+                    result["merged_items"] = await asyncio.to_thread(self.sync_store.merged_view, sync_plan)
+                    result["sync"] = dict(
+                        sync_plan.to_dict(),
+                        watermark=watermark,
+                        complete=complete,
+                        fetched=len(items) + unchanged_count,
+                        unchanged=unchanged_count,
+                        new=changes.count("new"),
+                        revised=changes.count("revised"),
+                        renotice=changes.count("renotice")
+                    )
+                
+                await asyncio.to_thread(self.search_cache.set, search_id, result)
                 return result
             
             else:
@@ -275,52 +532,46 @@ class UnifiedG2BSearch:
         
         except Exception as e:
             return {"error": f"검색 및 다운로드 중 오류: {str(e)}"}
+        finally:
+            self.running_searches.discard(search_id)
     
-    def get_search_result(self, search_id: str) -> Optional[Dict]:
-        """검색 결과 조회"""
-        return self.search_cache.get(search_id)
+    def _load_search_result(self, search_id: str) -> Optional[Dict]:
+        result = self.search_cache.get(search_id)
+        if result and result.get("items") and not isinstance(result["items"][0], NoticeRecord):
+            result["items"] = [NoticeRecord.from_stored(item) for item in result["items"]]
+        return result
     
-    def get_search_statistics(self, search_id: str) -> Dict:
+    async def get_search_result(self, search_id: str) -> Optional[Dict]:
+        """검색 결과 조회 (SQLite에서 읽은 항목은 NoticeRecord로 한 번 복원해 메모리 캐시에 유지, 스레드에서 실행)"""
+        return await asyncio.to_thread(self._load_search_result, search_id)
+    
+    async def search_attachment_text(self, keyword: str, limit: int = 20, offset: int = 0) -> Dict:
+        """첨부파일 본문 검색 (역색인 조회, 상위 문서만 원문을 읽어 스니펫 생성)"""
+        def load_text(sha256: str) -> Optional[str]:
+            cached = self.text_extractor.get_cached(sha256)
+            return cached["text"] if cached else None
+        
+        return await asyncio.to_thread(
+            self.attachment_index.search, keyword, limit, offset, text_loader=load_text
+        )
+    
+    async def get_search_statistics(self, search_id: str) -> Dict:
         """검색 통계 정보"""
-        result = self.search_cache.get(search_id)
+        result = await self.get_search_result(search_id)
         if not result:
             return {"error": "검색 결과를 찾을 수 없습니다."}
         
+        # 검색 결과 단위 통계 (금액은 수집 시 계산한 값, 전체 이력 통계는 self.analytics)
         items = result.get("items", [])
-        
-        # 통계 계산
-        stats = {
+        total_budget = sum(item.budget_amount for item in items)
+        return {
             "total_notices": len(items),
-            "total_budget": 0,
-            "notice_types": {},
-            "contract_methods": {},
-            "institutions": {}
+            "total_budget": total_budget,
+            "total_budget_formatted": format_currency(total_budget),
+            "notice_types": dict(Counter(item.ntceKindNm or "기타" for item in items)),
+            "contract_methods": dict(Counter(item.cntrctCnclsMthdNm or "기타" for item in items)),
+            "institutions": dict(Counter(item.ntceInsttNm or "기타" for item in items))
         }
-        
-        for item in items:
-            # 예산 총액 계산
-            try:
-                budget_str = item["original_data"].get("asignBdgtAmt", "0")
-                if budget_str:
-                    stats["total_budget"] += int(budget_str)
-            except:
-                pass
-            
-            # 공고 유형별 통계
-            notice_type = item.get("ntceKindNm", "기타")
-            stats["notice_types"][notice_type] = stats["notice_types"].get(notice_type, 0) + 1
-            
-            # 계약 방법별 통계
-            contract_method = item.get("cntrctCnclsMthdNm", "기타")
-            stats["contract_methods"][contract_method] = stats["contract_methods"].get(contract_method, 0) + 1
-            
-            # 기관별 통계
-            institution = item.get("ntceInsttNm", "기타")
-            stats["institutions"][institution] = stats["institutions"].get(institution, 0) + 1
-        
-        stats["total_budget_formatted"] = self.format_currency(str(stats["total_budget"]))
-        
-        return stats
     
     def create_download_package(self, search_id: str) -> Optional[str]:
         """전체 패키지 다운로드 파일 생성"""
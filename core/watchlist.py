@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+키워드 워치리스트
+조회 기간을 일 단위로 한 번씩(키워드 필터 없이 전체 페이지) 조회한 뒤,
+모든 워치리스트 키워드를 Aho-Corasick 매칭으로 한 번에 대조
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from core.config import settings
+from core.multi_match import AhoCorasickMatcher, normalize_text
+
+# 매칭 대상 필드
+MATCH_FIELDS = ("bidNtceNm", "ntceInsttNm")
+
+# 결과에 포함할 공고 필드
+RESULT_FIELDS = ("bidNtceNo", "bidNtceOrd", "bidNtceNm", "ntceInsttNm", "bidNtceDt",
+                 "bidClseDt", "asignBdgtAmt", "bidNtceDtlUrl")
+
+
+def normalize_keywords(keywords: List[str]) -> List[str]:
+    """빈 키워드와 (정규화 기준) 중복 키워드 제거"""
+    unique_keywords = []
+    seen = set()
+    for keyword in keywords:
+        normalized = normalize_text(keyword)
+        if normalized and normalized not in seen:
+            seen.add(normalized)
+            unique_keywords.append(keyword.strip())
+    return unique_keywords
+
+
+class WatchlistStore:
+    """워치리스트 정의 저장소 (SQLite)"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        db_path = Path(db_path or settings.downloads_cache_dir / "watchlists.db")
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS watchlists ("
+            " name TEXT PRIMARY KEY,"
+            " keywords TEXT NOT NULL,"
+            " fields TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+
+    @staticmethod
+    def _row_to_dict(row) -> Dict:
+        return {
+            "name": row[0],
+            "keywords": json.loads(row[1]),
+            "fields": json.loads(row[2]),
+            "created_at": datetime.fromtimestamp(row[3]).isoformat(),
+            "updated_at": datetime.fromtimestamp(row[4]).isoformat()
+        }
+
+    def list(self) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, keywords, fields, created_at, updated_at FROM watchlists ORDER BY name"
+            ).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def get(self, name: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT name, keywords, fields, created_at, updated_at FROM watchlists WHERE name = ?", (name,)
+            ).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def save(self, name: str, keywords: List[str], fields: Optional[List[str]] = None) -> Dict:
+        """워치리스트 생성/교체 (빈 키워드와 중복 제거, 유효한 키워드가 없으면 저장하지 않고 ValueError)"""
+        unique_keywords = normalize_keywords(keywords)
+        if not unique_keywords:
+            raise ValueError("유효한 키워드가 없습니다.")
+        fields = [field for field in (fields or MATCH_FIELDS) if field in MATCH_FIELDS] or list(MATCH_FIELDS)
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO watchlists (name, keywords, fields, created_at, updated_at) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT(name) DO UPDATE SET keywords = excluded.keywords, fields = excluded.fields,"
+                " updated_at = excluded.updated_at",
+                (name, json.dumps(unique_keywords, ensure_ascii=False), json.dumps(fields), now, now)
+            )
+        return self.get(name)
+
+    def delete(self, name: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM watchlists WHERE name = ?", (name,))
+        return cursor.rowcount > 0
+
+
+def date_windows(start_date: str, end_date: str) -> List[Tuple[str, str]]:
+    """YYYYMMDD 기간을 일 단위 조회 구간(YYYYMMDDHHMM)으로 분할"""
+    start = datetime.strptime(start_date, "%Y%m%d")
+    end = datetime.strptime(end_date, "%Y%m%d")
+    if end < start:
+        raise ValueError("종료일이 시작일보다 앞섭니다")
+    if (end - start).days + 1 > settings.WATCHLIST_MAX_DAYS:
+        raise ValueError(f"조회 기간은 최대 {settings.WATCHLIST_MAX_DAYS}일입니다")
+
+    windows = []
+    day = start
+    while day <= end:
+        windows.append((day.strftime("%Y%m%d0000"), day.strftime("%Y%m%d2359")))
+        day += timedelta(days=1)
+    return windows
+
+
+async def evaluate_watchlists(search_engine, watchlists: List[Dict],
+                              start_date: str, end_date: str) -> Dict:
+    """기간 내 공고를 한 번 조회해 모든 워치리스트 키워드와 대조"""
+    started = time.monotonic()
+    windows = date_windows(start_date, end_date)
+
+    # 일 단위 구간별 전체 페이지 조회 (지난 날짜는 API 응답 캐시의 긴 TTL 적용)
+    semaphore = asyncio.Semaphore(settings.WATCHLIST_WINDOW_CONCURRENCY)
+
+    async def fetch_window(window: Tuple[str, str]) -> Tuple[Tuple[str, str], Dict]:
+        async with semaphore:
+            return window, await search_engine.search_api({
+                "inqryBgnDt": window[0],
+                "inqryEndDt": window[1],
+                "numOfRows": settings.WATCHLIST_PAGE_SIZE,
+                "pageNo": 1,
+                "allPages": True
+            })
+
+    notices: Dict[Tuple[str, str], Dict] = {}
+    window_summaries = []
+    for window, api_result in await asyncio.gather(*[fetch_window(window) for window in windows]):
+        summary = {"begin": window[0], "end": window[1]}
+        if "error" in api_result:
+            summary["error"] = api_result["error"]
+        else:
+            items = api_result["response"].get("body", {}).get("items", []) or []
+            summary["notices"] = len(items)
+            summary["pages"] = api_result.get("pages")
+            for item in items:
+                notices.setdefault((item.get("bidNtceNo", ""), item.get("bidNtceOrd", "")), item)
+        window_summaries.append(summary)
+
+    # 모든 워치리스트 키워드로 하나의 오토마톤 구성
+    targets: Dict[str, List[Tuple[str, str, List[str]]]] = {}
+    for watchlist in watchlists:
+        for keyword in watchlist["keywords"]:
+            targets.setdefault(normalize_text(keyword), []).append(
+                (watchlist["name"], keyword, watchlist.get("fields") or list(MATCH_FIELDS))
+            )
+    matcher = AhoCorasickMatcher(targets.keys())
+
+    results: Dict[str, Dict[str, List[Dict]]] = {
+        watchlist["name"]: {keyword: [] for keyword in watchlist["keywords"]} for watchlist in watchlists
+    }
+    match_count = 0
+    for item in notices.values():
+        matched_fields: Dict[int, List[str]] = {}
+        for field in MATCH_FIELDS:
+            for pattern_id in matcher.find(item.get(field, "")):
+                matched_fields.setdefault(pattern_id, []).append(field)
+
+        for pattern_id, fields in matched_fields.items():
+            for name, keyword, watched_fields in targets[matcher.patterns[pattern_id]]:
+                hit_fields = [field for field in fields if field in watched_fields]
+                if hit_fields:
+                    entry = {field: item.get(field, "") for field in RESULT_FIELDS}
+                    entry["matched_fields"] = hit_fields
+                    results[name][keyword].append(entry)
+                    match_count += 1
+
+    return {
+        "start_date": start_date,
+        "end_date": end_date,
+        "windows": window_summaries,
+        "notices_scanned": len(notices),
+        "keywords": len(matcher),
+        "matches": match_count,
+        "elapsed_seconds": round(time.monotonic() - started, 3),
+        "watchlists": results
+    }
+
+
+# 전역 워치리스트 저장소
+watchlist_store = WatchlistStore()
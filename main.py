@@ -12,18 +12,50 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
 import uvicorn
 import os
+import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # API 라우터 임포트
-from api.search import router as search_router
+from api.search import router as search_router, search_system
 from api.download import router as download_router
+from api.watchlist import router as watchlist_router
 from core.config import settings
+from core.file_manifest import file_manifest
+from core.http_pool import http_pool
+from core.job_manager import job_manager
+from core.record_store import record_store
+from core.storage_janitor import storage_janitor
+from core.text_extractor import text_extractor
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 수명 동안 공유 리소스 관리"""
+    # 공유 HTTP 커넥션 풀 열기
+    await http_pool.start()
+    # 다운로드 파일 목록 색인 주기적 보정 (시작 시 한 번 포함)
+    reconcile_task = asyncio.create_task(
+        file_manifest.reconcile_periodically(settings.FILE_MANIFEST_RECONCILE_MINUTES * 60)
+    )
+    # 용량 한도 기반 저장 공간 정리 (진행 중인 검색 제외)
+    janitor_task = asyncio.create_task(storage_janitor.run_periodically(
+        settings.STORAGE_JANITOR_INTERVAL_MINUTES * 60, lambda: search_system.running_searches
+    ))
+    yield
+    reconcile_task.cancel()
+    janitor_task.cancel()
+    # 종료 시 진행 중인 검색 작업 취소 후 커넥션 풀/텍스트 추출 프로세스 풀/공고 JSON 세그먼트 닫기
+    await job_manager.shutdown()
+    await http_pool.close()
+    text_extractor.shutdown()
+    await record_store.close()
 
 # FastAPI 앱 초기화
 app = FastAPI(
     title="나라장터 입찰공고 검색 시스템",
     description="키워드와 날짜로 나라장터 입찰공고를 검색하고 첨부파일을 분석하는 웹 시스템",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -35,10 +67,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+class TrackedStaticFiles(StaticFiles):
+    """다운로드 파일을 내준 시각을 파일 목록 색인에 기록 (저장 공간 정리 시 최근 사용 파일 보존)"""
+
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code < 400:
+            await asyncio.to_thread(file_manifest.touch, [Path(self.directory) / path])
+        return response
+
 # 정적 파일 및 템플릿 설정
 BASE_DIR = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=BASE_DIR / "static"), name="static")
-app.mount("/downloads", StaticFiles(directory=BASE_DIR / "downloads"), name="downloads")
+app.mount("/downloads", TrackedStaticFiles(directory=BASE_DIR / "downloads"), name="downloads")
 templates = Jinja2Templates(directory=BASE_DIR / "templates")
 
 # 다운로드 디렉토리 생성
@@ -53,6 +94,7 @@ for dir_path in download_dirs:
 # API 라우터 등록
 app.include_router(search_router, prefix="/api/search", tags=["search"])
 app.include_router(download_router, prefix="/api/download", tags=["download"])
+app.include_router(watchlist_router, prefix="/api/watchlist", tags=["watchlist"])
 
 # 웹 페이지 라우트
 @app.get("/", response_class=HTMLResponse)
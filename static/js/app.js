@@ -248,7 +248,7 @@ async function showBidDetail(bidNtceNo, searchId) {
     try {
         showLoadingModal('상세 정보 로딩 중...', '');
         
-        const response = await fetch(`/api/search/${searchId}/results`);
+        const response = await fetch(`/api/search/search/${searchId}/results?bidNtceNo=${encodeURIComponent(bidNtceNo)}&fields=bidNtceNo,attachments,original_data`);
         const result = await response.json();
         
         hideLoadingModal();
@@ -341,7 +341,7 @@ function displayDetailModal(item, searchId) {
 // 첨부파일 목록 표시
 async function showAttachmentList(bidNtceNo, searchId) {
     try {
-        const response = await fetch(`/api/search/${searchId}/results`);
+        const response = await fetch(`/api/search/search/${searchId}/results?bidNtceNo=${encodeURIComponent(bidNtceNo)}&fields=bidNtceNo,attachments`);
         const result = await response.json();
         
         if (!result.success) {
@@ -438,7 +438,7 @@ async function downloadAllFiles(searchId) {
         showToast('패키지를 준비하고 있습니다...', 'info');
         
         // 검색 결과 폴더 열기
-        const response = await fetch(`/api/search/${searchId}/results`);
+        const response = await fetch(`/api/search/search/${searchId}/results?limit=1&fields=bidNtceNo`);
         const result = await response.json();
         
         if (result.success && result.search_dir) {
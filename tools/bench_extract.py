@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+첨부파일 텍스트 추출 처리량 측정 (files/s, MB/s)
+
+지정한 파일/디렉토리의 HWP/HWPX를 프로세스 풀로 추출(캐시 미사용)해 처리량을 출력.
+--generate N 을 주면 합성 HWP 5.0(OLE)/HWPX 문서를 만들어 측정.
+
+사용 예:
+    python tools/bench_extract.py downloads/blobs/objects --workers 4
+    python tools/bench_extract.py --generate 200 --paragraphs 2000 --workers 1 2 4 8
+"""
+
+import argparse
+import io
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.text_extractor import EXTRACTABLE_EXTENSIONS, detect_format, extract_text  # noqa: E402
+
+WORDS = ["구매", "규격서", "GPU", "서버", "납품", "설치", "유지보수", "제안요청서", "계약", "입찰",
+         "스토리지", "네트워크", "보안", "성능", "시험", "검수", "하자보수", "기간", "조건", "수량"]
+
+# ---------------------------------------------------------------------------
+# 합성 문서 생성
+# ---------------------------------------------------------------------------
+
+SECTOR = 512
+MINI_SECTOR = 64
+MINI_CUTOFF = 4096
+FREESECT, ENDOFCHAIN, FATSECT, NOSTREAM = 0xFFFFFFFF, 0xFFFFFFFE, 0xFFFFFFFD, 0xFFFFFFFF
+
+
+def _sort_key(name: str) -> Tuple[int, str]:
+    # 복합 문서 디렉토리 형제 정렬 규칙 (길이 → 대문자 비교)
+    return len(name), name.upper()
+
+
+def build_compound_file(streams: List[Tuple[str, bytes]]) -> bytes:
+    """최소 OLE 복합 문서(v3) 생성: 'A/B' 형태 경로로 한 단계 하위 저장소 지원"""
+    # 디렉토리 엔트리: [이름, 종류(1=저장소, 2=스트림, 5=루트), 데이터, 자식 목록]
+    entries = [["Root Entry", 5, b"", []]]
+    storages = {}
+    for stream_path, data in streams:
+        parent = 0
+        *dirs, name = stream_path.split("/")
+        for directory in dirs:
+            if directory not in storages:
+                storages[directory] = len(entries)
+                entries.append([directory, 1, b"", []])
+                entries[parent][3].append(storages[directory])
+            parent = storages[directory]
+        entries.append([name, 2, data, []])
+        entries[parent][3].append(len(entries) - 1)
+
+    # 작은 스트림은 미니 스트림에, 나머지는 일반 섹터에 배치
+    mini_stream = bytearray()
+    mini_fat: List[int] = []
+    starts = {}
+    for index, (name, kind, data, _) in enumerate(entries):
+        if kind == 2 and len(data) < MINI_CUTOFF:
+            count = max((len(data) + MINI_SECTOR - 1) // MINI_SECTOR, 1)
+            starts[index] = len(mini_fat)
+            mini_fat.extend(range(len(mini_fat) + 1, len(mini_fat) + count))
+            mini_fat.append(ENDOFCHAIN)
+            mini_stream += data.ljust(count * MINI_SECTOR, b"\0")
+
+    sectors: List[bytes] = []
+    fat: List[int] = []
+
+    def place(data: bytes) -> int:
+        if not data:
+            return ENDOFCHAIN
+        count = (len(data) + SECTOR - 1) // SECTOR
+        first = len(sectors)
+        for i in range(count):
+            sectors.append(data[i * SECTOR:(i + 1) * SECTOR].ljust(SECTOR, b"\0"))
+            fat.append(first + i + 1 if i + 1 < count else ENDOFCHAIN)
+        return first
+
+    root_start = place(bytes(mini_stream))
+    for index, (name, kind, data, _) in enumerate(entries):
+        if kind == 2 and len(data) >= MINI_CUTOFF:
+            starts[index] = place(data)
+    mini_fat_bytes = b"".join(struct.pack("<I", value) for value in mini_fat)
+    mini_fat_start = place(mini_fat_bytes)
+
+    # 형제는 정렬된 오른쪽 연결 리스트로 구성
+    siblings = {}
+    child_of = {}
+    for index, entry in enumerate(entries):
+        children = sorted(entry[3], key=lambda child: _sort_key(entries[child][0]))
+        child_of[index] = children[0] if children else NOSTREAM
+        for current, following in zip(children, children[1:] + [NOSTREAM]):
+            siblings[current] = following
+
+    directory = bytearray()
+    for index, (name, kind, data, _) in enumerate(entries):
+        encoded = (name + "\0").encode("utf-16-le")
+        if kind == 5:
+            start, size = root_start, len(mini_stream)
+        elif kind == 2:
+            start, size = starts[index], len(data)
+        else:
+            start, size = 0, 0
+        directory += encoded.ljust(64, b"\0")
+        directory += struct.pack("<HBBIII", len(encoded), kind, 1, NOSTREAM, siblings.get(index, NOSTREAM),
+                                 child_of[index])
+        directory += b"\0" * 16 + struct.pack("<I", 0) + b"\0" * 16
+        directory += struct.pack("<IQ", start, size)
+    directory_start = place(bytes(directory.ljust(((len(directory) + SECTOR - 1) // SECTOR) * SECTOR, b"\0")))
+
+    # FAT 섹터 수 결정 (FAT 자신도 FAT에 기록됨)
+    fat_sectors = 1
+    while (len(fat) + fat_sectors) > fat_sectors * (SECTOR // 4):
+        fat_sectors += 1
+    fat_start = len(sectors)
+    fat.extend([FATSECT] * fat_sectors)
+    fat.extend([FREESECT] * (fat_sectors * (SECTOR // 4) - len(fat)))
+    fat_bytes = b"".join(struct.pack("<I", value) for value in fat)
+    for i in range(fat_sectors):
+        sectors.append(fat_bytes[i * SECTOR:(i + 1) * SECTOR])
+
+    difat = [fat_start + i for i in range(fat_sectors)] + [FREESECT] * (109 - fat_sectors)
+    header = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\0" * 16
+    header += struct.pack("<HHHHH", 0x3E, 3, 0xFFFE, 9, 6) + b"\0" * 6
+    header += struct.pack("<IIIIIIIII", 0, fat_sectors, directory_start, 0, MINI_CUTOFF,
+                          mini_fat_start if mini_fat else ENDOFCHAIN,
+                          (len(mini_fat_bytes) + SECTOR - 1) // SECTOR, ENDOFCHAIN, 0)
+    header += b"".join(struct.pack("<I", value) for value in difat)
+
+    return header + b"".join(sectors)
+
+
+def _hwp_record(tag_id: int, payload: bytes, level: int = 0) -> bytes:
+    if len(payload) >= 0xFFF:
+        return struct.pack("<II", tag_id | (level << 10) | (0xFFF << 20), len(payload)) + payload
+    return struct.pack("<I", tag_id | (level << 10) | (len(payload) << 20)) + payload
+
+
+def synthetic_hwp_bytes(paragraphs: List[str]) -> bytes:
+    """압축 HWP 5.0 문서 생성 (문단마다 PARA_HEADER + PARA_TEXT, 탭은 인라인 제어 문자)"""
+    body = bytearray()
+    for paragraph in paragraphs:
+        text = paragraph.replace("\t", "\x09" + "\0" * 7) + "\r"
+        body += _hwp_record(66, b"\0" * 22)
+        body += _hwp_record(67, text.encode("utf-16-le"), level=1)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    section = compressor.compress(bytes(body)) + compressor.flush()
+
+    file_header = b"HWP Document File".ljust(32, b"\0") + struct.pack("<II", 0x05000300, 0x01)
+    file_header = file_header.ljust(256, b"\0")
+    preview = "\n".join(paragraphs)[:1000].encode("utf-16-le")
+    return build_compound_file([
+        ("FileHeader", file_header),
+        ("DocInfo", zlib.compress(b"\0" * 64)[2:-4]),
+        ("BodyText/Section0", section),
+        ("PrvText", preview)
+    ])
+
+
+def synthetic_hwpx_bytes(paragraphs: List[str]) -> bytes:
+    """HWPX 문서 생성 (Contents/section0.xml 의 hp:p/hp:run/hp:t)"""
+    ns = 'xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph" xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section"'
+    body = []
+    for paragraph in paragraphs:
+        escaped = paragraph.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        escaped = escaped.replace("\t", "<hp:tab/>")
+        body.append(f"<hp:p><hp:run><hp:t>{escaped}</hp:t></hp:run></hp:p>")
+    xml = f'<?xml version="1.0" encoding="UTF-8"?><hs:sec {ns}>{"".join(body)}</hs:sec>'
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("mimetype", "application/hwp+zip", compress_type=zipfile.ZIP_STORED)
+        archive.writestr("Contents/section0.xml", xml)
+    return buffer.getvalue()
+
+
+def synthetic_paragraphs(rng: random.Random, count: int) -> List[str]:
+    """규격서 어휘로 만든 문단 (문단 일부는 탭 포함)"""
+    return [
+        "\t".join(" ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 15))) for _ in range(rng.randint(1, 2)))
+        for _ in range(count)
+    ]
+
+
+def generate_documents(directory: Path, count: int, paragraphs: int, seed: int) -> List[Path]:
+    rng = random.Random(seed)
+    paths = []
+    for index in range(count):
+        lines = synthetic_paragraphs(rng, paragraphs)
+        if index % 2:
+            path = directory / f"synthetic_{index:04d}.hwpx"
+            path.write_bytes(synthetic_hwpx_bytes(lines))
+        else:
+            path = directory / f"synthetic_{index:04d}.hwp"
+            path.write_bytes(synthetic_hwp_bytes(lines))
+        paths.append(path)
+    return paths
+
+
+# ---------------------------------------------------------------------------
+# 측정
+# ---------------------------------------------------------------------------
+
+def collect_files(targets: List[str]) -> List[Path]:
+    files = []
+    for target in targets:
+        path = Path(target)
+        if path.is_dir():
+            for candidate in sorted(path.rglob("*")):
+                if candidate.is_file() and (candidate.suffix.lower() in EXTRACTABLE_EXTENSIONS
+                                            or (not candidate.suffix and detect_format(str(candidate)))):
+                    files.append(candidate)
+        elif path.is_file():
+            files.append(path)
+    return files
+
+
+def run_benchmark(files: List[Path], workers: int) -> dict:
+    total_bytes = sum(os.path.getsize(path) for path in files)
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(extract_text, [str(path) for path in files], chunksize=4))
+    elapsed = time.perf_counter() - started
+    return {
+        "workers": workers,
+        "files": len(files),
+        "failed": sum(1 for result in results if result["error"]),
+        "chars": sum(len(result["text"]) for result in results),
+        "seconds": elapsed,
+        "files_per_second": len(files) / elapsed if elapsed else 0.0,
+        "mb_per_second": total_bytes / 1024 / 1024 / elapsed if elapsed else 0.0,
+        "total_mb": total_bytes / 1024 / 1024
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HWP/HWPX 텍스트 추출 처리량 측정")
+    parser.add_argument("paths", nargs="*", help="측정할 파일 또는 디렉토리")
+    parser.add_argument("--generate", type=int, default=0, help="합성 문서 수 (HWP/HWPX 반반)")
+    parser.add_argument("--paragraphs", type=int, default=500, help="합성 문서당 문단 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, nargs="+", default=[os.cpu_count() or 1])
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        files = collect_files(args.paths)
+        if args.generate:
+            files += generate_documents(Path(temp_dir), args.generate, args.paragraphs, args.seed)
+        if not files:
+            parser.error("측정할 파일이 없습니다 (경로를 지정하거나 --generate 사용)")
+
+        print(f"{len(files)}개 파일, {sum(os.path.getsize(p) for p in files) / 1024 / 1024:.1f} MB")
+        print(f"{'workers':>8} {'files/s':>10} {'MB/s':>8} {'seconds':>8} {'failed':>7} {'chars':>12}")
+        for workers in args.workers:
+            result = run_benchmark(files, workers)
+            print(f"{result['workers']:>8} {result['files_per_second']:>10.1f} {result['mb_per_second']:>8.2f}"
+                  f" {result['seconds']:>8.2f} {result['failed']:>7} {result['chars']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+나라장터 API / 첨부파일 로컬 대체 서버 (성능 테스트용)
+
+data.go.kr의 getBidPblancListInfoThng* 와 g2b.go.kr의 downloadFile.do 를 흉내내며
+지연/대역폭/장애를 주입할 수 있음. 응답 데이터는 search_json_API_results.json 을 틀로
+seed 기반으로 결정적으로 생성됨.
+
+사용 예:
+    python tools/g2b_standin.py --port 8090 --total 3000 --latency-ms 200 --error-rate 0.02
+
+    G2B_BASE_URL=http://127.0.0.1:8090/1230000/BidPublicInfoService \\
+    G2B_AD_BASE_URL=http://127.0.0.1:8090/1230000/ad/BidPublicInfoService \\
+    python main.py
+"""
+
+import argparse
+import asyncio
+import copy
+import hashlib
+import json
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+BASE_DIR = Path(__file__).parent.parent
+SAMPLE_FILE = BASE_DIR / "search_json_API_results.json"
+
+# 공고명 생성용 어휘 (키워드 검색/워치리스트 테스트용)
+NAME_WORDS = ["GPU 서버", "스토리지", "네트워크 장비", "보안 솔루션", "클라우드", "데이터베이스",
+              "PC 구매", "유지보수", "소프트웨어 라이선스", "AI 플랫폼", "CCTV", "전산실 UPS"]
+
+# data.go.kr 오류 코드
+RESULT_CODES = {
+    "00": "NORMAL SERVICE.",
+    "22": "LIMITED NUMBER OF SERVICE REQUESTS EXCEEDS ERROR.",
+    "99": "UNKNOWN ERROR."
+}
+
+
+class StandInConfig:
+    """대체 서버 설정 (지연/장애 주입 포함)"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.public_url = args.public_url.rstrip("/")
+        self.total = args.total
+        self.start_date = datetime.strptime(args.start_date, "%Y%m%d")
+        self.days = args.days
+        self.seed = args.seed
+        self.files_per_notice = args.files_per_notice
+        self.file_size_min = args.file_size_min_kb * 1024
+        self.file_size_max = max(args.file_size_max_kb, args.file_size_min_kb) * 1024
+        self.latency = args.latency_ms / 1000
+        self.jitter = args.jitter_ms / 1000
+        self.bandwidth = args.bandwidth_kbps * 1024  # bytes/s, 0 = 무제한
+        self.error_rate = args.error_rate
+        self.quota_error_rate = args.quota_error_rate
+        self.file_error_rate = args.file_error_rate
+        self.documents = args.documents
+
+
+def build_notices(config: StandInConfig) -> List[Dict]:
+    """샘플 응답을 틀로 공고 데이터셋 생성 (공고일시 오름차순)"""
+    with open(SAMPLE_FILE, encoding="utf-8") as f:
+        templates = json.load(f)["response"]["body"]["items"]
+
+    rng = random.Random(config.seed)
+    span_seconds = config.days * 86400
+    notices = []
+    for index in range(config.total):
+        notice = copy.deepcopy(templates[index % len(templates)])
+        bid_no = f"R25BK{index:08d}"
+        notice_dt = config.start_date + timedelta(seconds=span_seconds * index // max(config.total, 1))
+
+        notice["bidNtceNo"] = bid_no
+        notice["bidNtceOrd"] = "000"
+        notice["reNtceYn"] = "N"
+        notice["bidNtceNm"] = f"{rng.choice(NAME_WORDS)} {notice['bidNtceNm'].strip()} ({index})"
+        notice["ntceInsttNm"] = f"{notice['ntceInsttNm']} {index % 37}"
+        notice["bidNtceDt"] = notice_dt.strftime("%Y-%m-%d %H:%M:%S")
+        notice["asignBdgtAmt"] = str(rng.randint(1, 5000) * 100000)
+        notice["bidNtceDtlUrl"] = f"{config.public_url}/notice/{bid_no}"
+
+        for seq in range(1, 11):
+            if seq <= config.files_per_notice:
+                ext = ".hwpx" if seq % 3 == 0 else ".hwp"
+                notice[f"ntceSpecDocUrl{seq}"] = (
+                    f"{config.public_url}/pn/pnp/pnpe/UntyAtchFile/downloadFile.do"
+                    f"?bidPbancNo={bid_no}&bidPbancOrd=000&fileType=&fileSeq={seq}"
+                )
+                notice[f"ntceSpecFileNm{seq}"] = f"{seq}. 첨부문서{ext}"
+            else:
+                notice[f"ntceSpecDocUrl{seq}"] = ""
+                notice[f"ntceSpecFileNm{seq}"] = ""
+        notices.append(notice)
+    return notices
+
+
+def _date_key(value: str) -> str:
+    """YYYYMMDD[HHMM] / 'YYYY-MM-DD HH:MM:SS' 비교용 12자리 키"""
+    digits = "".join(c for c in value if c.isdigit())
+    return digits[:12].ljust(12, "0")
+
+
+def create_app(config: StandInConfig) -> FastAPI:
+    """대체 서버 앱 생성"""
+    app = FastAPI(title="G2B stand-in")
+    notices = build_notices(config)
+    rng = random.Random(config.seed + 1)
+    stats = {"api_calls": 0, "file_calls": 0, "bytes_sent": 0, "injected_errors": 0}
+
+    async def inject_latency():
+        delay = config.latency + rng.uniform(-config.jitter, config.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def api_response(result_code: str, items: Optional[List[Dict]] = None,
+                     page_no: int = 1, num_of_rows: int = 10, total_count: int = 0) -> JSONResponse:
+        content = {"response": {"header": {"resultCode": result_code, "resultMsg": RESULT_CODES[result_code]}}}
+        if result_code == "00":
+            content["response"]["body"] = {
+                "items": items or [],
+                "numOfRows": num_of_rows,
+                "pageNo": page_no,
+                "totalCount": total_count
+            }
+        return JSONResponse(content)
+
+    def filter_notices(query: Dict) -> List[Dict]:
+        bid_no = query.get("bidNtceNo")
+        if bid_no:
+            bid_ord = query.get("bidNtceOrd")
+            return [n for n in notices if n["bidNtceNo"] == bid_no and (not bid_ord or n["bidNtceOrd"] == bid_ord)]
+
+        keyword = (query.get("bidNtceNm") or "").strip()
+        institution = (query.get("ntceInsttNm") or "").strip()
+        begin = _date_key(query["inqryBgnDt"]) if query.get("inqryBgnDt") else None
+        end = query.get("inqryEndDt")
+        if end:
+            # 날짜만 주어지면 해당 일자 끝까지 포함
+            end = _date_key(end) if len(end) > 8 else _date_key(end[:8] + "2359")
+
+        matched = []
+        for notice in notices:
+            notice_key = _date_key(notice["bidNtceDt"])
+            if begin and notice_key < begin:
+                continue
+            if end and notice_key > end:
+                continue
+            if keyword and keyword not in notice["bidNtceNm"]:
+                continue
+            if institution and institution not in notice["ntceInsttNm"]:
+                continue
+            matched.append(notice)
+        return matched
+
+    @app.get("/1230000/BidPublicInfoService/{operation}")
+    @app.get("/1230000/ad/BidPublicInfoService/{operation}")
+    async def bid_list(operation: str, request: Request):
+        """getBidPblancListInfoThng / getBidPblancListInfoThngPPSSrch"""
+        stats["api_calls"] += 1
+        await inject_latency()
+
+        if not operation.startswith("getBidPblancListInfoThng"):
+            return api_response("99")
+        if rng.random() < config.error_rate:
+            stats["injected_errors"] += 1
+            return Response(status_code=500, content="Internal Server Error")
+        if rng.random() < config.quota_error_rate:
+            stats["injected_errors"] += 1
+            return api_response("22")
+
+        query = dict(request.query_params)
+        num_of_rows = max(int(query.get("numOfRows") or 10), 1)
+        page_no = max(int(query.get("pageNo") or 1), 1)
+        matched = filter_notices(query)
+        page_items = matched[(page_no - 1) * num_of_rows: page_no * num_of_rows]
+        return api_response("00", page_items, page_no, num_of_rows, len(matched))
+
+    @app.get("/pn/pnp/pnpe/UntyAtchFile/downloadFile.do")
+    async def download_file(bidPbancNo: str, fileSeq: int, bidPbancOrd: str = "000"):
+        """첨부파일 (공고번호/순번 기준 결정적 크기/내용)"""
+        stats["file_calls"] += 1
+        await inject_latency()
+
+        if rng.random() < config.file_error_rate:
+            stats["injected_errors"] += 1
+            return Response(status_code=500, content="Internal Server Error")
+
+        digest = hashlib.sha256(f"{bidPbancNo}:{bidPbancOrd}:{fileSeq}".encode()).digest()
+        size = config.file_size_min + int.from_bytes(digest[:4], "big") % (config.file_size_max - config.file_size_min + 1)
+        if config.documents:
+            # 텍스트 추출 테스트용 합성 HWP/HWPX (순번 규칙은 build_notices 와 동일)
+            from bench_extract import synthetic_hwp_bytes, synthetic_hwpx_bytes, synthetic_paragraphs
+            doc_rng = random.Random(digest)
+            paragraphs = synthetic_paragraphs(doc_rng, max(size // 200, 1))
+            data = (synthetic_hwpx_bytes if fileSeq % 3 == 0 else synthetic_hwp_bytes)(paragraphs)
+            size = len(data)
+        else:
+            data = (digest * (65536 // len(digest) + 1))[:65536]
+
+        async def body():
+            sent = 0
+            while sent < size:
+                chunk = data[sent:sent + 65536] if config.documents else data[:min(len(data), size - sent)]
+                sent += len(chunk)
+                stats["bytes_sent"] += len(chunk)
+                if config.bandwidth:
+                    await asyncio.sleep(len(chunk) / config.bandwidth)
+                yield chunk
+
+        return StreamingResponse(body(), media_type="application/octet-stream",
+                                 headers={"Content-Length": str(size)})
+
+    @app.get("/standin/stats")
+    async def get_stats():
+        """대체 서버 호출 통계"""
+        return dict(stats, notices=len(notices))
+
+    return app
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="나라장터 API/첨부파일 로컬 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--public-url", default=None, help="응답에 넣을 서버 주소 (기본: http://host:port)")
+    parser.add_argument("--total", type=int, default=3000, help="생성할 공고 수")
+    parser.add_argument("--start-date", default=datetime.now().strftime("%Y%m01"), help="첫 공고일 (YYYYMMDD)")
+    parser.add_argument("--days", type=int, default=30, help="공고일 분포 기간 (일)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--files-per-notice", type=int, default=3)
+    parser.add_argument("--file-size-min-kb", type=int, default=50)
+    parser.add_argument("--file-size-max-kb", type=int, default=2048)
+    parser.add_argument("--latency-ms", type=float, default=100, help="응답 지연")
+    parser.add_argument("--jitter-ms", type=float, default=20, help="응답 지연 편차")
+    parser.add_argument("--bandwidth-kbps", type=int, default=0, help="첨부파일 전송 대역폭 (KB/s, 0=무제한)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="API HTTP 500 비율")
+    parser.add_argument("--quota-error-rate", type=float, default=0.0, help="API resultCode 22(호출 한도 초과) 비율")
+    parser.add_argument("--file-error-rate", type=float, default=0.0, help="첨부파일 HTTP 500 비율")
+    parser.add_argument("--documents", action="store_true",
+                        help="첨부파일을 임의 바이트 대신 합성 HWP/HWPX 문서로 응답 (크기는 근사치)")
+    args = parser.parse_args(argv)
+    if not args.public_url:
+        args.public_url = f"http://{args.host}:{args.port}"
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    uvicorn.run(create_app(StandInConfig(args)), host=args.host, port=args.port, log_level="warning")